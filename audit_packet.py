@@ -0,0 +1,263 @@
+#!/usr/bin/env python3
+"""
+Assemble an audit packet: one PDF with the statements, receipts and minutes for an audit period
+
+The UOSU and AETSA audits want every bank statement covering the period,
+the receipts for its spending and the meeting minutes approving it. The
+packet opens with a rendered cover (period, balances and a table of
+contents) and the bank reconciliation for the period, followed by each
+source PDF in turn, with a bookmark per section and per document.
+
+Source PDFs are copied page object by page object with pypdf - nothing is
+re-rendered or rasterized - and each file is opened only while it is
+appended. The writer still holds every page it has appended until the
+packet is written, so memory grows with the packet, though only by page
+objects, never by rendered pages. Receipt photos and screenshots get a page
+each, drawn through pdf_resources so they are downsampled once. Other files
+(minutes kept as .docx) are listed on the cover so the gap is visible, as
+are files whose names carry no date: they can't be placed in a period, so
+they are left out rather than copied into every packet. Add any that
+belong with --receipts or --minutes.
+
+    python audit_packet.py 2024-05-01 2024-08-31
+    python audit_packet.py 2024-05-01 2024-08-31 --receipts extra.pdf --no-reconciliation
+"""
+
+import argparse
+import contextlib
+import glob
+import io
+import os
+import re
+import tempfile
+from datetime import date, datetime
+from xml.sax.saxutils import escape
+
+from bank_statements import format_cents, load_statements
+
+ROOT = os.path.dirname(os.path.abspath(__file__))
+FINANCES_DIR = os.path.join(ROOT, "BBS Finances 2024-2025")
+RECEIPTS_DIR = os.path.join(FINANCES_DIR, "5. Receipts and Reimbursements")
+MINUTES_DIR = os.path.join(FINANCES_DIR, "2. Meeting Minutes")
+
+STATEMENTS, RECONCILIATION, RECEIPTS, MINUTES = "Bank statements", "Reconciliation", "Receipts", "Meeting minutes"
+
+_MONTH_RE = re.compile(r"\b(Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)[a-z]*\.?\s+(?:(\d{1,2}),?\s+)?(\d{4})\b")
+# "Canva 10.24.png": month.year
+_MONTH_YEAR_RE = re.compile(r"(?<![\d.])(\d{2})\.(\d{2})(?![\d.]*\d)")
+
+
+def name_date(path):
+    """The first "Sep 2024" / "Jun 22, 2024" / "10.24" in a file's name or folder, as a date (day 1 if none), or None."""
+    for part in (os.path.basename(path), os.path.basename(os.path.dirname(path))):
+        m = _MONTH_RE.search(part)
+        if m:
+            month = datetime.strptime(m.group(1), "%b").month
+            return date(int(m.group(3)), month, int(m.group(2) or 1))
+        m = _MONTH_YEAR_RE.search(part)
+        if m and 1 <= int(m.group(1)) <= 12:
+            return date(2000 + int(m.group(2)), int(m.group(1)), 1)
+    return None
+
+
+def in_period(path, start, end):
+    """Whether a dated file name falls in the period; undated files never do."""
+    day = name_date(path)
+    if day is None:
+        return False
+    # A bare month ("Sep 2024") counts if any of that month is in the period
+    first_of_period = start.replace(day=1)
+    return first_of_period <= day <= end
+
+
+def find_documents(folder, start, end):
+    """(PDFs and images, other files) under ``folder`` dated inside the period, and the undated files.
+
+    Templates are excluded; each list is sorted by path.
+    """
+    from pdf_resources import is_image
+    documents, others, undated = [], [], []
+    for path in sorted(glob.glob(os.path.join(glob.escape(folder), "**", "*"), recursive=True)):
+        name = os.path.basename(path)
+        if os.path.isdir(path) or name.startswith(("~$", ".")) or "template" in name.lower():
+            continue
+        if name_date(path) is None:
+            undated.append(path)
+            continue
+        if not in_period(path, start, end):
+            continue
+        (documents if name.lower().endswith(".pdf") or is_image(path) else others).append(path)
+    return documents, others, undated
+
+
+def period_statements(start, end, statements=None):
+    """Statements whose period overlaps [start, end], oldest first."""
+    statements = statements if statements is not None else load_statements()
+    return [s for s in statements if s["period_start"] < end and s["period_end"] > start]
+
+
+def render_reconciliation(statements, folder):
+    """Render the reconciliation report for just these statements; returns its path."""
+    import generate_reconciliation_pdf
+    path = os.path.join(folder, "reconciliation.pdf")
+    with contextlib.redirect_stdout(io.StringIO()):
+        generate_reconciliation_pdf.build_pdf(path, statements=statements)
+    return path
+
+
+def render_image(path, folder, number):
+    """Put a receipt photo or screenshot on a page of its own; returns the PDF's path."""
+    from reportlab.lib.pagesizes import letter
+    from reportlab.lib.units import inch
+    from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer
+    from pdf_resources import image_flowable
+    from pdf_theme import get_styles
+    output = os.path.join(folder, f"image-{number}.pdf")
+    doc = SimpleDocTemplate(output, pagesize=letter, rightMargin=0.6*inch, leftMargin=0.6*inch, topMargin=0.5*inch, bottomMargin=0.5*inch)
+    caption = Paragraph(escape(os.path.relpath(path, FINANCES_DIR)), get_styles()["small"])
+    doc.build([caption, Spacer(1, 6), image_flowable(path, doc.width, doc.height - 40)])
+    return output
+
+
+def render_cover(start, end, statements, parts, missing, first_pages, undated=()):
+    """The cover and table of contents as PDF bytes; ``first_pages`` gives each part's 1-based start page."""
+    from reportlab.lib.pagesizes import letter
+    from reportlab.lib.units import inch
+    from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer, Table, HRFlowable
+    from pdf_theme import ACCENT, RULE_GREY, comparison_table_style, get_styles
+    buffer = io.BytesIO()
+    doc = SimpleDocTemplate(buffer, pagesize=letter, rightMargin=0.6*inch, leftMargin=0.6*inch, topMargin=0.5*inch, bottomMargin=0.5*inch)
+    styles = get_styles()
+    body_style = styles["body"]
+    small_style = styles["small"]
+
+    elements = []
+    elements.append(Paragraph("BBS AUDIT PACKET", styles["title"]))
+    elements.append(Paragraph(f"{start:%B %d, %Y} to {end:%B %d, %Y} | BIPOC Business Society", styles["subtitle"]))
+    elements.append(Paragraph("Prepared by Nathan Amankwah, Finance Pillar", small_style))
+    elements.append(Spacer(1, 4))
+    elements.append(HRFlowable(width="100%", thickness=2, color=ACCENT, spaceAfter=12))
+
+    elements.append(Paragraph("ACCOUNT SUMMARY", styles["heading_compact"]))
+    if statements:
+        credits = sum(sum(s["transactions"]["credit"]) for s in statements)
+        debits = sum(sum(s["transactions"]["debit"]) for s in statements)
+        summary = [
+            ["Statements", "Opening balance", "Deposits & credits", "Cheques & debits", "Closing balance"],
+            [f"{statements[0]['period_start']} to {statements[-1]['period_end']}", format_cents(statements[0]["opening"]),
+             format_cents(credits), format_cents(debits), format_cents(statements[-1]["closing"])],
+        ]
+        elements.append(Table(summary, colWidths=[2.1*inch, 1.3*inch, 1.3*inch, 1.3*inch, 1.3*inch],
+                              style=comparison_table_style(len(summary))))
+    else:
+        elements.append(Paragraph("No bank statement covers this period.", styles["callout"]))
+
+    elements.append(Paragraph("CONTENTS", styles["section_compact"]))
+    contents = [["Section", "Document", "Pages", "Page"]]
+    for (section, title, _, pages), first in zip(parts, first_pages):
+        contents.append([section, Paragraph(escape(title), small_style), str(pages), str(first)])
+    elements.append(Table(contents, colWidths=[1.3*inch, 4.2*inch, 0.8*inch, 1.0*inch],
+                          style=comparison_table_style(len(contents)), repeatRows=1))
+
+    if missing:
+        elements.append(Paragraph("NOT INCLUDED", styles["section_compact"]))
+        elements.append(Paragraph("These files aren't PDFs or images; export them to PDF and rebuild to add them.", body_style))
+        for path in missing:
+            elements.append(Paragraph(f"•  {escape(os.path.relpath(path, FINANCES_DIR))}", body_style))
+
+    if undated:
+        elements.append(Paragraph("UNDATED", styles["section_compact"]))
+        elements.append(Paragraph("These files' names give no month, so they aren't in any period's packet. "
+                                  "Pass the ones that belong here with --receipts or --minutes.", body_style))
+        for path in undated:
+            elements.append(Paragraph(f"•  {escape(os.path.relpath(path, FINANCES_DIR))}", body_style))
+
+    elements.append(Spacer(1, 16))
+    elements.append(HRFlowable(width="100%", thickness=1, color=RULE_GREY, spaceAfter=8))
+    elements.append(Paragraph("<b>Prepared by:</b> Nathan Amankwah, Finance Pillar", body_style))
+    doc.build(elements)
+    return buffer.getvalue()
+
+
+def build_packet(start, end, output_path=None, receipts=None, minutes=None, reconciliation=True):
+    """Write the audit packet for [start, end] and return (output path, page count)."""
+    from pypdf import PdfReader, PdfWriter
+    from pdf_resources import IMAGE_EXTENSIONS
+    output_path = output_path or os.path.join(ROOT, f"BBS-AUDIT-PACKET-{start}-{end}.pdf")
+    statements = period_statements(start, end)
+    missing, undated = [], []
+    if receipts is None:
+        receipts, others, unplaced = find_documents(RECEIPTS_DIR, start, end)
+        missing.extend(others)
+        undated.extend(unplaced)
+    if minutes is None:
+        minutes, others, unplaced = find_documents(MINUTES_DIR, start, end)
+        missing.extend(others)
+        undated.extend(unplaced)
+
+    with tempfile.TemporaryDirectory() as workdir:
+        # (section, title, path, pages); page counts only need the page tree, not the content
+        parts = []
+        if reconciliation and statements:
+            path = render_reconciliation(statements, workdir)
+            parts.append((RECONCILIATION, "Bank reconciliation", path, len(PdfReader(path).pages)))
+        for s in statements:
+            path = s["paths"][0]
+            parts.append((STATEMENTS, f"Statement {s['period_start']} to {s['period_end']}", path, len(PdfReader(path).pages)))
+        for section, paths in ((RECEIPTS, receipts), (MINUTES, minutes)):
+            for path in paths:
+                title, ext = os.path.splitext(os.path.basename(path))
+                if ext.lower() != ".pdf" and ext.lower() not in IMAGE_EXTENSIONS:
+                    # "Canva Invoice 07.24" has no extension to drop
+                    title = os.path.basename(path)
+                if not path.lower().endswith(".pdf"):
+                    path = render_image(path, workdir, len(parts))
+                parts.append((section, title, path, len(PdfReader(path).pages)))
+
+        # The contents table's page numbers depend on how long the cover is
+        cover_pages = 1
+        while True:
+            first_pages = []
+            page = cover_pages + 1
+            for part in parts:
+                first_pages.append(page)
+                page += part[3]
+            cover = render_cover(start, end, statements, parts, missing, first_pages, undated)
+            length = len(PdfReader(io.BytesIO(cover)).pages)
+            if length == cover_pages:
+                break
+            cover_pages = length
+
+        writer = PdfWriter()
+        writer.append(io.BytesIO(cover), import_outline=False)
+        writer.add_outline_item("Cover and contents", 0)
+        sections = {}
+        for (section, title, path, _), first in zip(parts, first_pages):
+            # Bookmarks can only point at pages already in the writer
+            writer.append(path, import_outline=False)
+            if section not in sections:
+                sections[section] = writer.add_outline_item(section, first - 1)
+            writer.add_outline_item(title, first - 1, parent=sections[section])
+        writer.page_mode = "/UseOutlines"
+        with open(output_path, "wb") as fh:
+            writer.write(fh)
+    return output_path, len(writer.pages)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("start", type=date.fromisoformat, help="first day of the audit period (YYYY-MM-DD)")
+    parser.add_argument("end", type=date.fromisoformat, help="last day of the audit period (YYYY-MM-DD)")
+    parser.add_argument("-o", "--output", help="where to write the packet (default: BBS-AUDIT-PACKET-<start>-<end>.pdf)")
+    parser.add_argument("--receipts", nargs="+", metavar="PDF",
+                        help=f"receipt PDFs to include (default: those dated in the period under {os.path.relpath(RECEIPTS_DIR, ROOT)})")
+    parser.add_argument("--minutes", nargs="+", metavar="PDF",
+                        help=f"minutes PDFs to include (default: those dated in the period under {os.path.relpath(MINUTES_DIR, ROOT)})")
+    parser.add_argument("--no-reconciliation", dest="reconciliation", action="store_false",
+                        help="leave out the bank reconciliation report")
+    args = parser.parse_args()
+    if args.end < args.start:
+        parser.error("the audit period ends before it starts")
+
+    output, pages = build_packet(args.start, args.end, args.output, args.receipts, args.minutes, args.reconciliation)
+    print(f"PDF generated: {output} ({pages} pages)")
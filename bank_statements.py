@@ -0,0 +1,386 @@
+#!/usr/bin/env python3
+"""
+Extract transactions from the RBC chequing statements in "4. Bank Statements"
+
+Every "Chequing Statement-1726 *.pdf" under the statements folder is read
+with pypdf and its Account Activity Details turned into rows of (date,
+description, debit, credit, balance). Amounts are kept as integer cents.
+
+The PDF text does not say which column an amount sat in, so each run of
+transactions is signed by reconciling it against the running balance
+printed after it, and the whole statement is checked against its Account
+Summary totals.
+
+Statements are identified by a sha256 of their bytes, so copies filed in
+more than one period folder are parsed once. Parsed statements are cached in
+.statement-cache.json by that digest (and file digests by mtime and size),
+so a re-run over a growing archive only opens the new PDFs; those are parsed
+in parallel across processes.
+"""
+
+import argparse
+import csv
+import glob
+import hashlib
+import itertools
+import json
+import multiprocessing
+import os
+import re
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from datetime import date, datetime
+
+ROOT = os.path.dirname(os.path.abspath(__file__))
+STATEMENTS_DIR = os.path.join(ROOT, "BBS Finances 2024-2025", "4. Bank Statements")
+CACHE_PATH = os.path.join(ROOT, ".statement-cache.json")
+STATEMENT_GLOB = "Chequing Statement-*.pdf"
+
+# Bumped whenever parsing changes, so stale cache entries are re-parsed
+PARSER_VERSION = 1
+
+COLUMNS = ("date", "description", "debit", "credit", "balance", "statement")
+
+# Descriptions that are money coming in; used only to break ties when more
+# than one debit/credit assignment reproduces the printed balance
+CREDIT_HINTS = ("deposit", "payable pmt", "received", "refund", "credit", "reversal")
+
+# Most transactions that can share one printed balance before signing gives up
+MAX_GROUP = 16
+
+_AMOUNT = r"(\d{1,3}(?:,\d{3})*\.\d{2})"
+_PERIOD_RE = re.compile(r"([A-Z][a-z]+ \d{1,2}, \d{4}) to ([A-Z][a-z]+ \d{1,2}, \d{4})")
+_ACCOUNT_RE = re.compile(r"Account number:\s*([\d -]+\d)")
+_OPENING_RE = re.compile(r"^Opening balance\s+" + _AMOUNT + r"$")
+_CLOSING_RE = re.compile(r"^Closing balance\s+" + _AMOUNT + r"$")
+_TOTAL_CREDITS_RE = re.compile(r"Total deposits & credits \((\d+)\) \+ " + _AMOUNT)
+_TOTAL_DEBITS_RE = re.compile(r"Total cheques & debits \((\d+)\) - " + _AMOUNT)
+# "03 Sep Monthly fee 6.00 1,220.15"; the date is sometimes printed twice ("01 Oct01 Oct ...")
+_TRANSACTION_RE = re.compile(
+    r"^(?:(\d{2} [A-Z][a-z]{2})(?:\d{2} [A-Z][a-z]{2})?\s+)?(.+?)\s+" + _AMOUNT + r"(?:\s+" + _AMOUNT + r")?$"
+)
+
+
+class StatementError(ValueError):
+    """Raised when a statement's text cannot be turned into balanced transactions."""
+
+
+def cents(text):
+    return int(text.replace(",", "").replace(".", ""))
+
+
+def format_cents(value):
+    sign = "-" if value < 0 else ""
+    return f"{sign}${abs(value) // 100:,}.{abs(value) % 100:02d}"
+
+
+class TransactionTable:
+    """Transactions stored column by column (one list per COLUMNS entry)."""
+
+    __slots__ = COLUMNS
+
+    def __init__(self):
+        for column in COLUMNS:
+            setattr(self, column, [])
+
+    def __len__(self):
+        return len(self.date)
+
+    def extend(self, columns):
+        for column in COLUMNS:
+            getattr(self, column).extend(columns[column])
+
+    def rows(self):
+        """Iterate the table as tuples in COLUMNS order."""
+        return zip(*(getattr(self, column) for column in COLUMNS))
+
+    def write_csv(self, fh):
+        writer = csv.writer(fh)
+        writer.writerow(COLUMNS)
+        for day, description, debit, credit, balance, statement in self.rows():
+            writer.writerow([day.isoformat(), description, f"{debit / 100:.2f}" if debit else "",
+                             f"{credit / 100:.2f}" if credit else "", f"{balance / 100:.2f}", statement])
+
+
+def _statement_date(day_month, start, end):
+    """Resolve "03 Sep" to a date inside the statement period (which may span New Year)."""
+    for year in (end.year, start.year):
+        day = datetime.strptime(f"{day_month} {year}", "%d %b %Y").date()
+        if start <= day <= end:
+            return day
+    return datetime.strptime(f"{day_month} {end.year}", "%d %b %Y").date()
+
+
+def _is_credit_hint(description):
+    description = description.lower()
+    return any(hint in description for hint in CREDIT_HINTS)
+
+
+def _sign_group(group, before, after, where):
+    """Choose debit/credit for each amount in ``group`` so that ``before`` moves to ``after``.
+
+    Returns a list of booleans (True = credit). When several assignments
+    balance, the one agreeing with the most CREDIT_HINTS wins.
+    """
+    if len(group) > MAX_GROUP:
+        raise StatementError(f"{where}: {len(group)} transactions share one balance line")
+    hints = [_is_credit_hint(description) for _, description, _ in group]
+    amounts = [amount for _, _, amount in group]
+    best = None
+    for signs in itertools.product((False, True), repeat=len(group)):
+        if before + sum(a if credit else -a for a, credit in zip(amounts, signs)) != after:
+            continue
+        score = sum(s == h for s, h in zip(signs, hints))
+        if best is None or score > best[0]:
+            best = (score, signs)
+    if best is None:
+        raise StatementError(f"{where}: no debit/credit split of {group} reaches balance {after / 100:.2f}")
+    return best[1]
+
+
+def parse_statement_text(text, where="statement"):
+    """Turn the extracted text of one statement into its summary and transaction columns."""
+    m = _PERIOD_RE.search(text)
+    if not m:
+        raise StatementError(f"{where}: no statement period found")
+    start, end = (datetime.strptime(s, "%B %d, %Y").date() for s in m.groups())
+    account = _ACCOUNT_RE.search(text)
+
+    columns = {column: [] for column in COLUMNS if column != "statement"}
+    opening = closing = balance = None
+    group = []
+    day = None
+    in_activity = False
+
+    def settle(after):
+        nonlocal balance
+        if not group:
+            return
+        signs = _sign_group(group, balance, after, where)
+        for (when, description, amount), credit in zip(group, signs):
+            balance += amount if credit else -amount
+            columns["date"].append(when)
+            columns["description"].append(description)
+            columns["debit"].append(0 if credit else amount)
+            columns["credit"].append(amount if credit else 0)
+            columns["balance"].append(balance)
+        group.clear()
+
+    for line in text.splitlines():
+        line = line.strip()
+        if line.startswith("Date Description"):
+            in_activity = True
+            continue
+        if not in_activity:
+            continue
+        m = _OPENING_RE.match(line)
+        if m:
+            opening = balance = cents(m.group(1))
+            continue
+        m = _CLOSING_RE.match(line)
+        if m:
+            closing = cents(m.group(1))
+            settle(closing)
+            break
+        m = _TRANSACTION_RE.match(line)
+        if not m or balance is None:
+            # Page furniture between the activity table's pages
+            continue
+        if m.group(1):
+            day = _statement_date(m.group(1), start, end)
+        if day is None:
+            raise StatementError(f"{where}: transaction before any date: {line!r}")
+        group.append((day, m.group(2), cents(m.group(3))))
+        if m.group(4):
+            settle(cents(m.group(4)))
+
+    if opening is None or closing is None:
+        raise StatementError(f"{where}: no opening/closing balance in the activity details")
+    if group or balance != closing:
+        raise StatementError(f"{where}: transactions do not reach the closing balance")
+
+    for regex, column in ((_TOTAL_CREDITS_RE, "credit"), (_TOTAL_DEBITS_RE, "debit")):
+        m = regex.search(text)
+        if m and cents(m.group(2)) != sum(columns[column]):
+            raise StatementError(f"{where}: {column}s add up to {sum(columns[column]) / 100:.2f}, "
+                                 f"summary says {m.group(2)}")
+
+    return {
+        "account": account.group(1) if account else None,
+        "period_start": start,
+        "period_end": end,
+        "opening": opening,
+        "closing": closing,
+        "transactions": columns,
+    }
+
+
+def parse_statement(path):
+    """Parse one statement PDF (the per-process worker)."""
+    try:
+        from pypdf import PdfReader
+    except ImportError:
+        raise StatementError(f"{path}: reading statements needs pypdf (pip install pypdf)")
+    reader = PdfReader(path)
+    text = "\n".join(page.extract_text() or "" for page in reader.pages)
+    return parse_statement_text(text, os.path.basename(path))
+
+
+def _to_json(statement):
+    out = dict(statement, period_start=statement["period_start"].isoformat(),
+               period_end=statement["period_end"].isoformat())
+    out["transactions"] = dict(statement["transactions"],
+                               date=[d.isoformat() for d in statement["transactions"]["date"]])
+    return out
+
+
+def _from_json(data):
+    out = dict(data, period_start=date.fromisoformat(data["period_start"]),
+               period_end=date.fromisoformat(data["period_end"]))
+    out["transactions"] = dict(data["transactions"],
+                               date=[date.fromisoformat(d) for d in data["transactions"]["date"]])
+    return out
+
+
+class StatementCache:
+    """Parsed statements by content digest, plus file digests memoised by (mtime, size)."""
+
+    def __init__(self, path=CACHE_PATH):
+        self.path = path
+        try:
+            with open(path, encoding="utf-8") as fh:
+                data = json.load(fh)
+        except (OSError, ValueError):
+            data = {}
+        if data.get("version") != PARSER_VERSION:
+            data = {}
+        self.files = data.get("files", {})
+        self.statements = data.get("statements", {})
+        self._dirty = False
+
+    def file_digest(self, path):
+        st = os.stat(path)
+        stamp = [st.st_mtime_ns, st.st_size]
+        key = os.path.abspath(path)
+        cached = self.files.get(key)
+        if cached and cached[:2] == stamp:
+            return cached[2]
+        h = hashlib.sha256()
+        with open(path, "rb") as fh:
+            for chunk in iter(lambda: fh.read(1 << 20), b""):
+                h.update(chunk)
+        digest = h.hexdigest()
+        self.files[key] = stamp + [digest]
+        self._dirty = True
+        return digest
+
+    def get(self, digest):
+        data = self.statements.get(digest)
+        return _from_json(data) if data else None
+
+    def put(self, digest, statement):
+        self.statements[digest] = _to_json(statement)
+        self._dirty = True
+
+    def save(self):
+        if not self._dirty:
+            return
+        tmp = self.path + ".tmp"
+        with open(tmp, "w", encoding="utf-8") as fh:
+            json.dump({"version": PARSER_VERSION, "files": self.files, "statements": self.statements}, fh)
+        os.replace(tmp, self.path)
+        self._dirty = False
+
+
+def find_statements(paths=None):
+    """Statement PDFs under the given files/folders (default: STATEMENTS_DIR), sorted by path."""
+    found = []
+    for path in paths or [STATEMENTS_DIR]:
+        if os.path.isdir(path):
+            found.extend(glob.glob(os.path.join(glob.escape(path), "**", STATEMENT_GLOB), recursive=True))
+        else:
+            found.append(path)
+    return sorted(set(found))
+
+
+def load_statements(paths=None, jobs=None, cache=True):
+    """Parse every statement once and return them oldest first.
+
+    Each statement dict carries ``sha256`` and the ``paths`` it was found at
+    in addition to the parse_statement_text() fields.
+    """
+    store = StatementCache() if cache else None
+    by_digest = {}
+    for path in find_statements(paths):
+        if store:
+            digest = store.file_digest(path)
+        else:
+            with open(path, "rb") as fh:
+                digest = hashlib.sha256(fh.read()).hexdigest()
+        by_digest.setdefault(digest, []).append(path)
+
+    parsed = {}
+    todo = []
+    for digest, found_at in by_digest.items():
+        statement = store.get(digest) if store else None
+        if statement is None:
+            todo.append(digest)
+        else:
+            parsed[digest] = statement
+
+    if todo:
+        jobs = min(jobs or os.cpu_count() or 1, len(todo))
+        sources = [by_digest[digest][0] for digest in todo]
+        if jobs <= 1:
+            results = map(parse_statement, sources)
+        else:
+            methods = multiprocessing.get_all_start_methods()
+            ctx = multiprocessing.get_context("fork" if "fork" in methods else None)
+            with ProcessPoolExecutor(max_workers=jobs, mp_context=ctx) as pool:
+                results = list(pool.map(parse_statement, sources))
+        for digest, statement in zip(todo, results):
+            parsed[digest] = statement
+            if store:
+                store.put(digest, statement)
+    if store:
+        store.save()
+
+    statements = []
+    for digest, statement in parsed.items():
+        statements.append(dict(statement, sha256=digest, paths=by_digest[digest]))
+    statements.sort(key=lambda s: (s["period_start"], s["period_end"]))
+    return statements
+
+
+def transaction_table(statements):
+    """Concatenate the statements' transactions into one TransactionTable, oldest first."""
+    table = TransactionTable()
+    for statement in statements:
+        columns = statement["transactions"]
+        label = statement["period_end"].isoformat()
+        table.extend(dict(columns, statement=[label] * len(columns["date"])))
+    return table
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("paths", nargs="*", metavar="PATH",
+                        help="statement PDFs or folders to search (default: the 4. Bank Statements folder)")
+    parser.add_argument("-j", "--jobs", type=int, help="worker processes (default: one per CPU)")
+    parser.add_argument("--csv", metavar="PATH", help="write every transaction to this CSV file ('-' for stdout)")
+    parser.add_argument("--no-cache", action="store_true", help="parse every statement even if cached")
+    args = parser.parse_args()
+
+    statements = load_statements(args.paths, args.jobs, cache=not args.no_cache)
+    table = transaction_table(statements)
+    if args.csv == "-":
+        table.write_csv(sys.stdout)
+    else:
+        if args.csv:
+            with open(args.csv, "w", encoding="utf-8", newline="") as fh:
+                table.write_csv(fh)
+        for s in statements:
+            copies = f"  ({len(s['paths'])} copies)" if len(s["paths"]) > 1 else ""
+            print(f"{s['period_start']} to {s['period_end']}  {len(s['transactions']['date']):>3} transactions  "
+                  f"{format_cents(s['opening']):>10} -> {format_cents(s['closing']):>10}{copies}")
+        print(f"{len(statements)} statements, {len(table)} transactions")
@@ -0,0 +1,60 @@
+#!/usr/bin/env python3
+"""
+bbs-docs: one command for every BBS document and tool
+
+    python bbs_docs.py build                      # the sponsor PDFs whose inputs changed
+    python bbs_docs.py lola --lola-sponsors tracker.csv
+    python bbs_docs.py calendar --ics deadlines.ics
+    python bbs_docs.py reconciliation --help
+
+Each subcommand runs the script of the same job with the same options; the
+scripts still work on their own. Only the chosen script is imported, and the
+generators import reportlab inside build_pdf(), so listing the commands, a
+subcommand's --help and a build with nothing to do never load the PDF stack.
+benchmarks/bench_generators.py times these startup paths against a budget.
+"""
+
+import argparse
+import runpy
+import sys
+
+# Subcommand -> (script module, summary)
+COMMANDS = {
+    "build": ("build_all", "build every sponsor PDF whose inputs changed, in parallel"),
+    "lola": ("generate_lola_pdf", "Lola's sponsorship research task sheet"),
+    "working-links": ("generate_working_links_pdf", "the verified working sponsorship links"),
+    "banking": ("generate_banking_pdf", "the banking options comparison"),
+    "reconciliation": ("generate_reconciliation_pdf", "the bank reconciliation report"),
+    "budget": ("generate_budget_pdf", "the budget vs actual report"),
+    "calendar": ("generate_calendar_pdf", "the application deadline calendar"),
+    "mail-merge": ("mail_merge", "one research task sheet per volunteer"),
+    "serve": ("render_server", "keep the generators warm behind a local render service"),
+    "audit-packet": ("audit_packet", "statements, receipts and minutes for an audit period, as one PDF"),
+    "deadlines": ("deadlines", "upcoming sponsor deadlines, or an iCalendar export"),
+    "catalog": ("sponsor_catalog", "the sponsors merged across datasets, and their conflicts"),
+    "strategy": ("sponsor_strategy", "the sponsor list compiled from the strategy doc"),
+    "check-links": ("link_checker", "check every sponsor URL and record which work"),
+    "statements": ("bank_statements", "transactions extracted from the bank statements"),
+    "reconcile": ("reconcile", "statements matched against the logbooks, as text"),
+    "budgets": ("budgets", "planned and actual budget lines from the funding workbooks"),
+    "index": ("finance_index", "full-text search over the finance archive"),
+}
+
+
+if __name__ == "__main__":
+    width = max(map(len, COMMANDS))
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="commands:\n" + "\n".join(f"  {name:<{width}}  {summary}" for name, (_, summary) in COMMANDS.items()),
+    )
+    parser.add_argument("command", choices=COMMANDS, metavar="COMMAND", help="what to run (listed below)")
+    parser.add_argument("args", nargs=argparse.REMAINDER, help="the command's own options; see COMMAND --help")
+    if len(sys.argv) == 1:
+        parser.print_help()
+        sys.exit(2)
+    args = parser.parse_args()
+
+    # Run the script as if it had been started directly. alter_sys also makes
+    # it __main__ for the duration, which the pools' pickled tasks rely on.
+    sys.argv = [sys.argv[0]] + args.args
+    runpy.run_module(COMMANDS[args.command][0], run_name="__main__", alter_sys=True)
@@ -0,0 +1,293 @@
+#!/usr/bin/env python3
+"""
+Throughput and memory benchmark for every PDF generator
+
+Each generator's datasets are synthesized at 10, 100, 1k and 10k records by
+cycling the checked-in records, and build_pdf() is run once per size in a
+fresh interpreter so peak RSS belongs to that build alone. Wall time, pages
+per second, peak RSS and output size are printed and written as JSON; pass
+an earlier results file with --compare to flag regressions.
+
+Startup is measured first: bbs_docs.py's --help, a few subcommands' --help
+and a build with nothing to do, each timed over several runs and imported
+once under -X importtime. None of them may take longer than STARTUP_BUDGET
+or import the PDF stack, and --compare flags any that import more modules
+than before.
+
+    python benchmarks/bench_generators.py --output bench.json
+    python benchmarks/bench_generators.py --sizes 10,100 --compare bench.json
+    python benchmarks/bench_generators.py --startup-only
+"""
+
+import argparse
+import contextlib
+import json
+import os
+import platform
+import re
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime, timezone
+from importlib import metadata
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from build_all import DOCUMENTS
+from dataset_loader import load_dataset
+
+DEFAULT_SIZES = (10, 100, 1000, 10000)
+
+# Datasets a generator renders but only consults for lookups; left at their real size
+LOOKUP_DATASETS = {
+    "lola": ("working_links", "broken_links", "timed_out_links"),
+    "working-links": ("lola_sponsors",),
+}
+
+# Documents whose build_pdf() takes its datasets as arguments, so they can be scaled up
+SCALED = ("lola", "banking", "working-links")
+
+# Fields renumbered so synthetic records stay distinct
+SEQUENCE_FIELDS = ("num", "rank")
+
+_PAGE_RE = re.compile(rb"/Type\s*/Page(?![a-zA-Z])")
+
+# Seconds each startup path may take, best of STARTUP_RUNS
+STARTUP_BUDGET = 0.25
+STARTUP_RUNS = 5
+
+# Modules that mean a startup path loaded the PDF stack
+PDF_STACK = ("reportlab.platypus", "reportlab.pdfgen")
+
+# "import time: self [us] | cumulative | imported package", nesting shown by indentation
+_IMPORT_RE = re.compile(r"^import time:\s*(\d+) \|\s*(\d+) \| ( *)(\S+)$", re.MULTILINE)
+
+
+def synth_dataset(name, n):
+    base = load_dataset(name)
+    records = []
+    for i in range(n):
+        record = dict(base[i % len(base)])
+        for field in SEQUENCE_FIELDS:
+            if field in record:
+                record[field] = type(record[field])(i + 1)
+        records.append(record)
+    return records
+
+
+def synth_inputs(document, n):
+    """Keyword arguments for a document's build_pdf() with every rendered dataset at n records."""
+    _, _, datasets, _ = DOCUMENTS[document]
+    lookups = LOOKUP_DATASETS.get(document, ())
+    kwargs = {name: synth_dataset(name, n) for name in datasets if name not in lookups}
+    if document == "working-links":
+        # Render the datasets as given rather than re-sorting them by a local .link-status.json
+        kwargs["link_status"] = {}
+    return kwargs
+
+
+def _peak_rss_kb():
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports kilobytes, macOS bytes
+    return peak // 1024 if sys.platform == "darwin" else peak
+
+
+def run_one(document, n, output):
+    """Worker side: build one document and return its timing and memory figures."""
+    import importlib
+    module = importlib.import_module(DOCUMENTS[document][0])
+    kwargs = synth_inputs(document, n)
+    rss_before = _peak_rss_kb()
+    start = time.perf_counter()
+    # The generators announce the file they wrote; keep stdout for the JSON result
+    with contextlib.redirect_stdout(sys.stderr):
+        module.build_pdf(output, **kwargs)
+    seconds = time.perf_counter() - start
+    return {"seconds": seconds, "peak_rss_kb": _peak_rss_kb(), "rss_before_kb": rss_before}
+
+
+def count_pages(path):
+    with open(path, "rb") as fh:
+        return len(_PAGE_RE.findall(fh.read()))
+
+
+def bench(document, n, workdir):
+    output = os.path.join(workdir, f"{document}-{n}.pdf")
+    proc = subprocess.run(
+        [sys.executable, os.path.abspath(__file__), "--worker", document, str(n), output],
+        capture_output=True, text=True, cwd=ROOT,
+    )
+    if proc.returncode != 0:
+        raise RuntimeError(f"{document} at {n} records failed:\n{proc.stderr}")
+    timing = json.loads(proc.stdout)
+    pages = count_pages(output)
+    result = {
+        "document": document,
+        "records": n,
+        "seconds": timing["seconds"],
+        "pages": pages,
+        "pages_per_second": pages / timing["seconds"] if timing["seconds"] else None,
+        "peak_rss_kb": timing["peak_rss_kb"],
+        "rss_before_kb": timing["rss_before_kb"],
+        "output_bytes": os.path.getsize(output),
+    }
+    os.remove(output)
+    return result
+
+
+def startup_commands(workdir):
+    """Label -> bbs_docs.py arguments for the paths that should start without reportlab."""
+    return {
+        "--help": ["--help"],
+        "lola --help": ["lola", "--help"],
+        "working-links --help": ["working-links", "--help"],
+        "calendar --help": ["calendar", "--help"],
+        "build, nothing to do": ["build", "--output-dir", os.path.join(workdir, "build")],
+    }
+
+
+def bench_startup(label, args):
+    command = [os.path.join(ROOT, "bbs_docs.py")] + args
+    walls = []
+    for _ in range(STARTUP_RUNS):
+        start = time.perf_counter()
+        proc = subprocess.run([sys.executable] + command, capture_output=True, text=True, cwd=ROOT)
+        walls.append(time.perf_counter() - start)
+        if proc.returncode != 0:
+            raise RuntimeError(f"bbs_docs.py {' '.join(args)} failed:\n{proc.stderr}")
+    proc = subprocess.run([sys.executable, "-X", "importtime"] + command, capture_output=True, text=True, cwd=ROOT)
+    imports = _IMPORT_RE.findall(proc.stderr)
+    return {
+        "command": label,
+        "seconds": min(walls),
+        "import_us": sum(int(cumulative) for _, cumulative, indent, _ in imports if not indent),
+        "modules": len(imports),
+        "pdf_stack": any(name.startswith(PDF_STACK) for _, _, _, name in imports),
+    }
+
+
+def environment():
+    try:
+        reportlab = metadata.version("reportlab")
+    except metadata.PackageNotFoundError:
+        reportlab = "unknown"
+    return {
+        "created": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "reportlab": reportlab,
+        "platform": platform.platform(),
+        "cpus": os.cpu_count(),
+    }
+
+
+def print_header():
+    print(f"{'document':<14} {'records':>7} {'seconds':>9} {'pages':>6} {'pages/s':>8} {'peak RSS MB':>11} {'size KB':>9}")
+
+
+def print_row(r):
+    print(f"{r['document']:<14} {r['records']:>7} {r['seconds']:>9.3f} {r['pages']:>6} "
+          f"{r['pages_per_second'] or 0:>8.1f} {r['peak_rss_kb'] / 1024:>11.1f} {r['output_bytes'] / 1024:>9.1f}",
+          flush=True)
+
+
+def print_startup_header():
+    print(f"{'startup':<22} {'seconds':>9} {'imports ms':>10} {'modules':>8}  budget {STARTUP_BUDGET:.2f}s")
+
+
+def print_startup_row(r):
+    notes = [note for note, over in (("over budget", r["seconds"] > STARTUP_BUDGET), ("loads reportlab", r["pdf_stack"])) if over]
+    print(f"{r['command']:<22} {r['seconds']:>9.3f} {r['import_us'] / 1000:>10.1f} {r['modules']:>8}  "
+          + (" ! " + ", ".join(notes) if notes else "ok"), flush=True)
+
+
+def over_budget(startup):
+    """The startup paths that took longer than STARTUP_BUDGET or imported the PDF stack."""
+    return [r["command"] for r in startup if r["seconds"] > STARTUP_BUDGET or r["pdf_stack"]]
+
+
+def compare(results, baseline, threshold, startup=()):
+    """Print changes against an earlier run; return the cases slower or larger by more than threshold."""
+    previous = {(r["document"], r["records"]): r for r in baseline["results"]}
+    regressions = []
+    print(f"\nAgainst {baseline['environment'].get('created', 'baseline')} (regression threshold {threshold:.0%}):")
+    for r in results:
+        old = previous.get((r["document"], r["records"]))
+        if old is None:
+            continue
+        changes = []
+        for field in ("seconds", "peak_rss_kb", "output_bytes"):
+            ratio = r[field] / old[field] - 1 if old[field] else 0.0
+            flag = " !" if ratio > threshold else ""
+            changes.append(f"{field} {ratio:+.1%}{flag}")
+            if flag:
+                regressions.append((r["document"], r["records"], field, ratio))
+        print(f"  {r['document']:<14} {r['records']:>7}  " + "  ".join(changes))
+    previous = {r["command"]: r for r in baseline.get("startup", [])}
+    for r in startup:
+        old = previous.get(r["command"])
+        if old is None:
+            continue
+        # A few tens of milliseconds are too noisy to hold to the threshold; the
+        # budget bounds the time, and the modules imported are compared here
+        ratio = r["modules"] / old["modules"] - 1 if old["modules"] else 0.0
+        flag = " !" if ratio > threshold else ""
+        if flag:
+            regressions.append(("startup", r["command"], "modules", ratio))
+        print(f"  startup {r['command']:<22}  seconds {r['seconds'] - old['seconds']:+.3f}s  modules {ratio:+.1%}{flag}")
+    return regressions
+
+
+if __name__ == "__main__":
+    if len(sys.argv) == 5 and sys.argv[1] == "--worker":
+        json.dump(run_one(sys.argv[2], int(sys.argv[3]), sys.argv[4]), sys.stdout)
+        sys.exit(0)
+
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("documents", nargs="*", metavar="DOCUMENT",
+                        help=f"documents to benchmark (default: {', '.join(SCALED)})")
+    parser.add_argument("--sizes", default=",".join(map(str, DEFAULT_SIZES)),
+                        help="comma-separated record counts (default: %(default)s)")
+    parser.add_argument("-o", "--output", help="write the results to this JSON file")
+    parser.add_argument("--compare", metavar="JSON", help="earlier results file to compare against")
+    parser.add_argument("--threshold", type=float, default=0.10,
+                        help="fractional increase counted as a regression (default: %(default)s)")
+    parser.add_argument("--startup-only", action="store_true", help="measure startup only, not the documents")
+    args = parser.parse_args()
+    unknown = [name for name in args.documents if name not in DOCUMENTS]
+    if unknown:
+        parser.error(f"unknown document(s): {', '.join(unknown)}")
+    sizes = [int(x) for x in args.sizes.split(",")]
+
+    startup = []
+    results = []
+    with tempfile.TemporaryDirectory() as workdir:
+        # The first build renders everything; the runs timed after it find nothing to do
+        subprocess.run([sys.executable, os.path.join(ROOT, "bbs_docs.py"), "build", "--output-dir",
+                        os.path.join(workdir, "build")], capture_output=True, cwd=ROOT, check=True)
+        print_startup_header()
+        for label, command in startup_commands(workdir).items():
+            startup.append(bench_startup(label, command))
+            print_startup_row(startup[-1])
+        if not args.startup_only:
+            print()
+            print_header()
+            for document in args.documents or SCALED:
+                for n in sizes:
+                    results.append(bench(document, n, workdir))
+                    print_row(results[-1])
+    report = {"environment": environment(), "startup": startup, "results": results}
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as fh:
+            json.dump(report, fh, indent=2)
+            fh.write("\n")
+
+    regressions = over_budget(startup)
+    if args.compare:
+        with open(args.compare, encoding="utf-8") as fh:
+            regressions += compare(results, json.load(fh), args.threshold, startup)
+    if regressions:
+        sys.exit(1)
@@ -0,0 +1,143 @@
+#!/usr/bin/env python3
+"""
+Per-record cost of the sponsor block layout, before and after sharing table styles and checklist cells
+
+"before" rebuilds every ParagraphStyle, TableStyle and checklist Paragraph for
+each record, as the generators originally did; "after" is
+sponsor_blocks.sponsor_block. Both are timed building the flowables alone and
+building plus laying out a full document (written to memory). The paragraph
+cache's hit rates over all the "after" runs are printed at the end.
+
+    python benchmarks/bench_sponsor_blocks.py --sizes 1000,10000
+"""
+
+import argparse
+import io
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from reportlab.lib.colors import HexColor
+from reportlab.lib.enums import TA_RIGHT
+from reportlab.lib.pagesizes import letter
+from reportlab.lib.styles import ParagraphStyle
+from reportlab.lib.units import inch
+from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer, Table, TableStyle, HRFlowable
+
+import paragraph_cache
+from dataset_loader import load_dataset
+from pdf_theme import GREEN, ORANGE, RED, get_styles
+from sponsor_blocks import TASK_CHECKLIST, sponsor_block
+
+
+def synth_records(n):
+    base = load_dataset("lola_sponsors")
+    return [dict(base[i % len(base)], num=i + 1) for i in range(n)]
+
+
+def legacy_block(s, styles):
+    """The original per-sponsor loop body from generate_lola_pdf.py."""
+    bold_style, small_style, link_style = styles["bold"], styles["small"], styles["link"]
+    priority = s["priority"]
+    if "URGENT" in priority:
+        pri_color = RED
+    elif priority == "HIGH":
+        pri_color = ORANGE
+    else:
+        pri_color = GREEN
+    block = []
+    header_table = Table([[
+        Paragraph(f"<b>#{s['num']}</b>  <b>{s['name']}</b>", ParagraphStyle('SponsorName', parent=bold_style, fontSize=10, leading=13)),
+        Paragraph(f"<b>{priority}</b>", ParagraphStyle('Priority', parent=small_style, fontSize=8, textColor=pri_color, alignment=TA_RIGHT)),
+    ]], colWidths=[5.2*inch, 1.8*inch])
+    header_table.setStyle(TableStyle([
+        ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
+        ('TOPPADDING', (0, 0), (-1, -1), 2),
+        ('BOTTOMPADDING', (0, 0), (-1, -1), 2),
+    ]))
+    block.append(header_table)
+    block.append(Paragraph(f'<link href="{s["url"]}">{s["url"]}</link>', link_style))
+    detail_table = Table([[
+        Paragraph(f"<b>Ask:</b> {s['amount']}", small_style),
+        Paragraph(f"<b>Likelihood:</b> {s['likelihood']}", small_style),
+    ]], colWidths=[3.5*inch, 3.5*inch])
+    detail_table.setStyle(TableStyle([
+        ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
+        ('TOPPADDING', (0, 0), (-1, -1), 1),
+        ('BOTTOMPADDING', (0, 0), (-1, -1), 1),
+    ]))
+    block.append(detail_table)
+    block.append(Paragraph(f"<b>Notes:</b> {s['notes']}", small_style))
+    block.append(Spacer(1, 3))
+    check_table = Table([[
+        Paragraph("\u2610 Active?", small_style),
+        Paragraph("\u2610 Deadline confirmed?", small_style),
+        Paragraph("\u2610 Max amount?", small_style),
+        Paragraph("\u2610 Docs needed?", small_style),
+    ]], colWidths=[1.75*inch, 1.75*inch, 1.75*inch, 1.75*inch])
+    check_table.setStyle(TableStyle([
+        ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
+        ('TOPPADDING', (0, 0), (-1, -1), 1),
+        ('BOTTOMPADDING', (0, 0), (-1, -1), 1),
+        ('BACKGROUND', (0, 0), (-1, -1), HexColor("#f8f8f8")),
+        ('BOX', (0, 0), (-1, -1), 0.5, HexColor("#dddddd")),
+    ]))
+    block.append(check_table)
+    block.append(Spacer(1, 2))
+    notes_table = Table([[Paragraph("<b>Lola's Findings:</b> _______________________________________________________________________________", small_style)]], colWidths=[7*inch])
+    notes_table.setStyle(TableStyle([
+        ('TOPPADDING', (0, 0), (-1, -1), 4),
+        ('BOTTOMPADDING', (0, 0), (-1, -1), 4),
+        ('BACKGROUND', (0, 0), (-1, -1), HexColor("#fffef5")),
+        ('BOX', (0, 0), (-1, -1), 0.5, HexColor("#dddddd")),
+    ]))
+    block.append(notes_table)
+    block.append(Spacer(1, 10))
+    block.append(HRFlowable(width="100%", thickness=0.5, color=HexColor("#eeeeee"), spaceAfter=6))
+    return block
+
+
+def build_before(records):
+    styles = get_styles()
+    elements = []
+    for s in records:
+        elements.extend(legacy_block(s, styles))
+    return elements
+
+
+def build_after(records):
+    elements = []
+    for s in records:
+        elements.extend(sponsor_block(s, TASK_CHECKLIST))
+    return elements
+
+
+def measure(build, records):
+    start = time.perf_counter()
+    elements = build(records)
+    built = time.perf_counter() - start
+    doc = SimpleDocTemplate(io.BytesIO(), pagesize=letter, rightMargin=0.6*inch, leftMargin=0.6*inch,
+                            topMargin=0.5*inch, bottomMargin=0.5*inch)
+    doc.build(elements)
+    return built, time.perf_counter() - start
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes", default="1000,10000", help="comma-separated record counts (default: 1000,10000)")
+    args = parser.parse_args()
+
+    # Warm the shared caches so neither side pays one-off setup inside the timing
+    build_before(synth_records(1))
+    build_after(synth_records(1))
+
+    print(f"{'records':>8}  {'variant':<7}  {'build us/rec':>12}  {'build+layout us/rec':>19}")
+    for n in (int(x) for x in args.sizes.split(",")):
+        records = synth_records(n)
+        for name, build in (("before", build_before), ("after", build_after)):
+            built, total = measure(build, records)
+            print(f"{n:>8}  {name:<7}  {built / n * 1e6:>12.1f}  {total / n * 1e6:>19.1f}")
+    print()
+    paragraph_cache.report(sys.stdout)
@@ -0,0 +1,223 @@
+#!/usr/bin/env python3
+"""
+Planned and actual budget line items from the UOSU funding application workbooks
+
+Every "<Term> Budget" sheet (projected) and "<Term> Actual Budget" sheet
+(actual) shares one layout: a "Projected/Actual Revenue" header row with a
+column per month and a Total column, then revenue lines, then expense
+lines grouped under event headings, each group closed by a total row.
+read_budget_sheet() turns one sheet into line items; group_totals() sums
+them by (term, section, category) into planned and actual cents.
+
+Workbooks are summarized one at a time and the per-workbook totals cached
+in .budget-cache.json keyed by each file's (mtime, size), so editing one
+application only re-reads that workbook. A term's projected or actual sheet
+copied into a later application is counted once.
+
+    python budgets.py
+"""
+
+import json
+import os
+from array import array
+from collections import defaultdict
+
+from bank_statements import format_cents
+from reconcile import LEDGER_DIR
+from workbooks import read_sheet, sheet_names
+
+ROOT = os.path.dirname(os.path.abspath(__file__))
+BUDGET_DIR = os.path.join(LEDGER_DIR, "UOSU")
+CACHE_PATH = os.path.join(ROOT, ".budget-cache.json")
+# Bump when read_budget_sheet() changes what it extracts, to invalidate the cache
+PARSER_VERSION = 1
+
+PLANNED, ACTUAL = "planned", "actual"
+REVENUE, EXPENSES = "Revenue", "Expenses"
+
+
+class LineItems:
+    """Budget lines stored column by column; ``amount`` is in cents."""
+
+    def __init__(self):
+        self.term = []
+        self.kind = []
+        self.section = []
+        self.category = []
+        self.item = []
+        self.amount = array("q")
+
+    def __len__(self):
+        return len(self.amount)
+
+    def add(self, term, kind, section, category, item, amount):
+        self.term.append(term)
+        self.kind.append(kind)
+        self.section.append(section)
+        self.category.append(category)
+        self.item.append(item)
+        self.amount.append(amount)
+
+
+def sheet_kind(title):
+    """(term, PLANNED or ACTUAL) for a budget sheet title, or None for any other sheet."""
+    words = title.split()
+    lowered = [w.lower() for w in words]
+    if not lowered or lowered[-1] not in ("budget", "budgets") or "example" in lowered:
+        return None
+    kind = ACTUAL if "actual" in lowered else PLANNED
+    term = " ".join(w for w in words if w.lower() not in ("actual", "budget", "budgets"))
+    return term, kind
+
+
+def _number(value):
+    if isinstance(value, bool) or not isinstance(value, (int, float)):
+        return None
+    return value
+
+
+def _label(row, total_col):
+    for cell in row[:total_col]:
+        if isinstance(cell, str) and cell.strip():
+            return cell.strip()
+    return None
+
+
+def read_budget_sheet(rows, term, kind, items=None):
+    """Add one budget sheet's line items to ``items`` (a LineItems) and return it."""
+    items = items if items is not None else LineItems()
+    total_col = first_month = None
+    section = category = None
+    for row in rows:
+        first = row[0].strip().lower() if row and isinstance(row[0], str) else ""
+        if total_col is None:
+            if first.endswith("revenue") and "Total" in row:
+                total_col = row.index("Total")
+                first_month = next((i for i in range(1, total_col) if row[i] is not None), None)
+                if first_month is None:
+                    raise ValueError("no month columns before the revenue header's Total column")
+                section = category = REVENUE
+            continue
+        if first in ("projected expenses", "actual expenses"):
+            section = category = EXPENSES
+            continue
+        label = _label(row, first_month)
+        if label is None:
+            continue
+        lowered = label.lower()
+        if lowered.startswith("total") and section == EXPENSES:
+            # Everything below the expense total is surplus and grant arithmetic
+            break
+        if lowered.startswith("total") or lowered.endswith("total"):
+            continue
+        values = [_number(v) for v in row[first_month:total_col + 1]]
+        if all(v is None for v in values):
+            # A heading opening a group of expenses, e.g. "Net Summit"
+            if section == EXPENSES:
+                category = label
+            continue
+        total = values[-1] if values[-1] is not None else sum(v for v in values[:-1] if v is not None)
+        items.add(term, kind, section, category, label, round(total * 100))
+    return items
+
+
+def group_totals(items):
+    """Sum ``items`` by (term, kind, section, category) -> cents."""
+    totals = defaultdict(int)
+    for k in range(len(items)):
+        totals[(items.term[k], items.kind[k], items.section[k], items.category[k])] += items.amount[k]
+    return dict(totals)
+
+
+def summarize_workbook(path):
+    """Group totals for each budget sheet in one workbook: {(term, kind): {(section, category): cents}}."""
+    sheets = {}
+    for title in sheet_names(path):
+        found = sheet_kind(title.strip())
+        if found is None or found in sheets:
+            continue
+        try:
+            items = read_budget_sheet(read_sheet(path, title), *found)
+        except ValueError as exc:
+            raise ValueError(f"{os.path.basename(path)}, sheet {title!r}: {exc}") from None
+        sheets[found] = {(section, category): cents
+                         for (_, _, section, category), cents in group_totals(items).items()}
+    return sheets
+
+
+def find_budget_workbooks(folder=BUDGET_DIR):
+    return sorted(os.path.join(folder, name) for name in os.listdir(folder)
+                  if name.endswith(".xlsx") and not name.startswith("~$"))
+
+
+def _load_cache(path):
+    try:
+        with open(path, encoding="utf-8") as fh:
+            cache = json.load(fh)
+    except (OSError, ValueError):
+        return {}
+    return cache if cache.get("version") == PARSER_VERSION else {}
+
+
+def load_budgets(paths=None, cache_path=CACHE_PATH):
+    """Planned and actual cents by (term, section, category), summarizing only workbooks that changed.
+
+    Returns {term: {(section, category): {PLANNED: cents or None, ACTUAL: cents or None}}}.
+    """
+    paths = paths if paths is not None else find_budget_workbooks()
+    cache = _load_cache(cache_path) if cache_path else {}
+    files = cache.get("files", {})
+    changed = False
+    merged = {}
+    for path in paths:
+        key = os.path.abspath(path)
+        st = os.stat(path)
+        stamp = [st.st_mtime_ns, st.st_size]
+        entry = files.get(key)
+        if entry is None or entry["stamp"] != stamp:
+            sheets = summarize_workbook(path)
+            entry = files[key] = {
+                "stamp": stamp,
+                "sheets": [[term, kind, [[s, c, cents] for (s, c), cents in totals.items()]]
+                           for (term, kind), totals in sheets.items()],
+            }
+            changed = True
+        for term, kind, totals in entry["sheets"]:
+            if (term, kind) in merged:
+                # The same term's sheet copied into a later application
+                continue
+            merged[(term, kind)] = {(s, c): cents for s, c, cents in totals}
+
+    if cache_path and changed:
+        tmp = cache_path + ".tmp"
+        with open(tmp, "w", encoding="utf-8") as fh:
+            json.dump({"version": PARSER_VERSION, "files": files}, fh)
+        os.replace(tmp, cache_path)
+
+    budgets = {}
+    for (term, kind), totals in merged.items():
+        categories = budgets.setdefault(term, {})
+        for key, cents in totals.items():
+            categories.setdefault(key, {PLANNED: None, ACTUAL: None})[kind] = cents
+    return dict(sorted(budgets.items(), key=lambda kv: term_order(kv[0])))
+
+
+def term_order(term):
+    """Sort key putting "Summer 2024" before "Fall 2024" before "Winter 2025"."""
+    season, _, year = term.rpartition(" ")
+    seasons = {"winter": 0, "summer": 1, "fall": 2}
+    return (int(year) if year.isdigit() else 0, seasons.get(season.lower(), 3), term)
+
+
+def variance(planned, actual):
+    """Actual minus planned in cents, or None unless both are known."""
+    return None if planned is None or actual is None else actual - planned
+
+
+if __name__ == "__main__":
+    for term, categories in load_budgets().items():
+        print(term)
+        for (section, category), amounts in categories.items():
+            planned, actual = amounts[PLANNED], amounts[ACTUAL]
+            show = lambda cents: "-" if cents is None else format_cents(cents)
+            print(f"  {section:<9} {category:<45} planned {show(planned):>11}  actual {show(actual):>11}")
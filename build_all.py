@@ -0,0 +1,194 @@
+#!/usr/bin/env python3
+"""
+Build every BBS PDF in one run, rendering the documents in parallel
+"""
+
+import argparse
+import importlib
+import os
+import sys
+import time
+from datetime import date
+
+from build_cache import BuildCache
+from link_checker import STATUS_PATH
+from sponsor_strategy import STRATEGY_PATH
+
+ROOT = os.path.dirname(os.path.abspath(__file__))
+
+
+def _code(*modules):
+    return tuple(os.path.join(ROOT, module + ".py") for module in modules)
+
+
+def _budget_inputs():
+    from budgets import find_budget_workbooks
+    return _code("budgets", "workbooks", "bank_statements") + tuple(find_budget_workbooks())
+
+
+def _reconciliation_inputs():
+    # Imported here to keep the finance modules off build_all's startup path
+    from bank_statements import find_statements
+    from reconcile import TRACKER_PATH, find_workbooks
+    return (_code("reconcile", "workbooks", "bank_statements") + tuple(find_statements())
+            + tuple(find_workbooks()) + (TRACKER_PATH,))
+
+
+# Document name -> (generator module, output file, datasets it reads, other input files). The
+# other inputs may be a function returning them, for inputs found by searching a folder.
+DOCUMENTS = {
+    "lola": ("generate_lola_pdf", "LOLA-SPONSORSHIP-RESEARCH-TASK.pdf",
+             ("lola_sponsors", "working_links", "broken_links", "timed_out_links"), (STRATEGY_PATH,)),
+    "banking": ("generate_banking_pdf", "BBS-BANKING-OPTIONS-SHAAN.pdf", ("banks", "bank_comparison"), ()),
+    "working-links": ("generate_working_links_pdf", "BBS-WORKING-SPONSORSHIP-LINKS.pdf",
+                      ("working_links", "broken_links", "timed_out_links", "lola_sponsors"),
+                      (STATUS_PATH, STRATEGY_PATH) + _code("link_checker")),
+    "budget": ("generate_budget_pdf", "BBS-BUDGET-VS-ACTUAL.pdf", (), _budget_inputs),
+    "reconciliation": ("generate_reconciliation_pdf", "BBS-BANK-RECONCILIATION.pdf", (), _reconciliation_inputs),
+    "calendar": ("generate_calendar_pdf", "BBS-APPLICATION-CALENDAR.pdf",
+                 ("lola_sponsors", "working_links", "broken_links", "timed_out_links"),
+                 (STRATEGY_PATH,) + _code("deadlines")),
+}
+
+# Documents that count from the day they are built, so go stale at midnight
+DATED = frozenset({"calendar"})
+
+
+class BuildFailed(Exception):
+    """Raised after a run in which some documents failed to build.
+
+    ``results`` are the documents that were built or up to date, as
+    build_all() returns them; ``failures`` are (name, exception) pairs.
+    """
+
+    def __init__(self, results, failures):
+        super().__init__(f"failed to build {', '.join(name for name, _ in failures)}")
+        self.results = results
+        self.failures = failures
+
+
+def preload(names):
+    """Import reportlab, the style registry and the generators once.
+
+    Called in the parent before the pool starts so forked workers inherit the
+    warm modules; on platforms without fork it runs again as the worker
+    initializer.
+    """
+    import pdf_theme
+    pdf_theme.get_styles()
+    for name in names:
+        importlib.import_module(DOCUMENTS[name][0])
+
+
+def output_path(name, output_dir=None):
+    return os.path.join(output_dir or ROOT, DOCUMENTS[name][1])
+
+
+def render(name, output_dir=None):
+    module = importlib.import_module(DOCUMENTS[name][0])
+    output = output_path(name, output_dir)
+    start = time.perf_counter()
+    module.build_pdf(output)
+    return name, output, time.perf_counter() - start
+
+
+def build_all(names=None, jobs=None, output_dir=None, force=False):
+    """Render the named documents (default: all) and return [(name, output, seconds)].
+
+    Documents whose inputs are unchanged since their last build are skipped
+    (reported with ``seconds`` of None) unless ``force`` is set. If any
+    document fails, the others still build and are recorded in the cache,
+    then BuildFailed is raised.
+    """
+    names = list(dict.fromkeys(names or DOCUMENTS))
+    if output_dir:
+        os.makedirs(output_dir, exist_ok=True)
+
+    cache = BuildCache()
+    digests = {}
+    for name in names:
+        module, _, datasets, extra_inputs = DOCUMENTS[name]
+        if callable(extra_inputs):
+            extra_inputs = extra_inputs()
+        values = (date.today().isoformat(),) if name in DATED else ()
+        digests[name] = cache.document_digest(module, datasets, extra_inputs, values)
+    skipped = [] if force else [name for name in names if cache.is_fresh(output_path(name, output_dir), digests[name])]
+    todo = [name for name in names if name not in skipped]
+    results = [(name, output_path(name, output_dir), None) for name in skipped]
+    failures = []
+
+    if todo:
+        preload(todo)
+        jobs = min(jobs or os.cpu_count() or 1, len(todo))
+        built = []
+        if jobs <= 1:
+            for name in todo:
+                try:
+                    built.append(render(name, output_dir))
+                except Exception as exc:
+                    failures.append((name, exc))
+        else:
+            import multiprocessing
+            from concurrent.futures import ProcessPoolExecutor, as_completed
+            methods = multiprocessing.get_all_start_methods()
+            ctx = multiprocessing.get_context("fork" if "fork" in methods else None)
+            with ProcessPoolExecutor(max_workers=jobs, mp_context=ctx, initializer=preload, initargs=(todo,)) as pool:
+                futures = {pool.submit(render, name, output_dir): name for name in todo}
+                for future in as_completed(futures):
+                    try:
+                        built.append(future.result())
+                    except Exception as exc:
+                        failures.append((futures[future], exc))
+        for name, output, _ in built:
+            cache.record(output, digests[name])
+        results.extend(built)
+
+    # Saved before reporting failures, so the documents that did build aren't rebuilt next time
+    cache.save()
+    results.sort(key=lambda r: names.index(r[0]))
+    if failures:
+        raise BuildFailed(results, sorted(failures, key=lambda f: names.index(f[0])))
+    return results
+
+
+def print_report(results, wall):
+    width = max(len(name) for name, _, _ in results)
+    print()
+    for name, output, seconds in results:
+        took = "up to date" if seconds is None else f"{seconds:7.2f}s"
+        print(f"{name:<{width}}  {took:>10}  {os.path.basename(output)}")
+    rendered = sum(r[2] for r in results if r[2] is not None)
+    print(f"{'total':<{width}}  {wall:9.2f}s  (sum of documents {rendered:.2f}s)")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("documents", nargs="*", metavar="DOCUMENT",
+                        help=f"documents to build (default: all of {', '.join(DOCUMENTS)})")
+    parser.add_argument("-j", "--jobs", type=int, help="worker processes (default: one per CPU)")
+    parser.add_argument("--output-dir", help="write the PDFs here instead of next to the generators")
+    parser.add_argument("-f", "--force", action="store_true", help="rebuild even if the inputs are unchanged")
+    parser.add_argument("--profile", action="store_true",
+                        help="print where each document's build spent its time (as BBS_PROFILE=1); implies --force")
+    parser.add_argument("--profile-dump", metavar="DIR", help="with --profile, also save a cProfile dump per document here")
+    args = parser.parse_args()
+    unknown = [name for name in args.documents if name not in DOCUMENTS]
+    if unknown:
+        parser.error(f"unknown document(s): {', '.join(unknown)}")
+    if args.profile or args.profile_dump:
+        # Set before the pool forks so every worker sees it
+        os.environ["BBS_PROFILE"] = "1"
+        if args.profile_dump:
+            os.environ["BBS_PROFILE_DUMP"] = os.path.abspath(args.profile_dump)
+        args.force = True
+
+    start = time.perf_counter()
+    try:
+        results = build_all(args.documents, args.jobs, args.output_dir, args.force)
+    except BuildFailed as exc:
+        if exc.results:
+            print_report(exc.results, time.perf_counter() - start)
+        for name, error in exc.failures:
+            print(f"{name}: build failed: {type(error).__name__}: {error}", file=sys.stderr)
+        sys.exit(1)
+    print_report(results, time.perf_counter() - start)
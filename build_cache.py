@@ -0,0 +1,94 @@
+"""
+Content-addressed build cache for the BBS PDFs
+
+A document's digest covers its generator source, the shared modules every
+generator uses (theme, data loading), the datasets it renders and the
+reportlab version. When the digest recorded for an output file matches and
+the file still exists, the build can be skipped. File hashes are themselves
+memoised by (mtime, size) so a no-op check reads no file contents.
+"""
+
+import hashlib
+import json
+import os
+
+from dataset_loader import dataset_path
+
+ROOT = os.path.dirname(os.path.abspath(__file__))
+CACHE_PATH = os.path.join(ROOT, ".build-cache.json")
+
+# Modules whose changes can affect any document
+SHARED_CODE = (
+    "pdf_theme.py", "dataset_loader.py", "sponsor_summary.py", "sponsor_blocks.py",
+    "streaming_doc.py", "sponsor_strategy.py", "sponsor_catalog.py", "paragraph_cache.py",
+)
+
+
+def _reportlab_version():
+    # The package's own attribute: importlib.metadata would cost a no-op check more than the rest of it
+    try:
+        import reportlab
+    except ImportError:
+        return "unknown"
+    return reportlab.Version
+
+
+class BuildCache:
+    def __init__(self, path=CACHE_PATH):
+        self.path = path
+        try:
+            with open(path, encoding="utf-8") as fh:
+                data = json.load(fh)
+        except (OSError, ValueError):
+            data = {}
+        self.files = data.get("files", {})
+        self.outputs = data.get("outputs", {})
+        self._dirty = False
+
+    def file_digest(self, path):
+        st = os.stat(path)
+        stamp = [st.st_mtime_ns, st.st_size]
+        cached = self.files.get(path)
+        if cached and cached[:2] == stamp:
+            return cached[2]
+        h = hashlib.sha256()
+        with open(path, "rb") as fh:
+            for chunk in iter(lambda: fh.read(1 << 20), b""):
+                h.update(chunk)
+        digest = h.hexdigest()
+        self.files[path] = stamp + [digest]
+        self._dirty = True
+        return digest
+
+    def document_digest(self, module, datasets, extra_inputs=(), values=()):
+        """Digest of everything a generator module's output depends on.
+
+        ``values`` are strings the output depends on besides files, such as
+        the day a calendar counts from.
+        """
+        h = hashlib.sha256()
+        h.update(_reportlab_version().encode())
+        for value in values:
+            h.update(value.encode() + b"\0")
+        code = [os.path.join(ROOT, module + ".py")] + [os.path.join(ROOT, name) for name in SHARED_CODE]
+        inputs = code + [dataset_path(name) for name in datasets] + list(extra_inputs)
+        for path in inputs:
+            h.update(os.path.relpath(path, ROOT).encode())
+            h.update(self.file_digest(path).encode() if os.path.exists(path) else b"missing")
+        return h.hexdigest()
+
+    def is_fresh(self, output, digest):
+        return self.outputs.get(output) == digest and os.path.exists(output)
+
+    def record(self, output, digest):
+        self.outputs[output] = digest
+        self._dirty = True
+
+    def save(self):
+        if not self._dirty:
+            return
+        tmp = self.path + ".tmp"
+        with open(tmp, "w", encoding="utf-8") as fh:
+            json.dump({"files": self.files, "outputs": self.outputs}, fh, indent=1, sort_keys=True)
+        os.replace(tmp, self.path)
+        self._dirty = False
@@ -0,0 +1,213 @@
+"""
+Load the record lists rendered by the BBS PDF generators from data files
+
+Records live under data/ as JSON, JSON Lines, CSV or YAML. JSON, JSON Lines
+and CSV are read incrementally and each record is checked against the
+dataset's schema as it is read, so a tracker export with thousands of rows
+never has to be held in memory twice. YAML is parsed a document at a time:
+a file holding one list of records is built whole before the first record
+is checked, so prefer the other formats for large exports.
+"""
+
+import argparse
+import csv
+import json
+import os
+
+DATA_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "data")
+
+
+class DatasetError(ValueError):
+    """Raised when a data file is malformed or a record does not match its schema."""
+
+
+class Schema:
+    """Field names and types a record must (or may) carry.
+
+    A field's kind is a type, or a frozenset of the only strings it may hold.
+
+    The field tables are resolved once here; ``validate`` is the per-record
+    hot path and only does dictionary lookups and isinstance checks.
+    """
+
+    def __init__(self, required, optional=None):
+        self.required = tuple(required.items())
+        self.optional = tuple((optional or {}).items())
+        self.fields = dict(required, **(optional or {}))
+
+    def validate(self, record, where):
+        if not isinstance(record, dict):
+            raise DatasetError(f"{where}: expected an object, got {type(record).__name__}")
+        for field, kind in self.required:
+            if field not in record:
+                raise DatasetError(f"{where}: missing required field '{field}'")
+            record[field] = self._coerce(record[field], kind, field, where)
+        for field, kind in self.optional:
+            value = record.get(field)
+            if value in (None, ""):
+                record.pop(field, None)
+            else:
+                record[field] = self._coerce(value, kind, field, where)
+        return record
+
+    @staticmethod
+    def _coerce(value, kind, field, where):
+        if isinstance(kind, frozenset):
+            if value in kind:
+                return value
+            raise DatasetError(f"{where}: field '{field}' should be one of {', '.join(sorted(kind))}, got {value!r}")
+        if isinstance(value, kind):
+            return value
+        # CSV cells always arrive as strings
+        if kind is int and isinstance(value, str):
+            try:
+                return int(value)
+            except ValueError:
+                pass
+        raise DatasetError(f"{where}: field '{field}' should be {kind.__name__}, got {value!r}")
+
+
+SPONSOR_SCHEMA = Schema(
+    {"num": int, "name": str, "url": str, "amount": str, "likelihood": str, "priority": str, "notes": str},
+    {"tier": str, "deadline": str, "assignee": str},
+)
+# Who researches a sponsor record that has no "assignee"
+DEFAULT_RESEARCHER = "Lola"
+
+LINK_ISSUE_SCHEMA = Schema({"name": str, "url": str, "suggestion": str})
+# pdf_theme.VERDICT_COLORS' names, repeated so loading data never imports reportlab
+VERDICT_COLORS = frozenset({"green", "orange", "gold"})
+BANK_SCHEMA = Schema({
+    "rank": str, "name": str, "fee": str, "transactions": str, "etransfers": str,
+    "pros": str, "cons": str, "url": str, "verdict": str, "verdict_color": VERDICT_COLORS,
+})
+BANK_COMPARISON_SCHEMA = Schema({"bank": str, "fee": str, "transactions": str, "etransfers": str, "verdict": str})
+
+# Dataset name -> (default file under DATA_DIR, schema)
+DATASETS = {
+    "lola_sponsors": ("lola_sponsors.json", SPONSOR_SCHEMA),
+    "working_links": ("working_links.json", SPONSOR_SCHEMA),
+    "broken_links": ("broken_links.json", LINK_ISSUE_SCHEMA),
+    "timed_out_links": ("timed_out_links.json", LINK_ISSUE_SCHEMA),
+    "banks": ("banks.json", BANK_SCHEMA),
+    "bank_comparison": ("bank_comparison.json", BANK_COMPARISON_SCHEMA),
+}
+
+
+def dataset_path(name):
+    """Default location of a named dataset."""
+    return os.path.join(DATA_DIR, DATASETS[name][0])
+
+
+def _iter_json_array(fh, chunk_size=65536):
+    """Yield the items of a top-level JSON array without loading the whole file."""
+    decoder = json.JSONDecoder()
+    buf = fh.read(chunk_size).lstrip()
+    if not buf.startswith("["):
+        raise DatasetError("expected a JSON array of records")
+    buf = buf[1:]
+    eof = False
+    # What may come next: "first" (an item or the closing "]"), "item" after a comma, "sep" after an item
+    expect = "first"
+    while True:
+        buf = buf.lstrip()
+        if not buf:
+            if eof:
+                raise DatasetError("truncated or invalid JSON array")
+            more = fh.read(chunk_size)
+            eof = not more
+            buf += more
+            continue
+        if expect == "sep":
+            if buf[0] == "]":
+                return
+            if buf[0] != ",":
+                raise DatasetError(f"expected ',' or ']' between records, got {buf[:20]!r}")
+            buf = buf[1:]
+            expect = "item"
+            continue
+        if buf[0] == "]" and expect == "first":
+            return
+        if buf[0] in ",]":
+            # "[,", ",," or ",]": json.loads rejects a comma with no item before it, and so do we
+            raise DatasetError(f"unexpected {buf[0]!r} in JSON array: a record is missing")
+        try:
+            item, end = decoder.raw_decode(buf)
+        except json.JSONDecodeError:
+            if eof:
+                raise DatasetError("truncated or invalid JSON array")
+            more = fh.read(chunk_size)
+            eof = not more
+            buf += more
+            continue
+        yield item
+        buf = buf[end:]
+        expect = "sep"
+        if len(buf) < chunk_size and not eof:
+            more = fh.read(chunk_size)
+            eof = not more
+            buf += more
+
+
+def _iter_raw(path):
+    ext = os.path.splitext(path)[1].lower()
+    with open(path, encoding="utf-8", newline="" if ext == ".csv" else None) as fh:
+        if ext == ".json":
+            yield from _iter_json_array(fh)
+        elif ext in (".jsonl", ".ndjson"):
+            for line in fh:
+                if line.strip():
+                    yield json.loads(line)
+        elif ext == ".csv":
+            yield from csv.DictReader(fh)
+        elif ext in (".yaml", ".yml"):
+            try:
+                import yaml
+            except ImportError:
+                raise DatasetError(f"{path}: reading YAML needs PyYAML (pip install pyyaml)")
+            for doc in yaml.safe_load_all(fh):
+                if isinstance(doc, list):
+                    yield from doc
+                elif doc is not None:
+                    yield doc
+        else:
+            raise DatasetError(f"{path}: unsupported data file type '{ext}'")
+
+
+def iter_dataset(name, path=None):
+    """Stream the validated records of a named dataset."""
+    path = path or dataset_path(name)
+    schema = DATASETS[name][1]
+    for i, record in enumerate(_iter_raw(path), 1):
+        yield schema.validate(record, f"{os.path.basename(path)} record {i}")
+
+
+def load_dataset(name, path=None):
+    """All records of a named dataset as a list."""
+    return list(iter_dataset(name, path))
+
+
+def dataset_parser(description, names):
+    """The generators' shared parser: ``--output``, ``--profile`` and one ``--<dataset> PATH`` per dataset."""
+    parser = argparse.ArgumentParser(description=description)
+    parser.add_argument("--output", help="where to write the PDF (default: next to the script)")
+    parser.add_argument("--profile", action="store_true", help="print where the build spent its time (as BBS_PROFILE=1)")
+    for name in names:
+        parser.add_argument(f"--{name.replace('_', '-')}", dest=name, metavar="PATH",
+                            help=f"{name} records (.json, .jsonl, .csv or .yaml; default: data/{DATASETS[name][0]})")
+    return parser
+
+
+def parse_dataset_args(parser, names):
+    """Parse a dataset_parser() the generator may have added options to; returns (args, {name: records})."""
+    args = parser.parse_args()
+    if args.profile:
+        os.environ["BBS_PROFILE"] = "1"
+    datasets = {name: load_dataset(name, getattr(args, name)) for name in names if getattr(args, name)}
+    return args, datasets
+
+
+def dataset_args(description, names):
+    """Parse ``--output`` and one ``--<dataset> PATH`` option per dataset a generator renders."""
+    args, datasets = parse_dataset_args(dataset_parser(description, names), names)
+    return args.output, datasets
@@ -0,0 +1,404 @@
+#!/usr/bin/env python3
+"""
+Application deadlines for every sponsor program, as dated events
+
+Deadlines are only written down as free text - "APPLY BY: March 2025",
+"April 9, 2025 (Expression of Interest) -> July 9, 2025 (Full
+Application)", "May-July 2025", "4 intake deadlines per year" - in the
+datasets' deadline fields and notes and in the strategy doc.
+parse_deadlines() turns that text into Deadline events:
+
+    "April 9, 2025"     due that day
+    "March 2025"        due the last day of March
+    "May-July 2025"     a window opening May 1, due July 31
+    "4 ... per year"    the program's dated deadline repeats every 3 months
+
+Programs come from sponsor_catalog, so the strategy doc's dates reach the
+dataset records and vice versa. Programs with no date at all ("Check
+website for current grant cycles") are kept as undated.
+
+DeadlineIndex keeps the next occurrence of every deadline in a heap:
+"what is due next" is a peek after popping what has passed, and a recurring
+deadline is pushed back at its next occurrence rather than expanded ahead of
+time, so the heap holds one entry per deadline however far ahead you look.
+
+    python deadlines.py                       # the next 10 deadlines
+    python deadlines.py --days 90 --today 2025-03-01
+    python deadlines.py --ics BBS-DEADLINES.ics
+"""
+
+import argparse
+import calendar
+import hashlib
+import heapq
+import os
+import re
+from datetime import date, datetime, timezone
+
+from sponsor_catalog import load_catalog
+
+ROOT = os.path.dirname(os.path.abspath(__file__))
+
+# Strategy fields that say nothing about dates
+SKIP_FIELDS = frozenset({"num", "name", "tier", "url", "amount", "likelihood"})
+
+_MONTH = (r"(jan(?:uary)?|feb(?:ruary)?|mar(?:ch)?|apr(?:il)?|may|june?|july?|aug(?:ust)?"
+          r"|sep(?:t(?:ember)?)?|oct(?:ober)?|nov(?:ember)?|dec(?:ember)?)\.?")
+# Earlier alternatives win at the same position, so "May 9, 2025" is a day, not a month
+_DATE_RE = re.compile(
+    rf"(?P<day>{_MONTH}\s+(\d{{1,2}})(?:st|nd|rd|th)?(?!\d)(?:,?\s+(\d{{4}}))?)"
+    rf"|(?P<range>{_MONTH}\s*(?:-|–|to)\s*{_MONTH}\s+(\d{{4}}))"
+    rf"|(?P<month>{_MONTH}\s+(\d{{4}}))",
+    re.IGNORECASE,
+)
+_LABEL_RE = re.compile(r"\s*\(([^)]*)\)")
+_NUMBERS = {"one": 1, "two": 2, "three": 3, "four": 4, "six": 6, "twelve": 12}
+_RECUR_RE = re.compile(
+    r"\b(?:(\d+|one|two|three|four|six|twelve)\s+(?:intake\s+)?(?:deadlines?|intakes?|windows?|cycles?|rounds?)|(twice))"
+    r"\s*(?:/|per|a|each)\s*year",
+    re.IGNORECASE,
+)
+
+
+class Deadline:
+    """One dated deadline of a program; ``every`` months apart when it recurs (0 when it doesn't)."""
+
+    __slots__ = ("due", "program", "url", "label", "opens", "every", "source")
+
+    def __init__(self, due, program, url, label, opens=None, every=0, source=""):
+        self.due = due
+        self.program = program
+        self.url = url
+        self.label = label
+        self.opens = opens
+        self.every = every
+        self.source = source
+
+    def __repr__(self):
+        every = f", every {self.every} months" if self.every else ""
+        return f"Deadline({self.due}, {self.program!r}, {self.label!r}{every})"
+
+    def next_due(self, on_or_after):
+        """This deadline's first occurrence on or after ``on_or_after``, or None if it is over."""
+        if self.due >= on_or_after:
+            return self.due
+        if not self.every:
+            return None
+        months = (on_or_after.year - self.due.year) * 12 + on_or_after.month - self.due.month
+        steps = max(0, months // self.every)
+        due = self.occurrence(steps)
+        while due < on_or_after:
+            steps += 1
+            due = self.occurrence(steps)
+        return due
+
+    def occurrence(self, n):
+        """The due date ``n`` repeats after the first."""
+        return add_months(self.due, n * self.every)
+
+    def label_for(self, due):
+        """The label of the occurrence due on ``due``: months it names move with the date.
+
+        "for September review cycle" on an August deadline repeating every 3
+        months reads "for December review cycle" on the November occurrence.
+        """
+        months = _months_between(self.due, due)
+        return _shift_months(self.label, months) if months else self.label
+
+    def opens_for(self, due):
+        """When the window of the occurrence due on ``due`` opens, or None."""
+        return add_months(self.opens, _months_between(self.due, due)) if self.opens else None
+
+    def series_label(self):
+        """A label true of every occurrence: the label without the months it names."""
+        label = _MONTH_PHRASE_RE.sub("", self.label)
+        label = " ".join(label.split()).strip(" ,;-")
+        return label or "Apply by"
+
+
+# A month named in a label, with the preposition and year around it
+_MONTH_NAME_RE = re.compile(rf"\b{_MONTH}(?=\W|$)(?:\s+(\d{{4}}))?", re.IGNORECASE)
+_MONTH_PHRASE_RE = re.compile(rf"\b(?:(?:for|in|by|until|from|before|after)\s+)?{_MONTH}(?=\W|$)(?:\s+\d{{4}})?",
+                              re.IGNORECASE)
+
+
+def _months_between(start, end):
+    return (end.year - start.year) * 12 + end.month - start.month
+
+
+def _shift_months(text, months):
+    """``text`` with every month it names (and the year after one) moved ``months`` later."""
+    def shift(m):
+        year, month = divmod(month_number(m.group(1)) - 1 + months, 12)
+        names = calendar.month_name if len(m.group(1).rstrip(".")) > 3 else calendar.month_abbr
+        name = names[month + 1]
+        if m.group(1).isupper():
+            name = name.upper()
+        return f"{name} {int(m.group(2)) + year}" if m.group(2) else name
+    return _MONTH_NAME_RE.sub(shift, text)
+
+
+def month_number(name):
+    return datetime.strptime(name[:3].title(), "%b").month
+
+
+def month_end(year, month):
+    return date(year, month, calendar.monthrange(year, month)[1])
+
+
+def add_months(day, months):
+    """``day`` moved by whole months, keeping month-end dates at the month's end."""
+    year, month = divmod(day.month - 1 + months, 12)
+    year += day.year
+    last = calendar.monthrange(year, month + 1)[1]
+    if day == month_end(day.year, day.month):
+        return date(year, month + 1, last)
+    return date(year, month + 1, min(day.day, last))
+
+
+def parse_deadlines(text, program="", url=""):
+    """(Deadlines found in ``text``, repeats per year or 0).
+
+    A day without a year takes the last year mentioned before it; one with no
+    year anywhere is skipped. A parenthetical straight after a date labels it.
+    """
+    found = []
+    year = None
+    for m in _DATE_RE.finditer(text):
+        label = _LABEL_RE.match(text, m.end())
+        label = label.group(1).strip() if label else None
+        opens = None
+        if m.group("day"):
+            name, day, given = m.group(2, 3, 4)
+            year = int(given) if given else year
+            if year is None:
+                continue
+            try:
+                due = date(year, month_number(name), int(day))
+            except ValueError:
+                continue
+        elif m.group("range"):
+            first, last, year = m.group(6), m.group(7), int(m.group(8))
+            due = month_end(year, month_number(last))
+            start_year = year - 1 if month_number(first) > month_number(last) else year
+            opens = date(start_year, month_number(first), 1)
+            label = label or "Application window"
+        else:
+            year = int(m.group(11))
+            due = month_end(year, month_number(m.group(10)))
+        found.append(Deadline(due, program, url, label or "Apply by", opens, source=text.strip()))
+    m = _RECUR_RE.search(text)
+    per_year = 0
+    if m:
+        count = (m.group(1) or "two").lower()
+        per_year = int(count) if count.isdigit() else _NUMBERS[count]
+    return found, per_year
+
+
+def program_texts(catalog=None):
+    """[(name, url, [texts])] for every sponsor in the catalog: its deadlines, notes and strategy details."""
+    catalog = catalog if catalog is not None else load_catalog()
+    programs = []
+    for sponsor in catalog:
+        texts = []
+        for _, record in sponsor.records:
+            texts.extend([record.get("deadline"), record.get("notes")])
+            texts.extend(v for k, v in record.get("details", {}).items() if k not in SKIP_FIELDS)
+        programs.append((sponsor.name, sponsor.url or "", list(dict.fromkeys(t for t in texts if t))))
+    return programs
+
+
+def collect(programs=None):
+    """(Deadlines, [(program, url, what its records say)] for programs with no date)."""
+    programs = program_texts() if programs is None else programs
+    deadlines, undated = [], []
+    for name, url, texts in programs:
+        by_due = {}
+        per_year = 0
+        for text in texts:
+            found, repeats = parse_deadlines(text, name, url)
+            per_year = per_year or repeats
+            for d in found:
+                # The same date often appears in several sources; keep the most specific
+                known = by_due.get(d.due)
+                if known is None or (known.label == "Apply by" and d.label != "Apply by") or (d.opens and not known.opens):
+                    by_due[d.due] = d
+        if not by_due:
+            said = next((t for t in texts if _RECUR_RE.search(t) or "rolling" in t.lower()), texts[0] if texts else "")
+            undated.append((name, url, said))
+            continue
+        program_deadlines = sorted(by_due.values(), key=lambda d: d.due)
+        if per_year:
+            # Intakes repeat from the earliest date on file
+            program_deadlines[0].every = max(1, 12 // per_year)
+        deadlines.extend(program_deadlines)
+    return deadlines, undated
+
+
+class DeadlineIndex:
+    """The next occurrence of every deadline, in a heap ordered by due date."""
+
+    def __init__(self, deadlines, today=None):
+        self.today = date.min
+        self._heap = [(d.due, i, d) for i, d in enumerate(deadlines)]
+        heapq.heapify(self._heap)
+        if today is not None:
+            self.advance(today)
+
+    def __len__(self):
+        return len(self._heap)
+
+    def advance(self, today):
+        """Drop what is due before ``today``, moving recurring deadlines to their next occurrence."""
+        self.today = max(self.today, today)
+        heap = self._heap
+        while heap and heap[0][0] < self.today:
+            _, seq, d = heap[0]
+            due = d.next_due(self.today)
+            if due is None:
+                heapq.heappop(heap)
+            else:
+                heapq.heapreplace(heap, (due, seq, d))
+
+    def next(self):
+        """(due, Deadline) of the soonest deadline not yet passed, or None."""
+        return self._heap[0][0::2] if self._heap else None
+
+    def upcoming(self, until=None, limit=None):
+        """Yield (due, Deadline) in date order up to ``until`` (inclusive), at most ``limit`` of them.
+
+        Walks the heap from the root instead of sorting it, so the first k
+        results cost O(k log k) whatever the heap's size; later occurrences
+        of a recurring deadline are merged in as the walk reaches them.
+        """
+        heap = self._heap
+        # (due, seq, heap position or -1, deadline, occurrence number)
+        frontier = [(heap[0][0], heap[0][1], 0, heap[0][2], None)] if heap else []
+        count = 0
+        while frontier and (limit is None or count < limit):
+            due, seq, pos, d, n = heapq.heappop(frontier)
+            if until is not None and due > until:
+                break
+            yield due, d
+            count += 1
+            if pos >= 0:
+                for child in (2 * pos + 1, 2 * pos + 2):
+                    if child < len(heap):
+                        heapq.heappush(frontier, (heap[child][0], heap[child][1], child, heap[child][2], None))
+            if d.every:
+                if n is None:
+                    n = 0
+                    while d.occurrence(n) < due:
+                        n += 1
+                heapq.heappush(frontier, (d.occurrence(n + 1), seq, -1, d, n + 1))
+
+
+def _ics_text(value):
+    return value.replace("\\", "\\\\").replace(";", "\\;").replace(",", "\\,").replace("\n", "\\n")
+
+
+def _fold(line):
+    """Split a content line into 75-octet pieces, as RFC 5545 requires."""
+    data = line.encode("utf-8")
+    pieces = []
+    while len(data) > 75:
+        cut = 75 if not pieces else 74
+        while cut and (data[cut] & 0xC0) == 0x80:
+            cut -= 1
+        pieces.append(data[:cut])
+        data = data[cut:]
+    pieces.append(data)
+    return b"\r\n ".join(pieces).decode("utf-8")
+
+
+def _rrule(d):
+    """The RRULE giving the occurrences Deadline.occurrence() does."""
+    rule = f"RRULE:FREQ=MONTHLY;INTERVAL={d.every}"
+    if d.due == month_end(d.due.year, d.due.month):
+        return rule + ";BYMONTHDAY=-1"
+    if d.due.day > 28:
+        # add_months() moves a 29th or 30th to the end of a shorter month, where
+        # a plain monthly rule would skip that month: take the last of the days
+        # up to this one that the month has
+        return rule + f";BYMONTHDAY={','.join(map(str, range(28, d.due.day + 1)))};BYSETPOS=-1"
+    return rule
+
+
+def _vevent(d, start, label, stamp, rrule=None):
+    uid = hashlib.sha1(f"{d.program}|{label}|{start}".encode("utf-8")).hexdigest()
+    description = [d.source]
+    opens = d.opens_for(start)
+    if opens:
+        description.insert(0, f"Window opens {opens:%B %d, %Y}")
+    lines = [
+        "BEGIN:VEVENT",
+        f"UID:{uid}@bbs-deadlines",
+        f"DTSTAMP:{stamp}",
+        f"DTSTART;VALUE=DATE:{start:%Y%m%d}",
+        f"SUMMARY:{_ics_text(f'{d.program} ({label})')}",
+        f"DESCRIPTION:{_ics_text(chr(10).join(description))}",
+    ]
+    if d.url:
+        lines.append(f"URL:{d.url}")
+    if rrule:
+        lines.append(rrule)
+    lines.append("END:VEVENT")
+    return lines
+
+
+def to_ics(deadlines):
+    """An iCalendar document with an all-day event per deadline (recurring ones with an RRULE).
+
+    A series has one SUMMARY for every occurrence, so a recurring deadline
+    whose label names a month gets the first occurrence as an event of its
+    own and the rest as a series labelled without the month.
+    """
+    stamp = datetime.now(timezone.utc).strftime("%Y%m%dT%H%M%SZ")
+    lines = ["BEGIN:VCALENDAR", "VERSION:2.0", "PRODID:-//BIPOC Business Society//Sponsor deadlines//EN",
+             "CALSCALE:GREGORIAN", "X-WR-CALNAME:BBS sponsor deadlines"]
+    for d in deadlines:
+        if not d.every:
+            lines += _vevent(d, d.due, d.label, stamp)
+        elif d.series_label() == d.label:
+            lines += _vevent(d, d.due, d.label, stamp, _rrule(d))
+        else:
+            lines += _vevent(d, d.due, d.label, stamp)
+            lines += _vevent(d, d.occurrence(1), d.series_label(), stamp, _rrule(d))
+    lines.append("END:VCALENDAR")
+    return "".join(_fold(line) + "\r\n" for line in lines)
+
+
+def write_ics(path, deadlines):
+    tmp = path + ".tmp"
+    with open(tmp, "w", encoding="utf-8", newline="") as fh:
+        fh.write(to_ics(deadlines))
+    os.replace(tmp, path)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--today", type=date.fromisoformat, default=date.today(),
+                        help="count from this day (YYYY-MM-DD; default: today)")
+    parser.add_argument("--days", type=int, help="list everything due within this many days instead")
+    parser.add_argument("-n", "--limit", type=int, default=10, help="how many deadlines to list (default: %(default)s)")
+    parser.add_argument("--ics", metavar="PATH", help="also write every deadline to an iCalendar file")
+    args = parser.parse_args()
+
+    deadlines, undated = collect()
+    index = DeadlineIndex(deadlines, args.today)
+    if args.days is not None:
+        until = date.fromordinal(args.today.toordinal() + args.days)
+        upcoming = index.upcoming(until)
+    else:
+        upcoming = index.upcoming(limit=args.limit)
+    shown = 0
+    for due, d in upcoming:
+        repeat = f"  (every {d.every} months)" if d.every else ""
+        print(f"{due}  {(due - args.today).days:4d}d  {d.program}  [{d.label_for(due)}]{repeat}")
+        shown += 1
+    if not shown:
+        print("Nothing due.")
+    print(f"{len(deadlines)} dated deadline(s), {len(undated)} program(s) with no date on file")
+    if args.ics:
+        write_ics(args.ics, deadlines)
+        print(f"Calendar written: {args.ics}")
@@ -0,0 +1,290 @@
+#!/usr/bin/env python3
+"""
+Full-text index over the finance archive in "BBS Finances 2024-2025"
+
+Text is pulled from every PDF (per page), .xlsx workbook (per sheet row)
+and .docx document (per paragraph), plus every file's own path - so
+receipts kept as images are still found by name, with "07.24"-style dates
+in names also indexed as "July 2024". Each of those units is split into
+words and stored as an inverted index (word -> units containing it) in
+.finance-index.sqlite.
+
+Updating compares each file's (mtime, size) with the index and re-extracts
+only new or changed files, in parallel; deleted files are dropped. A query
+is a handful of indexed lookups, so it answers in milliseconds.
+
+    python finance_index.py canva july
+    python finance_index.py "bbq receipts" -n 5
+    python finance_index.py --update
+"""
+
+import argparse
+import math
+import multiprocessing
+import os
+import re
+import sqlite3
+import sys
+import time
+import zipfile
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from datetime import date, datetime
+from xml.etree import ElementTree
+
+ROOT = os.path.dirname(os.path.abspath(__file__))
+ARCHIVE_DIR = os.path.join(ROOT, "BBS Finances 2024-2025")
+INDEX_PATH = os.path.join(ROOT, ".finance-index.sqlite")
+# Bump when extraction or tokenizing changes, to rebuild the index
+INDEX_VERSION = 1
+
+STOPWORDS = frozenset({"a", "an", "and", "at", "by", "for", "from", "in", "of", "on", "or", "the", "to", "with"})
+
+_WORD_RE = re.compile(r"[a-z0-9]+")
+_NAME_DATE_RE = re.compile(r"(?<!\d)(\d{1,2})[._-](\d{2})(?!\d)")
+_W = "{http://schemas.openxmlformats.org/wordprocessingml/2006/main}"
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS files (
+    id INTEGER PRIMARY KEY,
+    path TEXT UNIQUE NOT NULL,
+    mtime_ns INTEGER NOT NULL,
+    size INTEGER NOT NULL
+);
+CREATE TABLE IF NOT EXISTS units (
+    id INTEGER PRIMARY KEY,
+    file_id INTEGER NOT NULL REFERENCES files(id),
+    location TEXT NOT NULL,
+    text TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS units_file ON units(file_id);
+CREATE TABLE IF NOT EXISTS postings (
+    term TEXT NOT NULL,
+    unit_id INTEGER NOT NULL,
+    count INTEGER NOT NULL,
+    PRIMARY KEY (term, unit_id)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS postings_unit ON postings(unit_id);
+"""
+
+
+def tokenize(text):
+    return [w for w in _WORD_RE.findall(text.lower()) if w not in STOPWORDS]
+
+
+def _name_text(path):
+    """A file's path within the archive, with "07.24" also spelled "July 2024"."""
+    text = os.path.relpath(path, ARCHIVE_DIR)
+    extra = []
+    for month, year in _NAME_DATE_RE.findall(os.path.basename(path)):
+        if 1 <= int(month) <= 12:
+            extra.append(date(2000 + int(year), int(month), 1).strftime("%B %Y"))
+    return " ".join([text] + extra)
+
+
+def _cell_text(value):
+    if isinstance(value, datetime):
+        value = value.date()
+    if isinstance(value, date):
+        return value.strftime("%Y-%m-%d %B %Y")
+    if isinstance(value, float):
+        return f"{value:.2f}"
+    return str(value).strip()
+
+
+def _pdf_units(path):
+    from pypdf import PdfReader
+    reader = PdfReader(path)
+    for number, page in enumerate(reader.pages, 1):
+        text = page.extract_text() or ""
+        if text.strip():
+            yield f"page {number}", text
+
+
+def _xlsx_units(path):
+    from workbooks import read_sheet, sheet_names
+    for title in sheet_names(path):
+        for number, row in enumerate(read_sheet(path, title), 1):
+            text = "  ".join(_cell_text(v) for v in row if v is not None and str(v).strip())
+            if text:
+                yield f"{title.strip()} row {number}", text
+
+
+def _docx_units(path):
+    with zipfile.ZipFile(path) as archive:
+        root = ElementTree.fromstring(archive.read("word/document.xml"))
+    for number, paragraph in enumerate(root.iter(f"{_W}p"), 1):
+        text = "".join(node.text or "" for node in paragraph.iter(f"{_W}t"))
+        if text.strip():
+            yield f"paragraph {number}", text
+
+
+EXTRACTORS = {".pdf": _pdf_units, ".xlsx": _xlsx_units, ".docx": _docx_units}
+
+
+def extract(path):
+    """[(location, text)] for one file: its name, then whatever text its format holds.
+
+    A file that can't be read is still indexed by name, with the error as a unit.
+    """
+    units = [("file name", _name_text(path))]
+    extractor = EXTRACTORS.get(os.path.splitext(path)[1].lower())
+    if extractor:
+        try:
+            units.extend(extractor(path))
+        except Exception as exc:
+            units.append(("unreadable", f"{type(exc).__name__}: {exc}"))
+    return units
+
+
+def find_files(folder=ARCHIVE_DIR):
+    found = []
+    for dirpath, dirnames, filenames in os.walk(folder):
+        dirnames[:] = sorted(d for d in dirnames if not d.startswith("."))
+        found.extend(os.path.join(dirpath, name) for name in sorted(filenames)
+                     if not name.startswith((".", "~$")))
+    return found
+
+
+class FinanceIndex:
+    def __init__(self, path=INDEX_PATH):
+        self.path = path
+        self.db = sqlite3.connect(path)
+        version = self.db.execute("PRAGMA user_version").fetchone()[0]
+        if version != INDEX_VERSION:
+            self.db.executescript("DROP TABLE IF EXISTS postings; DROP TABLE IF EXISTS units; DROP TABLE IF EXISTS files;")
+            self.db.execute(f"PRAGMA user_version = {INDEX_VERSION}")
+        self.db.executescript(_SCHEMA)
+
+    def close(self):
+        self.db.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def _drop(self, file_id):
+        self.db.execute("DELETE FROM postings WHERE unit_id IN (SELECT id FROM units WHERE file_id = ?)", (file_id,))
+        self.db.execute("DELETE FROM units WHERE file_id = ?", (file_id,))
+        self.db.execute("DELETE FROM files WHERE id = ?", (file_id,))
+
+    def update(self, paths=None, jobs=None):
+        """Re-extract new and changed files (default: the whole archive) and forget deleted ones.
+
+        Returns the number of files (indexed, removed).
+        """
+        paths = [os.path.abspath(p) for p in (paths if paths is not None else find_files())]
+        known = {path: (file_id, (mtime, size))
+                 for file_id, path, mtime, size in self.db.execute("SELECT id, path, mtime_ns, size FROM files")}
+        stamps = {}
+        for path in paths:
+            st = os.stat(path)
+            stamps[path] = (st.st_mtime_ns, st.st_size)
+        todo = [p for p in paths if p not in known or known[p][1] != stamps[p]]
+        # Files no longer on disk; an explicit ``paths`` list leaves the rest of the index alone
+        gone = [p for p in known if p not in stamps and not os.path.exists(p)]
+
+        if todo:
+            jobs = min(jobs or os.cpu_count() or 1, len(todo))
+            if jobs <= 1:
+                results = map(extract, todo)
+            else:
+                methods = multiprocessing.get_all_start_methods()
+                ctx = multiprocessing.get_context("fork" if "fork" in methods else None)
+                with ProcessPoolExecutor(max_workers=jobs, mp_context=ctx) as pool:
+                    results = list(pool.map(extract, todo))
+        else:
+            results = []
+
+        with self.db:
+            for path in gone:
+                self._drop(known[path][0])
+            for path, units in zip(todo, results):
+                if path in known:
+                    self._drop(known[path][0])
+                file_id = self.db.execute("INSERT INTO files (path, mtime_ns, size) VALUES (?, ?, ?)",
+                                          (path, *stamps[path])).lastrowid
+                for location, text in units:
+                    unit_id = self.db.execute("INSERT INTO units (file_id, location, text) VALUES (?, ?, ?)",
+                                              (file_id, location, text)).lastrowid
+                    self.db.executemany("INSERT INTO postings (term, unit_id, count) VALUES (?, ?, ?)",
+                                        [(term, unit_id, n) for term, n in Counter(tokenize(text)).items()])
+        return len(todo), len(gone)
+
+    def search(self, query, limit=20):
+        """Units containing every word of ``query`` (a trailing "*" matches a prefix), best first.
+
+        Returns [(path, location, text, score)]; the score is a sum of tf-idf weights.
+        """
+        words = [w for w in re.findall(r"[a-z0-9]+\*?", query.lower()) if w.rstrip("*") not in STOPWORDS]
+        if not words:
+            return []
+        total = self.db.execute("SELECT COUNT(*) FROM units").fetchone()[0] or 1
+        scores = None
+        for word in words:
+            if word.endswith("*"):
+                prefix = word[:-1]
+                rows = self.db.execute("SELECT unit_id, count FROM postings WHERE term >= ? AND term < ?",
+                                       (prefix, prefix + "\uffff"))
+            else:
+                rows = self.db.execute("SELECT unit_id, count FROM postings WHERE term = ?", (word,))
+            counts = {}
+            for unit_id, count in rows:
+                counts[unit_id] = counts.get(unit_id, 0) + count
+            idf = math.log(1 + total / (1 + len(counts)))
+            weights = {unit_id: (1 + math.log(count)) * idf for unit_id, count in counts.items()}
+            if scores is None:
+                scores = weights
+            else:
+                scores = {unit_id: score + weights[unit_id] for unit_id, score in scores.items() if unit_id in weights}
+            if not scores:
+                return []
+        best = sorted(scores.items(), key=lambda kv: -kv[1])[:limit]
+        hits = []
+        for unit_id, score in best:
+            path, location, text = self.db.execute(
+                "SELECT files.path, units.location, units.text FROM units JOIN files ON files.id = units.file_id "
+                "WHERE units.id = ?", (unit_id,)).fetchone()
+            hits.append((path, location, text, score))
+        return hits
+
+
+def snippet(text, query, width=90):
+    """The stretch of ``text`` around the first query word, on one line."""
+    text = " ".join(text.split())
+    lowered = text.lower()
+    positions = [lowered.find(w.rstrip("*")) for w in tokenize(query.replace("*", ""))]
+    positions = [p for p in positions if p >= 0]
+    start = max(0, min(positions) - width // 3) if positions else 0
+    piece = text[start:start + width]
+    return ("..." if start else "") + piece + ("..." if start + width < len(text) else "")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("query", nargs="*", help="words that must all appear; end one with * to match a prefix")
+    parser.add_argument("-n", "--limit", type=int, default=20, help="most hits to show (default: %(default)s)")
+    parser.add_argument("--update", action="store_true", help="only bring the index up to date")
+    parser.add_argument("--no-update", action="store_true", help="search the index as it is, without checking files")
+    parser.add_argument("-j", "--jobs", type=int, help="worker processes for extraction (default: one per CPU)")
+    args = parser.parse_args()
+    if not args.query and not args.update:
+        parser.error("give a query, or --update")
+
+    with FinanceIndex() as index:
+        if not args.no_update:
+            start = time.perf_counter()
+            indexed, removed = index.update(jobs=args.jobs)
+            if indexed or removed or args.update:
+                print(f"Indexed {indexed} file(s), removed {removed} in {time.perf_counter() - start:.2f}s", file=sys.stderr)
+        if args.query:
+            query = " ".join(args.query)
+            start = time.perf_counter()
+            hits = index.search(query, args.limit)
+            took = (time.perf_counter() - start) * 1000
+            for path, location, text, _ in hits:
+                print(f"{os.path.relpath(path, ARCHIVE_DIR)}  [{location}]")
+                print(f"    {snippet(text, query)}")
+            print(f"{len(hits)} hit(s) in {took:.1f} ms", file=sys.stderr)
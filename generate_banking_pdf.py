@@ -3,43 +3,40 @@
 Generate Banking Options PDF for BBS Club President Shaan Haque
 """
 
-from reportlab.lib.pagesizes import letter
-from reportlab.lib.units import inch
-from reportlab.lib.colors import HexColor, white
-from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer, Table, TableStyle, HRFlowable, PageBreak
-from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
-from reportlab.lib.enums import TA_LEFT, TA_CENTER, TA_RIGHT
 import os
 
-OUTPUT_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "BBS-BANKING-OPTIONS-SHAAN.pdf")
-
-DARK_BG = HexColor("#1a1a2e")
-ACCENT = HexColor("#e94560")
-HEADER_BG = HexColor("#16213e")
-ROW_ALT = HexColor("#f7f7f7")
-LINK_COLOR = HexColor("#0066cc")
-GREEN = HexColor("#2d6a4f")
-ORANGE = HexColor("#e76f51")
-RED = HexColor("#c1121f")
-GOLD = HexColor("#b8860b")
-LIGHT_GREEN = HexColor("#d8f3dc")
-LIGHT_BLUE = HexColor("#e8f0fe")
+from dataset_loader import dataset_args, load_dataset
+from pdf_profiling import profile_build
 
-def build_pdf():
-    doc = SimpleDocTemplate(OUTPUT_PATH, pagesize=letter, rightMargin=0.6*inch, leftMargin=0.6*inch, topMargin=0.5*inch, bottomMargin=0.5*inch)
-    styles = getSampleStyleSheet()
+OUTPUT_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "BBS-BANKING-OPTIONS-SHAAN.pdf")
 
-    title_style = ParagraphStyle('T', parent=styles['Title'], fontSize=22, leading=26, textColor=DARK_BG, spaceAfter=4, fontName='Helvetica-Bold')
-    subtitle_style = ParagraphStyle('ST', parent=styles['Normal'], fontSize=12, leading=16, textColor=HexColor("#555555"), spaceAfter=2, fontName='Helvetica')
-    heading_style = ParagraphStyle('H', parent=styles['Heading2'], fontSize=14, leading=18, textColor=DARK_BG, spaceBefore=14, spaceAfter=8, fontName='Helvetica-Bold')
-    section_style = ParagraphStyle('S', parent=styles['Heading3'], fontSize=11, leading=14, textColor=ACCENT, spaceBefore=10, spaceAfter=4, fontName='Helvetica-Bold')
-    body_style = ParagraphStyle('B', parent=styles['Normal'], fontSize=9.5, leading=13, textColor=HexColor("#333333"), spaceAfter=6, fontName='Helvetica')
-    small_style = ParagraphStyle('SM', parent=styles['Normal'], fontSize=8, leading=10, textColor=HexColor("#666666"), fontName='Helvetica')
-    bold_style = ParagraphStyle('BD', parent=body_style, fontName='Helvetica-Bold')
-    link_style = ParagraphStyle('L', parent=styles['Normal'], fontSize=8.5, leading=11, textColor=LINK_COLOR, fontName='Helvetica')
-    rec_style = ParagraphStyle('REC', parent=body_style, fontSize=10, leading=14, textColor=GREEN, fontName='Helvetica-Bold', backColor=LIGHT_GREEN, borderPadding=(8, 10, 8, 10))
-    callout_style = ParagraphStyle('CO', parent=body_style, fontSize=9.5, leading=13, textColor=DARK_BG, backColor=LIGHT_BLUE, borderPadding=(8, 10, 8, 10), spaceAfter=10)
-    num_style = ParagraphStyle('NUM', parent=bold_style, fontSize=18, leading=22, textColor=ACCENT, fontName='Helvetica-Bold')
+@profile_build("banking")
+def build_pdf(output_path=OUTPUT_PATH, banks=None, bank_comparison=None):
+    from reportlab.lib.pagesizes import letter
+    from reportlab.lib.units import inch
+    from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer, Table, HRFlowable, PageBreak
+    from pdf_theme import ACCENT, GREEN, LIGHT_GREEN, RULE_GREY, RULE_LIGHT, comparison_table_style, get_styles, get_table_styles, verdict_style
+
+    banks = banks if banks is not None else load_dataset("banks")
+    comp_rows = bank_comparison if bank_comparison is not None else load_dataset("bank_comparison")
+
+    doc = SimpleDocTemplate(output_path, pagesize=letter, rightMargin=0.6*inch, leftMargin=0.6*inch, topMargin=0.5*inch, bottomMargin=0.5*inch)
+    styles = get_styles()
+    table_styles = get_table_styles()
+    title_style = styles["title"]
+    subtitle_style = styles["subtitle"]
+    heading_style = styles["heading_compact"]
+    section_style = styles["section_compact"]
+    body_style = styles["body"]
+    small_style = styles["small"]
+    link_style = styles["link"]
+    rec_style = styles["recommendation"]
+    callout_style = styles["callout"]
+    num_style = styles["rank"]
+    bank_name_style = styles["bank_name"]
+    pros_style = styles["pros"]
+    cons_style = styles["cons"]
+    step_label_style = styles["step_label"]
 
     elements = []
 
@@ -77,13 +74,13 @@ def build_pdf():
         elements.append(Paragraph(f"\u2022  {item}", body_style))
 
     elements.append(Spacer(1, 6))
-    elements.append(HRFlowable(width="100%", thickness=1, color=HexColor("#cccccc"), spaceAfter=10))
+    elements.append(HRFlowable(width="100%", thickness=1, color=RULE_GREY, spaceAfter=10))
 
     # ===== TOP RECOMMENDATION =====
     elements.append(Paragraph("TOP RECOMMENDATION", heading_style))
     elements.append(HRFlowable(width="100%", thickness=1.5, color=GREEN, spaceAfter=8))
 
-    elements.append(Paragraph("TD Community / Not-For-Profit Banking Plan", ParagraphStyle('RN', parent=bold_style, fontSize=14, leading=18, textColor=GREEN)))
+    elements.append(Paragraph("TD Community / Not-For-Profit Banking Plan", styles["recommendation_name"]))
     elements.append(Spacer(1, 4))
 
     rec_data = [
@@ -104,96 +101,19 @@ def build_pdf():
     ))
 
     elements.append(Spacer(1, 12))
-    elements.append(HRFlowable(width="100%", thickness=1, color=HexColor("#cccccc"), spaceAfter=10))
+    elements.append(HRFlowable(width="100%", thickness=1, color=RULE_GREY, spaceAfter=10))
 
     # ===== ALL OPTIONS =====
     elements.append(Paragraph("ALL OPTIONS RANKED", heading_style))
     elements.append(HRFlowable(width="100%", thickness=1.5, color=ACCENT, spaceAfter=8))
 
-    banks = [
-        {
-            "rank": "1",
-            "name": "TD Community / Not-For-Profit Plan",
-            "fee": "$0 with $5K balance | ~$5/mo without",
-            "transactions": "25/month included",
-            "etransfers": "Included",
-            "pros": "Closest branch to Telfer (99 Bank St). BBS already has TD docs. Well-known NFP plan. Easy to set up.",
-            "cons": "Fee kicks in if balance drops below $5K.",
-            "url": "https://www.td.com/ca/en/business-banking/small-business/bank-accounts/community-not-for-profit-plan",
-            "verdict": "BEST OVERALL",
-            "verdict_color": GREEN,
-        },
-        {
-            "rank": "2",
-            "name": "BMO Community Account",
-            "fee": "$3.50/month (low-cost) | may waive for student clubs",
-            "transactions": "15/month included, $0.65 each after",
-            "etransfers": "$1.50 each (or free with add-on)",
-            "pros": "Designed for not-for-profits. BMO branch at 131 Bank St near Telfer. BMO EMpower program = potential sponsor too.",
-            "cons": "Small monthly fee. E-transfers cost extra unless bundled.",
-            "url": "https://www.bmo.com/main/business/accounts/community-account/",
-            "verdict": "STRONG RUNNER-UP",
-            "verdict_color": ORANGE,
-        },
-        {
-            "rank": "3",
-            "name": "CIBC Not-For-Profit Operating Account",
-            "fee": "$0 with $5K balance | ~$6/mo without",
-            "transactions": "20/month included",
-            "etransfers": "Included",
-            "pros": "No fee if you hold $5K. CIBC has branches on Bank St. Clean digital banking app.",
-            "cons": "$5K minimum is same as TD but CIBC has less of an existing relationship with BBS.",
-            "url": "https://www.cibc.com/en/business/accounts/not-for-profit-operating-account.html",
-            "verdict": "SOLID OPTION",
-            "verdict_color": ORANGE,
-        },
-        {
-            "rank": "4",
-            "name": "RBC Royal Business Community Account",
-            "fee": "$6.95/month | first 3 months FREE",
-            "transactions": "15/month included",
-            "etransfers": "Included",
-            "pros": "RBC is a top sponsorship target for BBS. Having an RBC account deepens the relationship. Branch at 90 Sparks St.",
-            "cons": "Highest monthly fee of the options. Only 15 transactions.",
-            "url": "https://www.rbcroyalbank.com/business/accounts/community-account.html",
-            "verdict": "GOOD IF PURSUING RBC SPONSORSHIP",
-            "verdict_color": GOLD,
-        },
-        {
-            "rank": "5",
-            "name": "Alterna Savings Credit Union",
-            "fee": "Likely $0-$4/month for community groups",
-            "transactions": "Varies by plan",
-            "etransfers": "Included in most plans",
-            "pros": "Ottawa-based credit union. Community-focused values align with BBS mission. Multiple Ottawa branches.",
-            "cons": "Less well-known. Need to visit branch to confirm exact club account terms.",
-            "url": "https://www.alterna.ca/",
-            "verdict": "WORTH EXPLORING - LOCAL OPTION",
-            "verdict_color": GOLD,
-        },
-        {
-            "rank": "6",
-            "name": "Desjardins (Ottawa Caisse)",
-            "fee": "~$7/month for business, may reduce for NFP",
-            "transactions": "Varies by plan",
-            "etransfers": "Included",
-            "pros": "Bilingual. Strong community focus. Desjardins is also a potential sponsor. Ottawa branch on Laurier Ave.",
-            "cons": "Higher base fee. Need to negotiate NFP rate in person. French-first institution.",
-            "url": "https://www.desjardins.com/ca/your-credit-union/ontario/branches/ottawa/index.jsp",
-            "verdict": "NICHE - GOOD IF BILINGUAL ANGLE MATTERS",
-            "verdict_color": GOLD,
-        },
-    ]
-
     for b in banks:
         # Rank + Name header
         rank_name = [[
             Paragraph(f"<b>#{b['rank']}</b>", num_style),
-            Paragraph(f"<b>{b['name']}</b>", ParagraphStyle('BN2', parent=bold_style, fontSize=12, leading=16, textColor=DARK_BG)),
+            Paragraph(f"<b>{b['name']}</b>", bank_name_style),
         ]]
-        rn_table = Table(rank_name, colWidths=[0.4*inch, 6.6*inch])
-        rn_table.setStyle(TableStyle([('VALIGN', (0, 0), (-1, -1), 'MIDDLE'), ('TOPPADDING', (0,0), (-1,-1), 4), ('BOTTOMPADDING', (0,0), (-1,-1), 2)]))
-        elements.append(rn_table)
+        elements.append(Table(rank_name, colWidths=[0.4*inch, 6.6*inch], style=table_styles["bank_rank"]))
 
         # Link
         elements.append(Paragraph(f'<link href="{b["url"]}">{b["url"]}</link>', link_style))
@@ -209,16 +129,15 @@ def build_pdf():
             elements.append(Paragraph(f"<b>{d[0]}:</b>  {d[1]}", small_style))
 
         elements.append(Spacer(1, 3))
-        elements.append(Paragraph(f"<b>Pros:</b> {b['pros']}", ParagraphStyle('PR', parent=small_style, textColor=GREEN)))
-        elements.append(Paragraph(f"<b>Cons:</b> {b['cons']}", ParagraphStyle('CN', parent=small_style, textColor=RED)))
+        elements.append(Paragraph(f"<b>Pros:</b> {b['pros']}", pros_style))
+        elements.append(Paragraph(f"<b>Cons:</b> {b['cons']}", cons_style))
         elements.append(Spacer(1, 4))
 
         # Verdict
-        verdict_style = ParagraphStyle('V', parent=small_style, fontSize=9, textColor=b["verdict_color"], fontName='Helvetica-Bold')
-        elements.append(Paragraph(f"VERDICT: {b['verdict']}", verdict_style))
+        elements.append(Paragraph(f"VERDICT: {b['verdict']}", verdict_style(b["verdict_color"])))
 
         elements.append(Spacer(1, 8))
-        elements.append(HRFlowable(width="100%", thickness=0.5, color=HexColor("#eeeeee"), spaceAfter=8))
+        elements.append(HRFlowable(width="100%", thickness=0.5, color=RULE_LIGHT, spaceAfter=8))
 
     # ===== COMPARISON TABLE =====
     elements.append(PageBreak())
@@ -227,33 +146,17 @@ def build_pdf():
 
     comp_headers = ["Bank", "Monthly Fee", "Transactions", "E-Transfers", "Verdict"]
     comp_data = [comp_headers]
-    comp_rows = [
-        ["TD NFP Plan", "$0 w/ $5K bal", "25/mo", "Free", "BEST"],
-        ["BMO Community", "$3.50/mo", "15/mo", "$1.50 ea", "RUNNER-UP"],
-        ["CIBC NFP", "$0 w/ $5K bal", "20/mo", "Free", "SOLID"],
-        ["RBC Community", "$6.95/mo", "15/mo", "Free", "IF RBC SPONSOR"],
-        ["Alterna CU", "~$0-$4/mo", "Varies", "Free", "LOCAL PICK"],
-        ["Desjardins", "~$7/mo", "Varies", "Free", "BILINGUAL"],
-    ]
     for r in comp_rows:
-        comp_data.append(r)
+        comp_data.append([r["bank"], r["fee"], r["transactions"], r["etransfers"], r["verdict"]])
 
     comp_table = Table(comp_data, colWidths=[1.2*inch, 1.2*inch, 1.0*inch, 1.0*inch, 1.6*inch])
-    comp_table.setStyle(TableStyle([
-        ('BACKGROUND', (0, 0), (-1, 0), HEADER_BG),
-        ('TEXTCOLOR', (0, 0), (-1, 0), white),
-        ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-        ('FONTSIZE', (0, 0), (-1, 0), 8),
-        ('FONTNAME', (0, 1), (-1, -1), 'Helvetica'),
-        ('FONTSIZE', (0, 1), (-1, -1), 8),
-        ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
-        ('TOPPADDING', (0, 0), (-1, -1), 5),
-        ('BOTTOMPADDING', (0, 0), (-1, -1), 5),
-        ('GRID', (0, 0), (-1, -1), 0.5, HexColor("#cccccc")),
+    # The recommended bank's row is highlighted; the shading alternates below it
+    comp_table.setStyle(comparison_table_style(
+        len(comp_data),
         ('BACKGROUND', (0, 1), (-1, 1), LIGHT_GREEN),
         ('FONTNAME', (0, 1), (-1, 1), 'Helvetica-Bold'),
-        *[('BACKGROUND', (0, i), (-1, i), ROW_ALT) for i in range(3, len(comp_data), 2)],
-    ]))
+        stripe_from=3,
+    ))
     elements.append(comp_table)
 
     # ===== ACTION STEPS =====
@@ -272,26 +175,21 @@ def build_pdf():
     ]
     for step_label, step_text in steps:
         step_data = [[
-            Paragraph(f"<b>{step_label}</b>", ParagraphStyle('SL', parent=small_style, textColor=ACCENT, fontName='Helvetica-Bold')),
+            Paragraph(f"<b>{step_label}</b>", step_label_style),
             Paragraph(step_text, body_style),
         ]]
-        step_table = Table(step_data, colWidths=[0.8*inch, 6.2*inch])
-        step_table.setStyle(TableStyle([
-            ('VALIGN', (0, 0), (-1, -1), 'TOP'),
-            ('TOPPADDING', (0, 0), (-1, -1), 2),
-            ('BOTTOMPADDING', (0, 0), (-1, -1), 2),
-        ]))
-        elements.append(step_table)
+        elements.append(Table(step_data, colWidths=[0.8*inch, 6.2*inch], style=table_styles["step"]))
 
     elements.append(Spacer(1, 16))
-    elements.append(HRFlowable(width="100%", thickness=1, color=HexColor("#cccccc"), spaceAfter=8))
+    elements.append(HRFlowable(width="100%", thickness=1, color=RULE_GREY, spaceAfter=8))
     elements.append(Paragraph("<b>Prepared by:</b> Nathan Amankwah, Finance Pillar", body_style))
     elements.append(Paragraph("<b>For:</b> Shaan Haque, President, BIPOC Business Society", body_style))
     elements.append(Paragraph("<b>Date:</b> February 2026", body_style))
-    elements.append(Paragraph("<b>Action Required:</b> Open new account ASAP so sponsorship deposits have somewhere to go", ParagraphStyle('AR', parent=body_style, textColor=RED, fontName='Helvetica-Bold')))
+    elements.append(Paragraph("<b>Action Required:</b> Open new account ASAP so sponsorship deposits have somewhere to go", styles["action"]))
 
     doc.build(elements)
-    print(f"PDF generated: {OUTPUT_PATH}")
+    print(f"PDF generated: {output_path}")
 
 if __name__ == "__main__":
-    build_pdf()
+    output, datasets = dataset_args(__doc__, ["banks", "bank_comparison"])
+    build_pdf(output or OUTPUT_PATH, **datasets)
@@ -0,0 +1,120 @@
+#!/usr/bin/env python3
+"""
+Generate the Budget vs Actual PDF from the UOSU funding applications
+"""
+
+from xml.sax.saxutils import escape
+import os
+
+from bank_statements import format_cents
+from budgets import ACTUAL, EXPENSES, PLANNED, REVENUE, load_budgets, variance
+from dataset_loader import dataset_args
+from pdf_profiling import profile_build
+
+OUTPUT_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "BBS-BUDGET-VS-ACTUAL.pdf")
+
+
+def money(cents):
+    return "-" if cents is None else format_cents(cents)
+
+
+def variance_text(planned, actual):
+    diff = variance(planned, actual)
+    if diff is None:
+        return "-"
+    pct = f" ({diff / planned:+.0%})" if planned else ""
+    return f"{'+' if diff > 0 else ''}{format_cents(diff)}{pct}"
+
+
+def section_total(categories, section, kind):
+    """Sum of a section's amounts for one kind, or None if no category has one."""
+    amounts = [a[kind] for (s, _), a in categories.items() if s == section and a[kind] is not None]
+    return sum(amounts) if amounts else None
+
+
+@profile_build("budget")
+def build_pdf(output_path=OUTPUT_PATH, budgets=None):
+    from reportlab.lib.pagesizes import letter
+    from reportlab.lib.units import inch
+    from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer, Table, HRFlowable
+    from pdf_theme import ACCENT, GREEN, RED, RULE_GREY, comparison_table_style, get_styles
+
+    budgets = budgets if budgets is not None else load_budgets()
+
+    doc = SimpleDocTemplate(output_path, pagesize=letter, rightMargin=0.6*inch, leftMargin=0.6*inch, topMargin=0.5*inch, bottomMargin=0.5*inch)
+    styles = get_styles()
+    heading_style = styles["heading_compact"]
+    section_style = styles["section_compact"]
+    body_style = styles["body"]
+    small_style = styles["small"]
+    callout_style = styles["callout"]
+
+    terms = list(budgets)
+    span = f"{terms[0]} to {terms[-1]}" if terms else "no budgets found"
+
+    elements = []
+
+    # ===== HEADER =====
+    elements.append(Paragraph("BBS BUDGET VS ACTUAL", styles["title"]))
+    elements.append(Paragraph(f"UOSU funding applications, {span} | BIPOC Business Society", styles["subtitle"]))
+    elements.append(Paragraph("Prepared by Nathan Amankwah, Finance Pillar", small_style))
+    elements.append(Spacer(1, 4))
+    elements.append(HRFlowable(width="100%", thickness=2, color=ACCENT, spaceAfter=12))
+
+    # ===== SUMMARY =====
+    elements.append(Paragraph("SUMMARY", heading_style))
+    elements.append(Paragraph(
+        "Planned figures come from each term's projected budget in the UOSU funding application; actual figures "
+        "from the term's actual budget statement. Variance is actual minus planned, so a positive expense variance "
+        "is an overspend. Terms with only one of the two show a dash.",
+        body_style
+    ))
+    missing = [t for t, c in budgets.items() if all(a[ACTUAL] is None for a in c.values())]
+    if missing:
+        elements.append(Spacer(1, 4))
+        elements.append(Paragraph(
+            f"No actual budget statement yet for {', '.join(missing)}. "
+            "Add the term's actual budget sheet to its funding application workbook to fill in the variance.",
+            callout_style
+        ))
+
+    summary = [["Term", "Planned revenue", "Actual revenue", "Planned expenses", "Actual expenses", "Expense variance"]]
+    for term, categories in budgets.items():
+        planned = section_total(categories, EXPENSES, PLANNED)
+        actual = section_total(categories, EXPENSES, ACTUAL)
+        summary.append([term, money(section_total(categories, REVENUE, PLANNED)),
+                        money(section_total(categories, REVENUE, ACTUAL)),
+                        money(planned), money(actual), variance_text(planned, actual)])
+    elements.append(Spacer(1, 8))
+    elements.append(Table(summary, colWidths=[1.1*inch, 1.15*inch, 1.15*inch, 1.2*inch, 1.2*inch, 1.5*inch],
+                          style=comparison_table_style(len(summary))))
+
+    # ===== PER TERM =====
+    for term, categories in budgets.items():
+        elements.append(Paragraph(term.upper(), section_style))
+        rows = [["Section", "Event / category", "Planned", "Actual", "Variance"]]
+        commands = []
+        for (section, category), amounts in categories.items():
+            planned, actual = amounts[PLANNED], amounts[ACTUAL]
+            rows.append([section, Paragraph(escape(category), small_style), money(planned), money(actual),
+                         variance_text(planned, actual)])
+            diff = variance(planned, actual)
+            if diff:
+                # Over budget on spending or short on revenue is bad news
+                worse = diff > 0 if section == EXPENSES else diff < 0
+                commands.append(('TEXTCOLOR', (4, len(rows) - 1), (4, len(rows) - 1), RED if worse else GREEN))
+        elements.append(Table(rows, colWidths=[0.9*inch, 2.8*inch, 1.1*inch, 1.1*inch, 1.4*inch],
+                              style=comparison_table_style(len(rows), ('ALIGN', (2, 1), (-1, -1), 'RIGHT'), *commands),
+                              repeatRows=1))
+
+    elements.append(Spacer(1, 16))
+    elements.append(HRFlowable(width="100%", thickness=1, color=RULE_GREY, spaceAfter=8))
+    elements.append(Paragraph("<b>Prepared by:</b> Nathan Amankwah, Finance Pillar", body_style))
+    elements.append(Paragraph("<b>Source:</b> BBS Finances 2024-2025/3. Financial Docs/UOSU", body_style))
+
+    doc.build(elements)
+    print(f"PDF generated: {output_path}")
+
+if __name__ == "__main__":
+    output, _ = dataset_args(__doc__, ())
+    build_pdf(output or OUTPUT_PATH)
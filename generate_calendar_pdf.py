@@ -0,0 +1,145 @@
+#!/usr/bin/env python3
+"""
+Generate the sponsor application calendar PDF: what is due in the next 30, 60 and 90 days
+"""
+
+from xml.sax.saxutils import escape
+from datetime import date, timedelta
+import argparse
+import os
+
+from deadlines import DeadlineIndex, collect, write_ics
+from pdf_profiling import profile_build
+
+OUTPUT_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "BBS-APPLICATION-CALENDAR.pdf")
+
+# Upper bounds, in days from today, of the calendar's sections
+HORIZONS = (30, 60, 90)
+
+# Days left at or under which a deadline is flagged
+URGENT_DAYS = 14
+
+
+def deadline_rows(upcoming, today, small_style):
+    """Table rows and extra style commands for a run of (due, Deadline)."""
+    from reportlab.platypus import Paragraph
+    from pdf_theme import RED
+
+    rows = [["Due", "Days", "Program", "Deadline", "Repeats"]]
+    commands = []
+    for due, d in upcoming:
+        label = escape(d.label_for(due))
+        opens = d.opens_for(due)
+        if opens:
+            label += f"<br/>Window {'opened' if opens <= today else 'opens'} {opens:%b %d, %Y}"
+        link = f'<link href="{escape(d.url)}">{escape(d.program)}</link>' if d.url else escape(d.program)
+        rows.append([f"{due:%a %b %d, %Y}", str((due - today).days), Paragraph(link, small_style),
+                     Paragraph(label, small_style), f"every {d.every} mo" if d.every else "-"])
+        if (due - today).days <= URGENT_DAYS:
+            commands.append(('TEXTCOLOR', (0, len(rows) - 1), (1, len(rows) - 1), RED))
+    return rows, commands
+
+
+@profile_build("calendar")
+def build_pdf(output_path=OUTPUT_PATH, today=None, horizons=HORIZONS, deadlines=None, undated=None):
+    from reportlab.lib.pagesizes import letter
+    from reportlab.lib.units import inch
+    from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer, Table, HRFlowable
+    from pdf_theme import ACCENT, RULE_GREY, comparison_table_style, get_styles
+
+    today = today or date.today()
+    if deadlines is None:
+        deadlines, undated = collect()
+    undated = undated or []
+    index = DeadlineIndex(deadlines, today)
+
+    doc = SimpleDocTemplate(output_path, pagesize=letter, rightMargin=0.6*inch, leftMargin=0.6*inch, topMargin=0.5*inch, bottomMargin=0.5*inch)
+    styles = get_styles()
+    heading_style = styles["heading_compact"]
+    section_style = styles["section_compact"]
+    body_style = styles["body"]
+    small_style = styles["small"]
+
+    elements = []
+
+    # ===== HEADER =====
+    elements.append(Paragraph("BBS APPLICATION CALENDAR", styles["title"]))
+    elements.append(Paragraph(f"Sponsor deadlines as of {today:%B %d, %Y} | BIPOC Business Society", styles["subtitle"]))
+    elements.append(Paragraph("Prepared by Nathan Amankwah, Finance Pillar", small_style))
+    elements.append(Spacer(1, 4))
+    elements.append(HRFlowable(width="100%", thickness=2, color=ACCENT, spaceAfter=12))
+
+    # ===== SUMMARY =====
+    elements.append(Paragraph("SUMMARY", heading_style))
+    upcoming = index.next()
+    recurring = sum(1 for d in deadlines if d.every)
+    summary = (f"{len(deadlines)} dated deadlines on file ({recurring} repeating), "
+               f"{len(undated)} programs with no date. ")
+    if upcoming:
+        due, d = upcoming
+        summary += f"Next due: <b>{escape(d.program)}</b> ({escape(d.label_for(due))}) on {due:%B %d, %Y}, in {(due - today).days} days."
+    else:
+        summary += "Nothing on file is still ahead of today."
+    elements.append(Paragraph(summary, body_style))
+    elements.append(Paragraph(
+        "Dates come from the sponsor datasets and the strategy doc. A month without a day is due on its last day; "
+        f"deadlines within {URGENT_DAYS} days are in red.",
+        small_style
+    ))
+
+    # ===== WINDOWS =====
+    start = 0
+    for horizon in horizons:
+        first = today + timedelta(days=start)
+        until = today + timedelta(days=horizon)
+        title = f"NEXT {horizon} DAYS" if start == 0 else f"{start} TO {horizon} DAYS"
+        elements.append(Paragraph(f"{title} ({first:%b %d} - {until:%b %d})", section_style))
+        window = [(due, d) for due, d in index.upcoming(until) if due >= first]
+        if window:
+            rows, commands = deadline_rows(window, today, small_style)
+            elements.append(Table(rows, colWidths=[1.3*inch, 0.5*inch, 2.7*inch, 1.8*inch, 0.9*inch],
+                                  style=comparison_table_style(len(rows), *commands), repeatRows=1))
+        else:
+            elements.append(Paragraph("Nothing due.", body_style))
+        start = horizon + 1
+
+    # ===== PASSED =====
+    passed = sorted((d for d in deadlines if d.next_due(today) is None), key=lambda d: d.due, reverse=True)
+    if passed:
+        elements.append(Paragraph("PASSED - CONFIRM THE NEXT CYCLE", section_style))
+        rows = [["Last due", "Program", "Deadline"]]
+        for d in passed:
+            rows.append([f"{d.due:%b %d, %Y}", Paragraph(escape(d.program), small_style), Paragraph(escape(d.label), small_style)])
+        elements.append(Table(rows, colWidths=[1.2*inch, 3.8*inch, 2.2*inch],
+                              style=comparison_table_style(len(rows)), repeatRows=1))
+
+    # ===== UNDATED =====
+    if undated:
+        elements.append(Paragraph("NO DATE ON FILE", section_style))
+        rows = [["Program", "What the records say"]]
+        for name, _, said in undated:
+            rows.append([Paragraph(escape(name), small_style), Paragraph(escape(said), small_style)])
+        elements.append(Table(rows, colWidths=[2.6*inch, 4.6*inch], style=comparison_table_style(len(rows)), repeatRows=1))
+
+    elements.append(Spacer(1, 16))
+    elements.append(HRFlowable(width="100%", thickness=1, color=RULE_GREY, spaceAfter=8))
+    elements.append(Paragraph("<b>Prepared by:</b> Nathan Amankwah, Finance Pillar", body_style))
+    elements.append(Paragraph("<b>Sources:</b> data/lola_sponsors.json, data/working_links.json, BBS-SPONSORSHIP-STRATEGY-2025-2026.md", body_style))
+
+    doc.build(elements)
+    print(f"PDF generated: {output_path}")
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("-o", "--output", default=OUTPUT_PATH, help="where to write the PDF (default: %(default)s)")
+    parser.add_argument("--today", type=date.fromisoformat, help="count from this day (YYYY-MM-DD; default: today)")
+    parser.add_argument("--ics", metavar="PATH", help="also write every deadline to an iCalendar file")
+    parser.add_argument("--profile", action="store_true", help="print where the build spent its time (as BBS_PROFILE=1)")
+    args = parser.parse_args()
+    if args.profile:
+        os.environ["BBS_PROFILE"] = "1"
+    deadlines, undated = collect()
+    build_pdf(args.output, args.today, deadlines=deadlines, undated=undated)
+    if args.ics:
+        write_ics(args.ics, deadlines)
+        print(f"Calendar written: {args.ics}")
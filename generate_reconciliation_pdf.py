@@ -0,0 +1,168 @@
+#!/usr/bin/env python3
+"""
+Generate the Bank Reconciliation PDF: chequing statements matched against the AETSA logbooks and Reimbursement Tracker
+"""
+
+from xml.sax.saxutils import escape
+import os
+
+from bank_statements import format_cents
+from dataset_loader import dataset_parser, parse_dataset_args
+from pdf_profiling import profile_build
+from reconcile import DEFAULT_WINDOW, reconcile_all
+
+OUTPUT_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "BBS-BANK-RECONCILIATION.pdf")
+
+
+def amount_text(side, i):
+    return f"{'+' if side.credit[i] else '-'}{format_cents(side.amount[i])}"
+
+
+def date_text(side, i):
+    day = side.date(i)
+    return day.isoformat() if day else "no date"
+
+
+@profile_build("reconciliation")
+def build_pdf(output_path=OUTPUT_PATH, window=DEFAULT_WINDOW, statements=None):
+    from reportlab.lib.pagesizes import letter
+    from reportlab.lib.units import inch
+    from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer, Table, HRFlowable
+    from pdf_theme import ACCENT, RULE_GREY, comparison_table_style, get_styles
+
+    logbook, tracker, skipped, statements = reconcile_all(window, statements)
+
+    doc = SimpleDocTemplate(output_path, pagesize=letter, rightMargin=0.6*inch, leftMargin=0.6*inch, topMargin=0.5*inch, bottomMargin=0.5*inch)
+    styles = get_styles()
+    heading_style = styles["heading_compact"]
+    section_style = styles["section_compact"]
+    body_style = styles["body"]
+    small_style = styles["small"]
+    callout_style = styles["callout"]
+    rec_style = styles["recommendation"]
+
+    def cell(text):
+        return Paragraph(escape(text), small_style)
+
+    def entry_table(side, indexes, widths):
+        data = [["Date", "Amount", "Description", "Source"]]
+        for i in indexes:
+            data.append([date_text(side, i), amount_text(side, i), cell(side.description[i]), cell(side.source[i])])
+        return Table(data, colWidths=widths, style=comparison_table_style(len(data)), repeatRows=1)
+
+    if statements:
+        period = f"{statements[0]['period_start']:%B %d, %Y} to {statements[-1]['period_end']:%B %d, %Y}"
+        as_of = f"{statements[-1]['period_end']:%B %Y}"
+    else:
+        period = as_of = "no statements found"
+
+    elements = []
+
+    # ===== HEADER =====
+    elements.append(Paragraph("BBS BANK RECONCILIATION", styles["title"]))
+    elements.append(Paragraph(f"Chequing statements {period} | BIPOC Business Society", styles["subtitle"]))
+    elements.append(Paragraph(f"Prepared by Nathan Amankwah, Finance Pillar | {as_of}", small_style))
+    elements.append(Spacer(1, 4))
+    elements.append(HRFlowable(width="100%", thickness=2, color=ACCENT, spaceAfter=12))
+
+    # ===== SUMMARY =====
+    elements.append(Paragraph("SUMMARY", heading_style))
+    elements.append(Paragraph(
+        f"Every transaction on the {len(statements)} chequing statements was matched against the AETSA logbooks "
+        f"and the Reimbursement Tracker by amount and direction, then by the nearest date within {window} days, "
+        "then by shared words in the description. Each ledger entry matches at most one bank transaction.",
+        body_style
+    ))
+    elements.append(Spacer(1, 4))
+    missing = len(logbook.unmatched_bank)
+    if missing or logbook.unmatched_ledger:
+        elements.append(Paragraph(
+            f"{missing} bank transaction{'s' if missing != 1 else ''} "
+            f"({format_cents(abs(logbook.unmatched_total(logbook.bank, logbook.unmatched_bank)))} net) "
+            f"{'have' if missing != 1 else 'has'} no logbook entry, and {len(logbook.unmatched_ledger)} logbook "
+            f"entr{'ies' if len(logbook.unmatched_ledger) != 1 else 'y'} in the statement period "
+            f"{'have' if len(logbook.unmatched_ledger) != 1 else 'has'} no bank transaction. "
+            "Each needs a receipt, a logbook line or a correction before the books are submitted.",
+            callout_style
+        ))
+    else:
+        elements.append(Paragraph("Every bank transaction has a matching logbook entry.", rec_style))
+
+    summary = [
+        ["", "Entries", "Matched", "Unmatched", "Outside statements"],
+        ["Bank transactions", len(logbook.bank), len(logbook.matches), len(logbook.unmatched_bank), "-"],
+        ["Logbook entries", len(logbook.ledger), len(logbook.matches), len(logbook.unmatched_ledger),
+         len(logbook.uncovered_ledger)],
+        ["Reimbursement Tracker", len(tracker.ledger), len(tracker.matches), len(tracker.unmatched_ledger),
+         len(tracker.uncovered_ledger)],
+    ]
+    elements.append(Spacer(1, 8))
+    elements.append(Table(summary, colWidths=[1.8*inch, 1.0*inch, 1.0*inch, 1.0*inch, 1.4*inch], style=comparison_table_style(len(summary))))
+
+    # ===== UNMATCHED =====
+    elements.append(Paragraph("BANK TRANSACTIONS WITH NO LOGBOOK ENTRY", section_style))
+    if logbook.unmatched_bank:
+        elements.append(entry_table(logbook.bank, logbook.unmatched_bank, [0.9*inch, 0.9*inch, 3.4*inch, 2.1*inch]))
+    else:
+        elements.append(Paragraph("None.", body_style))
+
+    elements.append(Paragraph("LOGBOOK ENTRIES WITH NO BANK TRANSACTION", section_style))
+    if logbook.unmatched_ledger:
+        elements.append(entry_table(logbook.ledger, logbook.unmatched_ledger, [0.9*inch, 0.9*inch, 2.6*inch, 2.9*inch]))
+    else:
+        elements.append(Paragraph("None.", body_style))
+    if logbook.uncovered_ledger:
+        elements.append(Spacer(1, 4))
+        elements.append(Paragraph(
+            f"{len(logbook.uncovered_ledger)} further logbook entries are dated outside {period} "
+            "and can't be checked until those statements are added.",
+            small_style
+        ))
+
+    elements.append(Paragraph("REIMBURSEMENT TRACKER", section_style))
+    tracker_rows = [["Date", "Amount", "Description", "Bank transaction"]]
+    for i, j, _, _ in tracker.matches:
+        tracker_rows.append([date_text(tracker.ledger, j), amount_text(tracker.ledger, j),
+                             cell(tracker.ledger.description[j]),
+                             cell(f"{date_text(tracker.bank, i)} {tracker.bank.description[i]}")])
+    for j in tracker.unmatched_ledger + tracker.uncovered_ledger:
+        tracker_rows.append([date_text(tracker.ledger, j), amount_text(tracker.ledger, j),
+                             cell(tracker.ledger.description[j]), cell("Not paid out yet")])
+    if len(tracker_rows) > 1:
+        elements.append(Table(tracker_rows, colWidths=[0.9*inch, 0.9*inch, 3.4*inch, 2.1*inch],
+                              style=comparison_table_style(len(tracker_rows)), repeatRows=1))
+    else:
+        elements.append(Paragraph("No reimbursements recorded.", body_style))
+
+    # ===== MATCHED =====
+    elements.append(Paragraph("MATCHED TRANSACTIONS", section_style))
+    matched = [["Bank date", "Amount", "Bank description", "Logbook entry", "Days"]]
+    for i, j, apart, _ in logbook.matches:
+        matched.append([date_text(logbook.bank, i), amount_text(logbook.bank, i), cell(logbook.bank.description[i]),
+                        cell(f"{logbook.ledger.description[j]} ({logbook.ledger.source[j]})"),
+                        "-" if apart is None else str(apart)])
+    if len(matched) > 1:
+        elements.append(Table(matched, colWidths=[0.9*inch, 0.9*inch, 2.0*inch, 3.0*inch, 0.5*inch],
+                              style=comparison_table_style(len(matched)), repeatRows=1))
+    else:
+        elements.append(Paragraph("None.", body_style))
+
+    if skipped:
+        elements.append(Paragraph("ROWS NOT READ", section_style))
+        for source, reason in skipped:
+            elements.append(Paragraph(f"•  {escape(source)}: {escape(reason)}", body_style))
+
+    elements.append(Spacer(1, 16))
+    elements.append(HRFlowable(width="100%", thickness=1, color=RULE_GREY, spaceAfter=8))
+    elements.append(Paragraph("<b>Prepared by:</b> Nathan Amankwah, Finance Pillar", body_style))
+    elements.append(Paragraph(f"<b>Date:</b> {as_of}", body_style))
+
+    doc.build(elements)
+    print(f"PDF generated: {output_path}")
+
+if __name__ == "__main__":
+    parser = dataset_parser(__doc__, ())
+    parser.add_argument("--window", type=int, default=DEFAULT_WINDOW,
+                        help="days a ledger date may differ from the bank date (default: %(default)s)")
+    args, _ = parse_dataset_args(parser, ())
+    build_pdf(args.output or OUTPUT_PATH, args.window)
@@ -3,30 +3,85 @@
 Generate PDF of VERIFIED WORKING sponsorship links for BBS 2025-2026
 """
 
-from reportlab.lib.pagesizes import letter
-from reportlab.lib.units import inch
-from reportlab.lib.colors import HexColor, black, white
-from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer, Table, TableStyle, HRFlowable, PageBreak
-from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
-from reportlab.lib.enums import TA_LEFT, TA_CENTER, TA_RIGHT
 import os
+from itertools import chain
+
+from dataset_loader import dataset_args, load_dataset
+from sponsor_summary import format_money, summarize
+from sponsor_catalog import apply_catalog
+from pdf_profiling import profile_build
 
 OUTPUT_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "BBS-WORKING-SPONSORSHIP-LINKS.pdf")
 
-# Colors
-DARK_BG = HexColor("#1a1a2e")
-ACCENT = HexColor("#e94560")
-HEADER_BG = HexColor("#16213e")
-ROW_ALT = HexColor("#f7f7f7")
-LINK_COLOR = HexColor("#0066cc")
-GREEN = HexColor("#2d6a4f")
-ORANGE = HexColor("#e76f51")
-RED = HexColor("#c1121f")
-LIGHT_GREEN = HexColor("#d8f3dc")
 
-def build_pdf():
-    doc = SimpleDocTemplate(
-        OUTPUT_PATH,
+def _day(when):
+    return f"{when:%B} {when.day}, {when.year}"
+
+
+def describe_checks(oldest, newest):
+    """("on <day>" or "between <day> and <day>", the same as a plain span, the month or months) for the check dates."""
+    if oldest.date() == newest.date():
+        return f"on {_day(newest)}", _day(newest), f"{newest:%B %Y}"
+    month = f"{newest:%B %Y}" if (oldest.year, oldest.month) == (newest.year, newest.month) else f"{oldest:%B %Y} - {newest:%B %Y}"
+    return f"between {_day(oldest)} and {_day(newest)}", f"{_day(oldest)} to {_day(newest)}", month
+
+def broken_links_section(broken, timed_out, intro):
+    """Yield the broken and timed-out link listings, one entry at a time."""
+    from reportlab.platypus import Paragraph, Spacer, HRFlowable, PageBreak
+    from pdf_theme import RED, get_styles
+
+    styles = get_styles()
+    small_style = styles["small"]
+
+    yield PageBreak()
+    yield Paragraph("BROKEN LINKS - NEED NEW URLs", styles["heading"])
+    yield HRFlowable(width="100%", thickness=2, color=RED, spaceAfter=10)
+    yield Paragraph(intro, styles["body"])
+    yield Spacer(1, 8)
+
+    for i, b in enumerate(broken, 1):
+        yield Paragraph(f"<b>{i}. {b['name']}</b>", styles["broken_name"])
+        yield Paragraph(f"Dead URL: {b['url']}", styles["dead_url"])
+        yield Paragraph(f"<b>How to find:</b> {b['suggestion']}", small_style)
+        yield Spacer(1, 8)
+
+    # Timed out
+    yield Spacer(1, 6)
+    yield Paragraph("TIMED OUT (LIKELY WORKING)", styles["section"])
+    for t in timed_out:
+        yield Paragraph(f"<b>{t['name']}</b> - {t['url']}", small_style)
+        yield Paragraph(f"{t['suggestion']}", small_style)
+        yield Spacer(1, 4)
+
+
+@profile_build("working-links")
+def build_pdf(output_path=OUTPUT_PATH, working_links=None, broken_links=None, timed_out_links=None, link_status=None):
+    from reportlab.lib.pagesizes import letter
+    from reportlab.lib.units import inch
+    from reportlab.lib.colors import HexColor, white
+    from reportlab.platypus import Paragraph, Spacer, Table, TableStyle, HRFlowable, PageBreak
+    from link_checker import check_dates, load_status, reclassify
+    from sponsor_blocks import LINK_CHECKLIST, sponsor_section
+    from streaming_doc import StreamingDocTemplate
+    from pdf_theme import ACCENT, GREEN, HEADER_BG, ROW_ALT, RULE_GREY, get_styles
+
+    working = working_links if working_links is not None else load_dataset("working_links")
+    broken = broken_links if broken_links is not None else load_dataset("broken_links")
+    timed_out = timed_out_links if timed_out_links is not None else load_dataset("timed_out_links")
+
+    # Sort links by the last run of link_checker.py, if there has been one
+    status = link_status if link_status is not None else load_status()
+    if status:
+        working, broken, timed_out = reclassify(working, broken, timed_out, status["links"], load_dataset("lola_sponsors"))
+        # Links served from the cache were checked earlier than the run; say so
+        checked_when, checked_on, checked_month = describe_checks(*check_dates(status))
+    else:
+        checked_when, checked_on, checked_month = "on February 20, 2026", "February 20, 2026", "February 2026"
+    working = apply_catalog(working)
+    summary = summarize(working)
+
+    doc = StreamingDocTemplate(
+        output_path,
         pagesize=letter,
         rightMargin=0.6*inch,
         leftMargin=0.6*inch,
@@ -34,267 +89,43 @@ def build_pdf():
         bottomMargin=0.5*inch
     )
 
-    styles = getSampleStyleSheet()
-
-    title_style = ParagraphStyle('CustomTitle', parent=styles['Title'], fontSize=22, leading=26, textColor=DARK_BG, spaceAfter=4, fontName='Helvetica-Bold')
-    subtitle_style = ParagraphStyle('Subtitle', parent=styles['Normal'], fontSize=12, leading=16, textColor=HexColor("#555555"), spaceAfter=2, fontName='Helvetica')
-    heading_style = ParagraphStyle('CustomHeading', parent=styles['Heading2'], fontSize=14, leading=18, textColor=DARK_BG, spaceBefore=16, spaceAfter=8, fontName='Helvetica-Bold')
-    section_style = ParagraphStyle('SectionHead', parent=styles['Heading3'], fontSize=11, leading=14, textColor=ACCENT, spaceBefore=12, spaceAfter=4, fontName='Helvetica-Bold')
-    body_style = ParagraphStyle('CustomBody', parent=styles['Normal'], fontSize=9.5, leading=13, textColor=HexColor("#333333"), spaceAfter=6, fontName='Helvetica')
-    small_style = ParagraphStyle('Small', parent=styles['Normal'], fontSize=8, leading=10, textColor=HexColor("#666666"), fontName='Helvetica')
-    link_style = ParagraphStyle('Link', parent=styles['Normal'], fontSize=8.5, leading=11, textColor=LINK_COLOR, fontName='Helvetica')
-    bold_style = ParagraphStyle('BoldBody', parent=body_style, fontName='Helvetica-Bold')
-    dead_style = ParagraphStyle('Dead', parent=small_style, textColor=RED)
-    status_good = ParagraphStyle('StatusGood', parent=small_style, textColor=GREEN, fontName='Helvetica-Bold')
+    styles = get_styles()
+    title_style = styles["title"]
+    subtitle_style = styles["subtitle"]
+    heading_style = styles["heading"]
+    body_style = styles["body"]
+    small_style = styles["small"]
 
     elements = []
 
     # HEADER
     elements.append(Paragraph("BBS VERIFIED SPONSORSHIP LINKS", title_style))
-    elements.append(Paragraph("15 Working Links + 8 Broken Links Identified | Audit Date: February 2026", subtitle_style))
+    elements.append(Paragraph(f"{summary.total.count} Working Links + {len(broken)} Broken Links Identified | Audit Date: {checked_month}", subtitle_style))
     elements.append(Paragraph("BIPOC Business Society | University of Ottawa | 2025-2026", small_style))
     elements.append(Spacer(1, 4))
     elements.append(HRFlowable(width="100%", thickness=2, color=ACCENT, spaceAfter=10))
 
     elements.append(Paragraph(
-        "All links below were verified on February 20, 2026. The 15 WORKING links are ready for Lola to research. "
-        "The 8 BROKEN links are listed at the end with suggested replacement URLs to find.",
+        f"All links below were verified {checked_when}. The {summary.total.count} WORKING links are ready for Lola to research. "
+        f"The {len(broken)} BROKEN links are listed at the end with suggested replacement URLs to find.",
         body_style
     ))
     elements.append(Spacer(1, 6))
 
     # ===== WORKING LINKS =====
-    working = [
-        {
-            "num": 1, "tier": "TIER 1 - BANKS (VERIFIED WORKING)",
-            "name": "RBC - Community Sponsorship (Sponsorium)",
-            "url": "https://www.rbc.com/community-social-impact/apply-for-funding/index.html",
-            "amount": "$3,000 - $10,000", "likelihood": "80%", "priority": "URGENT",
-            "notes": "Use Sponsorium platform. Select 'Organization' (NOT 'Event'). Year-round applications."
-        },
-        {
-            "num": 2,
-            "name": "RBC Future Launch - BIPOC Youth",
-            "url": "https://www.rbc.com/en/future-launch/about/bipoc-youth/",
-            "amount": "Partnership + $10K scholarships", "likelihood": "50%", "priority": "HIGH",
-            "notes": "$50M committed to BIPOC youth. Explore becoming a nominating community partner for RBC Black Youth Scholarships."
-        },
-        {
-            "num": 3,
-            "name": "TD Bank - Ready Commitment Funding",
-            "url": "https://www.td.com/ca/en/about-td/ready-commitment/funding",
-            "amount": "$2,000 - $5,000", "likelihood": "60%", "priority": "HIGH",
-            "notes": "4 intake deadlines/year. TD does NOT fund general operating - frame as a specific named program."
-        },
-        {
-            "num": 4,
-            "name": "CIBC - Community & Sponsorship Funding",
-            "url": "https://www.cibc.com/en/about-cibc/corporate-responsibility/community-and-sponsorship/funding-guidelines.html",
-            "amount": "$1,000 - $5,000", "likelihood": "50%", "priority": "MEDIUM",
-            "notes": "Application via Benevity platform. Contact CIBC Campus Relations (Ottawa) as well."
-        },
-        {
-            "num": 5, "tier": "TIER 2 - FOUNDATIONS & GRANTS (VERIFIED WORKING)",
-            "name": "Ontario Trillium Foundation - Youth Opportunities Fund",
-            "url": "https://otf.ca/our-grants/youth-opportunities-fund",
-            "amount": "$5,000 - $150,000/year", "likelihood": "55%", "priority": "URGENT",
-            "notes": "Prioritizes Indigenous and Black youth. Scale grants up to $150K/year for 2-3 years. May need fiscal sponsor. Contact: yof@otf.ca"
-        },
-        {
-            "num": 6,
-            "name": "OTF - Youth Innovations Scale Grant",
-            "url": "https://otf.ca/our-grants/youth-opportunities-fund/youth-innovations-scale-grant",
-            "amount": "Up to $150,000/year", "likelihood": "55%", "priority": "URGENT",
-            "notes": "Specific grant stream within OTF. Up to $150K/year for 2-3 years. Check if BBS qualifies as youth-led (ages 12-25)."
-        },
-        {
-            "num": 7,
-            "name": "Black Opportunity Fund (BOF)",
-            "url": "https://blackopportunityfund.ca/",
-            "amount": "$5,000 - $25,000", "likelihood": "60%", "priority": "HIGH",
-            "notes": "Created specifically for Black-led/Black-serving orgs. Focus: economic empowerment, capacity building."
-        },
-        {
-            "num": 8,
-            "name": "BlackNorth Initiative",
-            "url": "https://blacknorth.ca/",
-            "amount": "Connections to 500+ corporate sponsors", "likelihood": "55%", "priority": "MEDIUM",
-            "notes": "500+ companies pledged 3% of donations to Black communities. Register as community partner to access corporate network."
-        },
-        {
-            "num": 9,
-            "name": "Canadian Race Relations Foundation (CRRF)",
-            "url": "https://www.crrf-fcrr.ca/",
-            "amount": "$5,000 - $25,000", "likelihood": "40%", "priority": "MEDIUM",
-            "notes": "Government-funded. Check for open grant programs addressing racial equity in business/education."
-        },
-        {
-            "num": 10,
-            "name": "GrantWatch - BIPOC Grants Ontario",
-            "url": "https://ontario.grantwatch.com/cat/53/bipoc-grants.html",
-            "amount": "Various", "likelihood": "N/A - Research Tool", "priority": "HIGH",
-            "notes": "Grant AGGREGATOR. Scan the full list for Ontario-specific BIPOC funding BBS could apply to."
-        },
-        {
-            "num": 11, "tier": "TIER 3 - CORPORATE PARTNERSHIPS (VERIFIED WORKING)",
-            "name": "Shopify - Social Impact",
-            "url": "https://www.shopify.com/about/social-impact",
-            "amount": "$3,000 - $10,000", "likelihood": "70%", "priority": "HIGH",
-            "notes": "HQ in OTTAWA. Check community/campus partnership applications. Also check Shopify University Relations."
-        },
-        {
-            "num": 12,
-            "name": "Deloitte Canada - DEI & Community Impact",
-            "url": "https://www.deloitte.com/ca/en/who-we-are/story/impact/diversity-equity-inclusion-and-accessibility.html",
-            "amount": "$1,000 - $5,000", "likelihood": "75%", "priority": "HIGH",
-            "notes": "Find Ottawa office campus recruiter. Check student org sponsorship application process."
-        },
-        {
-            "num": 13,
-            "name": "Osler - Black Future Lawyers Commitment",
-            "url": "https://www.osler.com/en/about-us/media-centre/leading-law-firms-announce-1-75-million-long-term-commitment-to-black-future-lawyers/",
-            "amount": "$500 - $2,000", "likelihood": "70%", "priority": "MEDIUM",
-            "notes": "$1.75M commitment across 14 law firms. Check if business students can access funding. Get Ottawa student programs contact."
-        },
-        {
-            "num": 14,
-            "name": "Norton Rose Fulbright - DEI Actions",
-            "url": "https://www.nortonrosefulbright.com/en-ca/about/diversity-equity-and-inclusion/actions",
-            "amount": "$500 - $2,000", "likelihood": "70%", "priority": "MEDIUM",
-            "notes": "Has Ottawa office. Race Equity Council active. BlackNorth partner. Find Ottawa student recruitment coordinator."
-        },
-        {
-            "num": 15,
-            "name": "Vancouver Foundation - LEVEL BIPOC Grants (REFERENCE)",
-            "url": "https://www.vancouverfoundation.ca/grant-seekers/find-grants/level-bipoc-grants/",
-            "amount": "Up to $50,000 (BC only)", "likelihood": "0% - REFERENCE ONLY", "priority": "REFERENCE",
-            "notes": "BBS cannot apply (BC only). Study their application structure as a template for approaching Ontario foundations."
-        },
-    ]
-
-    # BROKEN LINKS
-    broken = [
-        {"name": "Scotiabank - ScotiaRISE Sponsorship", "url": "https://www.scotiabank.com/ca/en/about/responsibility/community/sponsorships.html", "suggestion": "Search 'Scotiabank community sponsorship Benevity' or visit scotiabank.com and navigate to Community > Sponsorships"},
-        {"name": "BMO - Community Sponsorships", "url": "https://www.bmo.com/en-ca/main/about-bmo/our-impact/communities/community-sponsorships/", "suggestion": "Email corporate.sponsorships@bmo.com directly or search 'BMO EMpower community grants'"},
-        {"name": "Desjardins - Community Fund", "url": "https://www.desjardins.com/ca/about-us/community/index.jsp", "suggestion": "Visit desjardins.com and navigate to About Us > Community, or contact local Ottawa Caisse branch"},
-        {"name": "Accenture Canada - Community Impact", "url": "https://www.accenture.com/ca-en/about/company/canada-community-impact", "suggestion": "Search 'Accenture Canada community impact 2026' or contact campus recruitment directly"},
-        {"name": "Bell Let's Talk Community Fund", "url": "https://letstalk.bell.ca/en/bell-lets-talk-community-fund", "suggestion": "Try letstalk.bell.ca/get-funding/ - program likely moved"},
-        {"name": "Rogers Community Grants", "url": "https://about.rogers.com/giving-back/community-grants/", "suggestion": "Visit about.rogers.com and check under 'Our Impact' for current grant programs"},
-        {"name": "TELUS Community Boards", "url": "https://www.telus.com/en/social-impact/giving-back/community-boards", "suggestion": "Search 'TELUS community grants program 2026' - renamed from Community Boards"},
-        {"name": "Microsoft Canada Philanthropies", "url": "https://www.microsoft.com/en-ca/about/philanthropies", "suggestion": "Search 'Microsoft Philanthropies Canada' or contact campus recruitment for in-kind sponsorship"},
-    ]
-
-    # Also note Ottawa Foundation timed out but likely working
-    timed_out = [
-        {"name": "Community Foundation of Ottawa", "url": "https://www.ottawafoundation.org/", "suggestion": "Site likely working but slow. Try visiting directly in browser."},
-    ]
-
-    current_tier = None
-    for s in working:
-        if "tier" in s and s["tier"] != current_tier:
-            current_tier = s["tier"]
-            elements.append(Spacer(1, 10))
-            elements.append(Paragraph(current_tier, heading_style))
-            elements.append(HRFlowable(width="100%", thickness=1.5, color=ACCENT, spaceAfter=8))
-
-        priority = s["priority"]
-        if "URGENT" in priority:
-            pri_color = RED
-        elif priority == "HIGH":
-            pri_color = ORANGE
-        else:
-            pri_color = GREEN
-
-        header_data = [[
-            Paragraph(f"<b>#{s['num']}</b>  <b>{s['name']}</b>", ParagraphStyle('SN', parent=bold_style, fontSize=10, leading=13)),
-            Paragraph(f"<b>{priority}</b>", ParagraphStyle('P', parent=small_style, fontSize=8, textColor=pri_color, alignment=TA_RIGHT)),
-        ]]
-        header_table = Table(header_data, colWidths=[5.2*inch, 1.8*inch])
-        header_table.setStyle(TableStyle([
-            ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
-            ('TOPPADDING', (0, 0), (-1, -1), 2),
-            ('BOTTOMPADDING', (0, 0), (-1, -1), 2),
-        ]))
-        elements.append(header_table)
-
-        elements.append(Paragraph(f"<b>STATUS: VERIFIED WORKING</b>", status_good))
-        elements.append(Paragraph(f'<link href="{s["url"]}">{s["url"]}</link>', link_style))
-
-        detail_data = [[
-            Paragraph(f"<b>Ask:</b> {s['amount']}", small_style),
-            Paragraph(f"<b>Likelihood:</b> {s['likelihood']}", small_style),
-        ]]
-        detail_table = Table(detail_data, colWidths=[3.5*inch, 3.5*inch])
-        detail_table.setStyle(TableStyle([
-            ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
-            ('TOPPADDING', (0, 0), (-1, -1), 1),
-            ('BOTTOMPADDING', (0, 0), (-1, -1), 1),
-        ]))
-        elements.append(detail_table)
-
-        elements.append(Paragraph(f"<b>Notes:</b> {s['notes']}", small_style))
-
-        # Checklist
-        elements.append(Spacer(1, 3))
-        check_data = [[
-            Paragraph("\u2610 Active?", small_style),
-            Paragraph("\u2610 Deadline?", small_style),
-            Paragraph("\u2610 Max $?", small_style),
-            Paragraph("\u2610 Docs needed?", small_style)
-        ]]
-        check_table = Table(check_data, colWidths=[1.75*inch, 1.75*inch, 1.75*inch, 1.75*inch])
-        check_table.setStyle(TableStyle([
-            ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
-            ('TOPPADDING', (0, 0), (-1, -1), 1),
-            ('BOTTOMPADDING', (0, 0), (-1, -1), 1),
-            ('BACKGROUND', (0, 0), (-1, -1), HexColor("#f8f8f8")),
-            ('BOX', (0, 0), (-1, -1), 0.5, HexColor("#dddddd")),
-        ]))
-        elements.append(check_table)
-
-        # Notes field
-        elements.append(Spacer(1, 2))
-        notes_data = [[Paragraph("<b>Lola's Findings:</b> _______________________________________________________________________________", small_style)]]
-        notes_table = Table(notes_data, colWidths=[7*inch])
-        notes_table.setStyle(TableStyle([
-            ('TOPPADDING', (0, 0), (-1, -1), 4),
-            ('BOTTOMPADDING', (0, 0), (-1, -1), 4),
-            ('BACKGROUND', (0, 0), (-1, -1), HexColor("#fffef5")),
-            ('BOX', (0, 0), (-1, -1), 0.5, HexColor("#dddddd")),
-        ]))
-        elements.append(notes_table)
-        elements.append(Spacer(1, 10))
-        elements.append(HRFlowable(width="100%", thickness=0.5, color=HexColor("#eeeeee"), spaceAfter=6))
+    # Sections are generated lazily and laid out as they arrive
+    sponsor_links = sponsor_section(working, LINK_CHECKLIST, status="VERIFIED WORKING")
 
     # ===== BROKEN LINKS SECTION =====
-    elements.append(PageBreak())
-    elements.append(Paragraph("BROKEN LINKS - NEED NEW URLs", heading_style))
-    elements.append(HRFlowable(width="100%", thickness=2, color=RED, spaceAfter=10))
-    elements.append(Paragraph(
-        "The following 8 links returned 404 errors as of February 20, 2026. "
-        "These programs may still exist under new URLs. Suggestions for finding updated links are provided.",
-        body_style
+    dead_links = broken_links_section(broken, timed_out, (
+        f"The following {len(broken)} links returned {'errors' if status else '404 errors'} when checked {checked_when}. "
+        "These programs may still exist under new URLs. Suggestions for finding updated links are provided."
     ))
-    elements.append(Spacer(1, 8))
-
-    for i, b in enumerate(broken, 1):
-        elements.append(Paragraph(f"<b>{i}. {b['name']}</b>", ParagraphStyle('BN', parent=bold_style, fontSize=9.5, textColor=RED)))
-        elements.append(Paragraph(f"Dead URL: {b['url']}", ParagraphStyle('DU', parent=small_style, textColor=HexColor("#999999"))))
-        elements.append(Paragraph(f"<b>How to find:</b> {b['suggestion']}", small_style))
-        elements.append(Spacer(1, 8))
-
-    # Timed out
-    elements.append(Spacer(1, 6))
-    elements.append(Paragraph("TIMED OUT (LIKELY WORKING)", section_style))
-    for t in timed_out:
-        elements.append(Paragraph(f"<b>{t['name']}</b> - {t['url']}", small_style))
-        elements.append(Paragraph(f"{t['suggestion']}", small_style))
-        elements.append(Spacer(1, 4))
 
     # ===== SUMMARY =====
-    elements.append(PageBreak())
-    elements.append(Paragraph("QUICK REFERENCE SUMMARY", heading_style))
-    elements.append(HRFlowable(width="100%", thickness=2, color=ACCENT, spaceAfter=10))
+    closing = [PageBreak()]
+    closing.append(Paragraph("QUICK REFERENCE SUMMARY", heading_style))
+    closing.append(HRFlowable(width="100%", thickness=2, color=ACCENT, spaceAfter=10))
 
     summary_headers = ["#", "Sponsor", "Status", "Ask Amount", "Priority"]
     summary_data = [summary_headers]
@@ -323,20 +154,28 @@ def build_pdf():
         ('TEXTCOLOR', (2, 1), (2, -1), GREEN),
         ('FONTNAME', (2, 1), (2, -1), 'Helvetica-Bold'),
     ]))
-    elements.append(summary_table)
-
-    elements.append(Spacer(1, 20))
-    elements.append(Paragraph(f"<b>Total Verified Working Links:</b> 15", body_style))
-    elements.append(Paragraph(f"<b>Total Broken Links:</b> 8 (need updated URLs)", body_style))
-    elements.append(Paragraph(f"<b>Total Potential Revenue (Working Links):</b> $30,000 - $250,000+", body_style))
-    elements.append(Spacer(1, 12))
-    elements.append(HRFlowable(width="100%", thickness=1, color=HexColor("#cccccc"), spaceAfter=8))
-    elements.append(Paragraph("<b>Audit conducted:</b> February 20, 2026", body_style))
-    elements.append(Paragraph("<b>For:</b> Nathan Amankwah - BBS Finance Pillar", body_style))
-    elements.append(Paragraph("<b>Assigned to:</b> Lola - Sponsorship Research", body_style))
-
-    doc.build(elements)
-    print(f"PDF generated: {OUTPUT_PATH}")
+    closing.append(summary_table)
+
+    closing.append(Spacer(1, 20))
+    closing.append(Paragraph(f"<b>Total Verified Working Links:</b> {summary.total.count}", body_style))
+    closing.append(Paragraph(f"<b>Total Broken Links:</b> {len(broken)} (need updated URLs)", body_style))
+    closing.append(Paragraph(f"<b>Total Potential Revenue (Working Links):</b> {summary.total.revenue_range()}", body_style))
+    closing.append(Paragraph(f"<b>Likelihood-Weighted Expected Value:</b> {format_money(summary.total.expected)}", body_style))
+    for tier, totals in summary.tiers.items():
+        closing.append(Paragraph(
+            f"<b>{tier or 'Untiered'}:</b> {totals.count} links | {totals.revenue_range()} | "
+            f"expected {format_money(totals.expected)}",
+            small_style
+        ))
+    closing.append(Spacer(1, 12))
+    closing.append(HRFlowable(width="100%", thickness=1, color=RULE_GREY, spaceAfter=8))
+    closing.append(Paragraph(f"<b>Audit conducted:</b> {checked_on}", body_style))
+    closing.append(Paragraph("<b>For:</b> Nathan Amankwah - BBS Finance Pillar", body_style))
+    closing.append(Paragraph("<b>Assigned to:</b> Lola - Sponsorship Research", body_style))
+
+    doc.build(chain(elements, sponsor_links, dead_links, closing))
+    print(f"PDF generated: {output_path}")
 
 if __name__ == "__main__":
-    build_pdf()
+    output, datasets = dataset_args(__doc__, ["working_links", "broken_links", "timed_out_links"])
+    build_pdf(output or OUTPUT_PATH, **datasets)
@@ -0,0 +1,80 @@
+"""
+On-disk cache of link check results
+
+Each URL's last status, final URL, validators (ETag / Last-Modified) and
+check time are kept in SQLite. Entries younger than the TTL are reused as-is;
+older working entries are revalidated with a conditional request, so a
+regeneration only touches sponsor sites whose pages may have changed.
+"""
+
+import os
+import sqlite3
+from datetime import datetime, timezone
+
+ROOT = os.path.dirname(os.path.abspath(__file__))
+CACHE_PATH = os.path.join(ROOT, ".link-cache.sqlite")
+DEFAULT_TTL = 24 * 3600
+
+FIELDS = ("url", "status", "http_status", "final_url", "error", "etag", "last_modified", "checked_at")
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS links (
+    url TEXT PRIMARY KEY,
+    status TEXT NOT NULL,
+    http_status INTEGER,
+    final_url TEXT,
+    error TEXT,
+    etag TEXT,
+    last_modified TEXT,
+    checked_at TEXT NOT NULL,
+    checked_ts REAL NOT NULL
+)
+"""
+
+
+def _timestamp(iso):
+    return datetime.fromisoformat(iso).timestamp()
+
+
+class LinkCache:
+    def __init__(self, path=CACHE_PATH):
+        self.path = path
+        self.db = sqlite3.connect(path)
+        self.db.execute(_SCHEMA)
+
+    def close(self):
+        self.db.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def _select(self, urls, where="", params=()):
+        found = {}
+        urls = list(urls)
+        # Stay under SQLite's bound-parameter limit
+        for i in range(0, len(urls), 500):
+            chunk = urls[i:i + 500]
+            sql = (f"SELECT {', '.join(FIELDS)} FROM links "
+                   f"WHERE url IN ({', '.join('?' * len(chunk))}){where}")
+            for row in self.db.execute(sql, chunk + list(params)):
+                found[row[0]] = dict(zip(FIELDS, row))
+        return found
+
+    def get_many(self, urls):
+        """Cached records for whichever of the URLs have one."""
+        return self._select(urls)
+
+    def fresh(self, urls, ttl=DEFAULT_TTL):
+        """Cached records checked within the last ``ttl`` seconds."""
+        cutoff = datetime.now(timezone.utc).timestamp() - ttl
+        return self._select(urls, " AND checked_ts >= ?", (cutoff,))
+
+    def store(self, records):
+        rows = [tuple(r.get(f) for f in FIELDS) + (_timestamp(r["checked_at"]),) for r in records]
+        with self.db:
+            self.db.executemany(
+                f"INSERT OR REPLACE INTO links ({', '.join(FIELDS)}, checked_ts) "
+                f"VALUES ({', '.join('?' * (len(FIELDS) + 1))})", rows)
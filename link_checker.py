@@ -0,0 +1,357 @@
+#!/usr/bin/env python3
+"""
+Check every sponsor URL concurrently and record which links work
+
+Results are written to .link-status.json, next to the link cache, which
+generate_working_links_pdf.py uses to sort links into working, broken and
+timed-out sections and to date the audit. The HTTP client is a small
+asyncio HTTP/1.1 implementation on the standard library: keep-alive
+connections are pooled per host, each host gets a concurrency limit, HEAD is
+tried first with a GET fallback, and redirects are followed.
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import ssl
+import time
+import urllib.parse
+from datetime import datetime, timezone
+
+from dataset_loader import iter_dataset
+from link_cache import DEFAULT_TTL, LinkCache
+
+ROOT = os.path.dirname(os.path.abspath(__file__))
+# A record of the last run, not hand-kept data: it lives with the caches, out of data/
+STATUS_PATH = os.path.join(ROOT, ".link-status.json")
+
+WORKING = "working"
+BROKEN = "broken"
+TIMED_OUT = "timed_out"
+
+# Datasets whose records carry a sponsor "url"
+URL_DATASETS = ("lola_sponsors", "working_links", "broken_links", "timed_out_links")
+
+USER_AGENT = "BBS-LinkChecker/1.0"
+REDIRECT_CODES = (301, 302, 303, 307, 308)
+MAX_HEADER_BYTES = 64 * 1024
+MAX_DRAIN_BYTES = 256 * 1024
+
+
+class _Host:
+    def __init__(self, limit):
+        self.idle = []
+        self.limit = asyncio.Semaphore(limit)
+
+
+class ConnectionPool:
+    """Keep-alive HTTP/1.1 connections, pooled and rate-limited per host."""
+
+    def __init__(self, per_host=4, ssl_context=None):
+        self.per_host = per_host
+        self.ssl_context = ssl_context or ssl.create_default_context()
+        self._hosts = {}
+
+    def _host(self, key):
+        host = self._hosts.get(key)
+        if host is None:
+            host = self._hosts[key] = _Host(self.per_host)
+        return host
+
+    async def request(self, method, url, timeout, headers=None):
+        """Send one request and return (status, headers); the body is discarded."""
+        parts = urllib.parse.urlsplit(url)
+        if parts.scheme not in ("http", "https") or not parts.hostname:
+            raise ValueError(f"unsupported URL {url!r}")
+        https = parts.scheme == "https"
+        port = parts.port or (443 if https else 80)
+        host = self._host((parts.scheme, parts.hostname, port))
+        target = (parts.path or "/") + (f"?{parts.query}" if parts.query else "")
+        head = [f"{method} {target} HTTP/1.1", f"Host: {parts.netloc.rpartition('@')[2]}",
+                f"User-Agent: {USER_AGENT}", "Accept: */*", "Accept-Encoding: identity", "Connection: keep-alive"]
+        head += [f"{k}: {v}" for k, v in (headers or {}).items()]
+        payload = ("\r\n".join(head) + "\r\n\r\n").encode("latin-1")
+
+        async with host.limit:
+            while True:
+                reused = bool(host.idle)
+                if reused:
+                    reader, writer = host.idle.pop()
+                else:
+                    reader, writer = await asyncio.wait_for(asyncio.open_connection(
+                        parts.hostname, port, ssl=self.ssl_context if https else None,
+                        limit=MAX_HEADER_BYTES), timeout)
+                try:
+                    status, resp_headers, reusable = await asyncio.wait_for(
+                        self._exchange(reader, writer, method, payload), timeout)
+                except (ConnectionError, asyncio.IncompleteReadError):
+                    writer.close()
+                    if reused:
+                        # The server closed an idle keep-alive connection; retry on a fresh one
+                        continue
+                    raise
+                except BaseException:
+                    writer.close()
+                    raise
+                if reusable:
+                    host.idle.append((reader, writer))
+                else:
+                    writer.close()
+                return status, resp_headers
+
+    @staticmethod
+    async def _exchange(reader, writer, method, payload):
+        writer.write(payload)
+        await writer.drain()
+        while True:
+            raw = await reader.readuntil(b"\r\n\r\n")
+            lines = raw.decode("latin-1").split("\r\n")
+            version, code = lines[0].split(" ", 2)[:2]
+            status = int(code)
+            headers = {}
+            for line in lines[1:]:
+                if ":" in line:
+                    name, value = line.split(":", 1)
+                    headers[name.strip().lower()] = value.strip()
+            if not 100 <= status < 200:
+                break
+
+        reusable = version == "HTTP/1.1" and headers.get("connection", "").lower() != "close"
+        if method == "HEAD" or status in (204, 304):
+            pass
+        elif "chunked" in headers.get("transfer-encoding", "").lower():
+            reusable = reusable and await _drain_chunked(reader)
+        elif "content-length" in headers:
+            length = int(headers["content-length"])
+            if length <= MAX_DRAIN_BYTES:
+                await reader.readexactly(length)
+            else:
+                reusable = False
+        else:
+            reusable = False
+        return status, headers, reusable
+
+    def close(self):
+        for host in self._hosts.values():
+            for _, writer in host.idle:
+                writer.close()
+            host.idle.clear()
+
+
+async def _drain_chunked(reader):
+    """Read a chunked body; returns False (drop the connection) if it is too large."""
+    total = 0
+    while True:
+        size = int((await reader.readuntil(b"\r\n")).split(b";")[0], 16)
+        total += size
+        if total > MAX_DRAIN_BYTES:
+            return False
+        await reader.readexactly(size + 2)
+        if size == 0:
+            return True
+
+
+def now_iso():
+    return datetime.now(timezone.utc).isoformat(timespec="seconds")
+
+
+async def _fetch(pool, url, timeout, max_redirects, headers=None):
+    """Resolve a URL through redirects; returns (status, final_url, headers)."""
+    for _ in range(max_redirects + 1):
+        status, resp_headers = await pool.request("HEAD", url, timeout, headers)
+        if status >= 400:
+            # Plenty of servers reject or mishandle HEAD; ask again with GET
+            status, resp_headers = await pool.request("GET", url, timeout, headers)
+        if status in REDIRECT_CODES and "location" in resp_headers:
+            url = urllib.parse.urljoin(url, resp_headers["location"])
+            continue
+        return status, url, resp_headers
+    raise ValueError(f"more than {max_redirects} redirects")
+
+
+def classify(status):
+    return WORKING if status < 400 else BROKEN
+
+
+async def check_url(pool, url, timeout=10.0, max_redirects=5, previous=None):
+    """Check one URL and return its status record.
+
+    ``previous`` is the URL's last cached record; if it was working and
+    carried validators, the check is a conditional request against its final
+    URL and a 304 simply re-dates the old record.
+    """
+    now = now_iso()
+    headers = {}
+    if previous and previous["status"] == WORKING:
+        if previous.get("etag"):
+            headers["If-None-Match"] = previous["etag"]
+        if previous.get("last_modified"):
+            headers["If-Modified-Since"] = previous["last_modified"]
+    target = previous["final_url"] if headers else url
+
+    result = {"url": url, "status": BROKEN, "http_status": None, "final_url": url, "error": None,
+              "etag": None, "last_modified": None, "checked_at": now}
+    try:
+        status, final_url, resp_headers = await _fetch(pool, target, timeout, max_redirects, headers)
+    except asyncio.TimeoutError:
+        result.update(status=TIMED_OUT, error=f"no response within {timeout:g}s")
+    except (OSError, ValueError, asyncio.IncompleteReadError, asyncio.LimitOverrunError) as exc:
+        result.update(error=str(exc) or type(exc).__name__)
+    else:
+        if status == 304 and headers:
+            return dict(previous, checked_at=now)
+        result.update(status=classify(status), http_status=status, final_url=final_url,
+                      etag=resp_headers.get("etag"), last_modified=resp_headers.get("last-modified"))
+    return result
+
+
+async def check_links(urls, concurrency=32, per_host=4, timeout=10.0, max_redirects=5, cache=None, ttl=DEFAULT_TTL):
+    """Check the URLs concurrently; returns {url: status record}.
+
+    With a LinkCache, URLs checked within ``ttl`` seconds are answered from
+    the cache, the rest are (re)validated and written back.
+    """
+    urls = list(dict.fromkeys(urls))
+    fresh = cache.fresh(urls, ttl) if cache else {}
+    stale = [url for url in urls if url not in fresh]
+    previous = cache.get_many(stale) if cache else {}
+
+    pool = ConnectionPool(per_host)
+    gate = asyncio.Semaphore(concurrency)
+
+    async def one(url):
+        async with gate:
+            return await check_url(pool, url, timeout, max_redirects, previous.get(url))
+
+    try:
+        results = await asyncio.gather(*(one(url) for url in stale))
+    finally:
+        pool.close()
+    if cache:
+        cache.store(results)
+
+    checked = {r["url"]: r for r in results}
+    return {url: fresh.get(url) or checked[url] for url in urls}
+
+
+def collect_urls(datasets=URL_DATASETS):
+    """Every distinct sponsor URL across the datasets, in first-seen order."""
+    urls = {}
+    for name in datasets:
+        for record in iter_dataset(name):
+            urls.setdefault(record["url"], None)
+    return list(urls)
+
+
+def write_status(links, path=STATUS_PATH):
+    """Write the status file; its dates are the newest and oldest per-link check times."""
+    checked = sorted(r["checked_at"] for r in links.values()) or [now_iso()]
+    data = {"checked_at": checked[-1], "oldest_check": checked[0], "links": links}
+    tmp = path + ".tmp"
+    with open(tmp, "w", encoding="utf-8") as fh:
+        json.dump(data, fh, indent=2)
+        fh.write("\n")
+    os.replace(tmp, path)
+
+
+def load_status(path=STATUS_PATH):
+    """The last link check, or None if links have never been checked."""
+    try:
+        with open(path, encoding="utf-8") as fh:
+            return json.load(fh)
+    except FileNotFoundError:
+        return None
+
+
+def check_dates(status):
+    """(oldest, newest) per-link check times in a status file, as aware datetimes.
+
+    Cache hits keep their earlier check time, so the oldest can be up to the
+    cache TTL before the run that wrote the file.
+    """
+    newest = datetime.fromisoformat(status["checked_at"])
+    # Status files written before oldest_check was recorded
+    oldest = datetime.fromisoformat(status.get("oldest_check") or status["checked_at"])
+    return oldest, newest
+
+
+def _suggestion(result):
+    if result["status"] == TIMED_OUT:
+        return "Site did not respond in time. Try visiting directly in browser."
+    if result["http_status"]:
+        return f"Returned HTTP {result['http_status']} when checked. Search the sponsor's site for the current page."
+    return f"Could not connect ({result['error']}). Check the address or search for the sponsor's current page."
+
+
+RECOVERED_TIER = "RECOVERED LINKS (VERIFIED WORKING)"
+
+
+def reclassify(working, broken, timed_out, links, sponsors=()):
+    """Re-sort the hand-maintained link lists using checked statuses.
+
+    Links without a status keep their current section. Links that now fail
+    move to the broken/timed-out lists with a suggestion based on the
+    failure. Broken links that now work are promoted using their full sponsor
+    record (looked up by URL in ``sponsors``) under a "recovered" tier.
+    Working entries are renumbered and every entry carries its tier.
+    """
+    full = {s["url"]: s for s in sponsors}
+    buckets = {WORKING: [], BROKEN: [], TIMED_OUT: []}
+
+    tier = None
+    for s in working:
+        tier = s.get("tier", tier)
+        result = links.get(s["url"])
+        if result is None or result["status"] == WORKING:
+            buckets[WORKING].append(dict(s, tier=tier))
+        else:
+            buckets[result["status"]].append({"name": s["name"], "url": s["url"], "suggestion": _suggestion(result)})
+
+    for state, records in ((BROKEN, broken), (TIMED_OUT, timed_out)):
+        for b in records:
+            result = links.get(b["url"])
+            new_state = result["status"] if result else state
+            if new_state == WORKING:
+                base = full.get(b["url"]) or {"name": b["name"], "url": b["url"], "amount": "Unknown",
+                                              "likelihood": "N/A", "priority": "MEDIUM", "notes": b["suggestion"]}
+                buckets[WORKING].append(dict(base, tier=RECOVERED_TIER))
+            elif new_state == state:
+                buckets[state].append(b)
+            else:
+                buckets[new_state].append(dict(b, suggestion=_suggestion(result)))
+
+    for num, s in enumerate(buckets[WORKING], 1):
+        s["num"] = num
+    return buckets[WORKING], buckets[BROKEN], buckets[TIMED_OUT]
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("urls", nargs="*", help="URLs to check (default: every URL in the sponsor datasets)")
+    parser.add_argument("--output", default=STATUS_PATH, help="status file to write (default: .link-status.json)")
+    parser.add_argument("--timeout", type=float, default=10.0, help="seconds per request (default: 10)")
+    parser.add_argument("--concurrency", type=int, default=32, help="links checked at once (default: 32)")
+    parser.add_argument("--per-host", type=int, default=4, help="simultaneous requests per host (default: 4)")
+    parser.add_argument("--max-redirects", type=int, default=5)
+    parser.add_argument("--ttl", type=float, default=DEFAULT_TTL / 3600,
+                        help="hours a cached result stays valid before it is revalidated (default: 24)")
+    parser.add_argument("--no-cache", action="store_true", help="check every link without the link cache")
+    args = parser.parse_args()
+
+    urls = args.urls or collect_urls()
+    cache = None if args.no_cache else LinkCache()
+    cached = len(cache.fresh(urls, args.ttl * 3600)) if cache else 0
+    start = time.perf_counter()
+    try:
+        links = asyncio.run(check_links(urls, args.concurrency, args.per_host, args.timeout, args.max_redirects,
+                                        cache, args.ttl * 3600))
+    finally:
+        if cache:
+            cache.close()
+    elapsed = time.perf_counter() - start
+    write_status(links, args.output)
+
+    counts = {state: sum(1 for r in links.values() if r["status"] == state) for state in (WORKING, BROKEN, TIMED_OUT)}
+    print(f"Checked {len(links)} links ({cached} from cache) in {elapsed:.1f}s: {counts[WORKING]} working, "
+          f"{counts[BROKEN]} broken, {counts[TIMED_OUT]} timed out -> {args.output}")
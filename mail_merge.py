@@ -0,0 +1,125 @@
+#!/usr/bin/env python3
+"""
+Mail-merge the sponsor research task sheet: one personalized PDF per volunteer
+
+Sponsors are partitioned by their "assignee" field. Sponsors without one are
+dealt out to the --volunteers named on the command line in contiguous runs,
+so each person gets whole stretches of a tier, or all go to Lola when nobody
+is named. Every sheet is generate_lola_pdf's task sheet with the person's
+own sponsors, name and summary table.
+
+The dataset is loaded once and partitioned here. The smallest sheet is then
+rendered in this process, which builds the sponsor catalog (the datasets and
+the strategy doc merged, see sponsor_catalog), the style registry and the
+sheet's fixed paragraphs; the worker processes forked after it inherit them
+and only lay out and draw the remaining people's sheets.
+
+    python mail_merge.py --volunteers Amara Ben Chloe
+    python mail_merge.py --lola-sponsors assigned.csv --output-dir handouts -j 4
+"""
+
+import argparse
+import multiprocessing
+import os
+import re
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+from dataset_loader import DEFAULT_RESEARCHER, load_dataset
+
+ROOT = os.path.dirname(os.path.abspath(__file__))
+OUTPUT_DIR = os.path.join(ROOT, "research-tasks")
+
+
+def partition(sponsors, volunteers=(), default=DEFAULT_RESEARCHER):
+    """{person: [sponsor, ...]} in dataset order, explicit assignees first, then ``volunteers``.
+
+    The data files name a tier only on its first sponsor. Each sponsor handed
+    out carries its tier, so a share that starts partway through one still
+    opens with the tier's heading.
+    """
+    people = {}
+    unassigned = []
+    tier = None
+    for s in sponsors:
+        tier = s.get("tier") or tier
+        if tier and not s.get("tier"):
+            s = dict(s, tier=tier)
+        if s.get("assignee"):
+            people.setdefault(s["assignee"], []).append(s)
+        else:
+            unassigned.append(s)
+    if unassigned:
+        volunteers = list(volunteers) or [default]
+        size, extra = divmod(len(unassigned), len(volunteers))
+        start = 0
+        for i, name in enumerate(volunteers):
+            end = start + size + (i < extra)
+            if end > start:
+                people.setdefault(name, []).extend(unassigned[start:end])
+            start = end
+    return people
+
+
+def output_path(name, output_dir=None):
+    slug = re.sub(r"[^A-Za-z0-9]+", "-", name).strip("-").upper()
+    return os.path.join(output_dir or OUTPUT_DIR, f"SPONSORSHIP-RESEARCH-TASK-{slug}.pdf")
+
+
+def render(name, sponsors, output_dir=None):
+    import generate_lola_pdf
+    output = output_path(name, output_dir)
+    start = time.perf_counter()
+    generate_lola_pdf.build_pdf(output, lola_sponsors=sponsors, researcher=name)
+    return name, output, len(sponsors), time.perf_counter() - start
+
+
+def mail_merge(sponsors, volunteers=(), jobs=None, output_dir=None):
+    """Render one task sheet per person and return [(name, output, sponsors, seconds)] in partition order."""
+    people = partition(sponsors, volunteers)
+    paths = {}
+    for name in people:
+        path = output_path(name, output_dir)
+        if path in paths.values():
+            raise ValueError(f"{name!r} and {next(n for n, p in paths.items() if p == path)!r} would share {path}")
+        paths[name] = path
+    os.makedirs(output_dir or OUTPUT_DIR, exist_ok=True)
+    if not people:
+        return []
+
+    names = list(people)
+    # The smallest sheet warms every per-process cache the workers then
+    # inherit; the rest go largest first so no long sheet starts last
+    by_size = sorted(names, key=lambda name: len(people[name]))
+    results = [render(by_size[0], people[by_size[0]], output_dir)]
+    rest = by_size[:0:-1]
+    jobs = min(jobs or os.cpu_count() or 1, len(rest)) if rest else 0
+    if jobs <= 1:
+        results.extend(render(name, people[name], output_dir) for name in rest)
+    else:
+        methods = multiprocessing.get_all_start_methods()
+        ctx = multiprocessing.get_context("fork" if "fork" in methods else None)
+        with ProcessPoolExecutor(max_workers=jobs, mp_context=ctx) as pool:
+            futures = [pool.submit(render, name, people[name], output_dir) for name in rest]
+            for future in as_completed(futures):
+                results.append(future.result())
+    return sorted(results, key=lambda r: names.index(r[0]))
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--lola-sponsors", metavar="PATH",
+                        help="sponsor records, optionally with an assignee field (default: data/lola_sponsors.json)")
+    parser.add_argument("--volunteers", nargs="+", default=(), metavar="NAME",
+                        help=f"people to share the unassigned sponsors between (default: {DEFAULT_RESEARCHER})")
+    parser.add_argument("--output-dir", help=f"where to write the sheets (default: {os.path.relpath(OUTPUT_DIR, ROOT)})")
+    parser.add_argument("-j", "--jobs", type=int, help="worker processes (default: one per CPU)")
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    results = mail_merge(load_dataset("lola_sponsors", args.lola_sponsors), args.volunteers, args.jobs, args.output_dir)
+    print()
+    width = max((len(name) for name, _, _, _ in results), default=0)
+    for name, output, count, seconds in results:
+        print(f"{name:<{width}}  {count:3d} sponsors  {seconds:6.2f}s  {os.path.basename(output)}")
+    print(f"{len(results)} sheet(s) in {time.perf_counter() - start:.2f}s")
@@ -0,0 +1,132 @@
+"""
+Paragraphs for markup that repeats from record to record, parsed and wrapped once
+
+The sponsor blocks repeat a lot of text verbatim: the checklist cells, the
+findings line, "STATUS: VERIFIED WORKING", the priority labels, and often
+the same ask or likelihood. A plain Paragraph parses its markup when it is
+made and breaks its lines on every wrap(); a Table wraps each cell at
+least twice, once to size it and once to draw it. paragraph() keeps both
+results. The parsed fragments are keyed by (text, style) and the line
+breaks by (text, style, width). Each call still returns a new Paragraph,
+because top-level flowables must never be shared (see sponsor_blocks).
+
+Cached line breaks are shared between paragraphs, and reportlab's split()
+edits the line fragments it hands on to the second half. A paragraph that
+gets split therefore breaks its own lines again from freshly parsed
+fragments first. Both caches are LRU-bounded, so a list of unique notes
+can't grow them without limit. stats() and report() give the hit rates,
+and profiled builds (BBS_PROFILE=1) print them too.
+"""
+
+import sys
+from collections import OrderedDict
+
+from reportlab.platypus import Paragraph
+
+PARSE_CACHE_SIZE = 4096
+WRAP_CACHE_SIZE = 4096
+
+# What Paragraph.wrap() leaves on the instance; restored on a cache hit
+WRAP_STATE = ("width", "height", "blPara", "frags", "_wrapWidths", "_width_max", "_hyphenations", "_splitLongWordCount")
+
+
+class _LRU:
+    __slots__ = ("maxsize", "data", "hits", "misses")
+
+    def __init__(self, maxsize):
+        self.maxsize = maxsize
+        self.data = OrderedDict()
+        self.hits = self.misses = 0
+
+    def get(self, key):
+        value = self.data.get(key)
+        if value is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+            self.data.move_to_end(key)
+        return value
+
+    def put(self, key, value):
+        self.data[key] = value
+        if len(self.data) > self.maxsize:
+            self.data.popitem(last=False)
+
+
+_parses = _LRU(PARSE_CACHE_SIZE)
+_wraps = _LRU(WRAP_CACHE_SIZE)
+
+
+class CachedParagraph(Paragraph):
+    """A Paragraph that takes its line breaks from the wrap cache when the same text and style have been wrapped at this width."""
+
+    # Set by paragraph(); the halves split() makes have none and wrap as usual
+    _key = None
+    _parsed = None
+    # True while the wrap state is the cache's copy rather than our own
+    _shared = False
+
+    def wrap(self, availWidth, availHeight):
+        if self._key is None:
+            return super().wrap(availWidth, availHeight)
+        key = self._key + (availWidth,)
+        state = _wraps.get(key)
+        if state is None:
+            width, height = super().wrap(availWidth, availHeight)
+            if availWidth <= 0 or width != availWidth:
+                # Too narrow to lay out at all; nothing worth keeping
+                return width, height
+            _wraps.put(key, {name: self.__dict__[name] for name in WRAP_STATE if name in self.__dict__})
+        else:
+            self.__dict__.update(state)
+        self._shared = True
+        return self.width, self.height
+
+    def split(self, availWidth, availHeight):
+        if self._shared:
+            self.frags = self._parsed
+            self._shared = False
+            Paragraph.wrap(self, availWidth, availHeight)
+        return super().split(availWidth, availHeight)
+
+
+def paragraph(text, style):
+    """A new Paragraph of ``text`` in ``style``, parsed once per (text, style) and wrapped once per width."""
+    key = (text, style)
+    frags = _parses.get(key)
+    if frags is None:
+        frags = Paragraph(text, style).frags
+        _parses.put(key, frags)
+    p = CachedParagraph(text, style, frags=frags)
+    p._key = key
+    p._parsed = frags
+    return p
+
+
+def stats():
+    """{"parse"|"wrap": (hits, misses, entries)} since the process started or clear() was called."""
+    return {name: (cache.hits, cache.misses, len(cache.data)) for name, cache in (("parse", _parses), ("wrap", _wraps))}
+
+
+def clear():
+    for cache in (_parses, _wraps):
+        cache.data.clear()
+        cache.hits = cache.misses = 0
+
+
+def format_stats(before=None, after=None):
+    """Lines describing the hit rates between two stats() snapshots (default: since the start)."""
+    after = after or stats()
+    lines = [f"  {'paragraph cache':<18} {'hits':>8} {'misses':>8} {'hit rate':>9} {'entries':>8}"]
+    for name, (hits, misses, entries) in after.items():
+        if before:
+            hits -= before[name][0]
+            misses -= before[name][1]
+        total = hits + misses
+        rate = f"{hits / total:.1%}" if total else "-"
+        lines.append(f"  {name:<18} {hits:8d} {misses:8d} {rate:>9} {entries:8d}")
+    return lines
+
+
+def report(file=None):
+    (file or sys.stderr).write("\n".join(format_stats()) + "\n")
@@ -0,0 +1,196 @@
+"""
+Optional per-phase timing of a build_pdf() call
+
+Set BBS_PROFILE=1 (or pass --profile to a generator or build_all.py) and
+every build_pdf() decorated with @profile_build prints a breakdown to
+stderr of where its time went:
+
+    styles      building the paragraph/table style registry
+    flowables   loading data and constructing flowables, outside doc.build()
+                or pulled from a streaming generator during it
+    layout      wrap() and split() - where Table sizing shows up
+    draw        drawing flowables onto the canvas
+    serialize   finishing pages and writing the PDF file
+    build       the rest of doc.build(): frames, page templates, bookkeeping
+
+with layout and draw also split by flowable type, and the paragraph cache's
+hit rates for the build when it is in use. Times are exclusive - a Table's
+wrap() doesn't count the Paragraphs wrapped inside it - so the phases add up
+to the total. Set BBS_PROFILE_DUMP=DIR as well to save a
+cProfile dump per document (DIR/<name>.prof, readable by pstats, snakeviz or
+flameprof).
+
+The hooks are patched in only for the duration of a profiled build; with
+profiling off build_pdf() runs untouched.
+"""
+
+import cProfile
+import functools
+import os
+import sys
+from collections import defaultdict
+from time import perf_counter
+
+ENV_VAR = "BBS_PROFILE"
+DUMP_ENV_VAR = "BBS_PROFILE_DUMP"
+
+PHASES = ("styles", "flowables", "layout", "draw", "serialize", "build")
+
+# Flowable methods timed per type, and the phase they count towards
+FLOWABLE_METHODS = {"wrap": "layout", "split": "layout", "draw": "draw"}
+
+# Frames of the timed calls in progress: [start, time spent in timed children]
+_stack = []
+_active = None
+
+
+def enabled():
+    return os.environ.get(ENV_VAR, "") not in ("", "0")
+
+
+class BuildProfile:
+    def __init__(self, name):
+        self.name = name
+        self.total = 0.0
+        self.phases = defaultdict(float)
+        # (phase, flowable type) -> [seconds, calls]
+        self.types = defaultdict(lambda: [0.0, 0])
+        # paragraph_cache.format_stats() for the build, if it used the cache
+        self.cache_lines = []
+
+    def add(self, phase, key, seconds):
+        self.phases[phase] += seconds
+        if key is not None:
+            entry = self.types[(phase, key)]
+            entry[0] += seconds
+            entry[1] += 1
+
+
+def _timed(func, phase, per_type=False):
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        profile = _active
+        if profile is None:
+            return func(*args, **kwargs)
+        frame = [perf_counter(), 0.0]
+        _stack.append(frame)
+        try:
+            return func(*args, **kwargs)
+        finally:
+            _stack.pop()
+            elapsed = perf_counter() - frame[0]
+            if _stack:
+                _stack[-1][1] += elapsed
+            profile.add(phase, type(args[0]).__name__ if per_type else None, elapsed - frame[1])
+    wrapper.__profiled__ = func
+    return wrapper
+
+
+def _subclasses(cls):
+    seen = []
+    todo = [cls]
+    while todo:
+        current = todo.pop()
+        seen.append(current)
+        todo.extend(c for c in current.__subclasses__() if c not in seen)
+    return seen
+
+
+def _hook_points():
+    """(owner, attribute, phase, per_type) for everything timed, found at install time."""
+    from reportlab.pdfgen.canvas import Canvas
+    from reportlab.platypus import Flowable
+    from reportlab.platypus.doctemplate import BaseDocTemplate
+    points = []
+    for cls in _subclasses(Flowable):
+        for method, phase in FLOWABLE_METHODS.items():
+            if callable(cls.__dict__.get(method)):
+                points.append((cls, method, phase, True))
+    points.append((Canvas, "showPage", "serialize", False))
+    points.append((Canvas, "save", "serialize", False))
+    points.append((BaseDocTemplate, "build", "build", False))
+    streaming = sys.modules.get("streaming_doc")
+    if streaming:
+        points.append((streaming.StreamingDocTemplate, "_refill", "flowables", False))
+    return points
+
+
+def _install():
+    installed = []
+    for owner, attribute, phase, per_type in _hook_points():
+        original = owner.__dict__[attribute]
+        setattr(owner, attribute, _timed(original, phase, per_type))
+        installed.append((owner, attribute, original))
+    return installed
+
+
+def _uninstall(installed):
+    for owner, attribute, original in reversed(installed):
+        setattr(owner, attribute, original)
+
+
+def report(profile, file=None):
+    """Print the breakdown in one write, so parallel builds don't interleave."""
+    total = profile.total or 1e-9
+    lines = [f"\n{profile.name}: {profile.total:.3f}s"]
+    for phase in PHASES:
+        seconds = profile.phases.get(phase, 0.0)
+        lines.append(f"  {phase:<10} {seconds:8.3f}s {seconds / total:6.1%}")
+    rows = sorted(profile.types.items(), key=lambda kv: -kv[1][0])
+    if rows:
+        lines.append(f"  {'by flowable type':<28} {'seconds':>8} {'calls':>8}")
+        for (phase, name), (seconds, calls) in rows:
+            lines.append(f"  {phase:<7}{name:<21} {seconds:8.3f} {calls:8d}")
+    lines.extend(profile.cache_lines)
+    (file or sys.stderr).write("\n".join(lines) + "\n")
+
+
+def profile_build(name):
+    """Decorate a generator's build_pdf() so that, when profiling is on, each call reports its phases."""
+    def decorate(build_pdf):
+        @functools.wraps(build_pdf)
+        def wrapper(*args, **kwargs):
+            global _active
+            if not enabled() or _active is not None:
+                return build_pdf(*args, **kwargs)
+            import pdf_theme
+            profile = BuildProfile(name)
+            dump_dir = os.environ.get(DUMP_ENV_VAR)
+            profiler = cProfile.Profile() if dump_dir else None
+            # The cache may not be imported until the build first needs it
+            cache = sys.modules.get("paragraph_cache")
+            cache_before = cache.stats() if cache else None
+            installed = _install()
+            _active = profile
+            frame = [perf_counter(), 0.0]
+            _stack.append(frame)
+            try:
+                if profiler:
+                    profiler.enable()
+                if pdf_theme.get_styles.cache_info().currsize == 0:
+                    # The registry is built once per process; charge that here
+                    # rather than to whichever flowable asks first
+                    start = perf_counter()
+                    pdf_theme.get_styles()
+                    pdf_theme.get_table_styles()
+                    styles = perf_counter() - start
+                    profile.add("styles", None, styles)
+                    frame[1] += styles
+                return build_pdf(*args, **kwargs)
+            finally:
+                if profiler:
+                    profiler.disable()
+                _stack.pop()
+                _active = None
+                _uninstall(installed)
+                profile.total = perf_counter() - frame[0]
+                profile.add("flowables", None, profile.total - frame[1])
+                cache = sys.modules.get("paragraph_cache")
+                if cache:
+                    profile.cache_lines = cache.format_stats(cache_before)
+                report(profile)
+                if profiler:
+                    os.makedirs(dump_dir, exist_ok=True)
+                    profiler.dump_stats(os.path.join(dump_dir, f"{name}.prof"))
+        return wrapper
+    return decorate
@@ -0,0 +1,172 @@
+"""
+Fonts and images shared by every document built in one process
+
+register_font() registers a TrueType font with reportlab once, however many
+generators ask for it (the standard Helvetica family needs no registration
+and is simply recorded).
+
+load_image() decodes an image with PIL once, flattens transparency onto
+white and downsamples it to the pixels its largest drawn size needs at
+DEFAULT_DPI, then keeps the pixels (an untouched JPEG is kept as its file,
+which the PDF embeds as is). ResourceImage draws such an image through
+reportlab's public form API: the first placement in a document defines a
+form holding the image, and every later one draws that form, so the
+document carries one image XObject however often it is placed. A later
+document reuses the decoded pixels instead of opening the file again.
+cache_info() reports hits and loads.
+
+    from pdf_resources import image_flowable
+    elements.append(image_flowable(path, width=3 * inch))
+"""
+
+import hashlib
+import os
+
+from reportlab.pdfbase import pdfmetrics
+from reportlab.platypus import Flowable
+
+# Resolution images are downsampled to at their largest drawn size
+DEFAULT_DPI = 150
+
+IMAGE_EXTENSIONS = (".png", ".jpg", ".jpeg", ".gif", ".bmp", ".tif", ".tiff", ".webp")
+
+_fonts = set()
+_images = {}  # (path, mtime, size, pixel box) -> ImageResource
+_stats = {"font_hits": 0, "font_loads": 0, "image_hits": 0, "image_loads": 0, "xobject_reuses": 0}
+
+
+def register_font(name, path=None):
+    """Make font ``name`` available to reportlab, loading ``path`` (a .ttf) the first time; returns ``name``."""
+    if name in _fonts:
+        _stats["font_hits"] += 1
+        return name
+    if name not in pdfmetrics.standardFonts:
+        if path is None:
+            raise ValueError(f"font {name!r} is not a standard PDF font; give the .ttf path")
+        from reportlab.pdfbase.ttfonts import TTFont
+        pdfmetrics.registerFont(TTFont(name, path))
+    _fonts.add(name)
+    _stats["font_loads"] += 1
+    return name
+
+
+def is_image(path):
+    """Whether PIL can open ``path`` as an image (receipts are sometimes saved without an extension)."""
+    if os.path.splitext(path)[1].lower() in IMAGE_EXTENSIONS:
+        return True
+    from PIL import Image, UnidentifiedImageError
+    try:
+        with Image.open(path):
+            return True
+    except (UnidentifiedImageError, OSError):
+        return False
+
+
+class ImageResource:
+    """A decoded, downsampled image: ``image`` is what canvas.drawImage() is given for it."""
+
+    __slots__ = ("name", "path", "width", "height", "image", "size")
+
+
+def _decode(path, box, name):
+    from PIL import Image, ImageOps
+    from reportlab.lib.utils import ImageReader
+    with Image.open(path) as im:
+        # An untouched JPEG can be embedded as is
+        as_is = im.format == "JPEG" and im.getexif().get(0x0112, 1) == 1
+        im = ImageOps.exif_transpose(im)
+        resized = box is not None and (im.width > box[0] or im.height > box[1])
+        if resized:
+            im.thumbnail(box, Image.LANCZOS)
+        if im.mode in ("RGBA", "LA", "P", "PA"):
+            im = im.convert("RGBA")
+            flat = Image.new("RGB", im.size, "white")
+            flat.paste(im, mask=im.getchannel("A"))
+            im = flat
+        elif im.mode not in ("RGB", "L"):
+            im = im.convert("RGB")
+        resource = ImageResource()
+        resource.name = name
+        resource.path = path
+        resource.width, resource.height = im.size
+        if as_is and not resized:
+            resource.image = path
+            resource.size = os.path.getsize(path)
+        else:
+            resource.image = ImageReader(im)
+            # Read the pixels while the file is open; the reader keeps them
+            resource.size = len(resource.image.getRGBData())
+    return resource
+
+
+def load_image(path, max_width=None, max_height=None, dpi=DEFAULT_DPI):
+    """The cached ImageResource for ``path``, downsampled to fit ``max_width`` x ``max_height`` points at ``dpi``."""
+    path = os.path.abspath(path)
+    st = os.stat(path)
+    box = None
+    if max_width or max_height:
+        limit = 10 ** 6
+        box = (round((max_width or limit) * dpi / 72), round((max_height or limit) * dpi / 72))
+    key = (path, st.st_mtime_ns, st.st_size, box)
+    resource = _images.get(key)
+    if resource is not None:
+        _stats["image_hits"] += 1
+        return resource
+    name = hashlib.md5(repr(key).encode("utf-8")).hexdigest()
+    resource = _images[key] = _decode(path, box, name)
+    _stats["image_loads"] += 1
+    return resource
+
+
+class ResourceImage(Flowable):
+    """Draws an ImageResource at ``width`` x ``height`` points (either may be omitted to keep the aspect ratio)."""
+
+    def __init__(self, resource, width=None, height=None):
+        super().__init__()
+        self.resource = resource
+        aspect = resource.height / resource.width
+        if width and height:
+            scale = min(width / resource.width, height / resource.height)
+            width, height = resource.width * scale, resource.height * scale
+        elif width:
+            height = width * aspect
+        elif height:
+            width = height / aspect
+        else:
+            width, height = resource.width, resource.height
+        self.drawWidth, self.drawHeight = width, height
+
+    def wrap(self, availWidth, availHeight):
+        return self.drawWidth, self.drawHeight
+
+    def draw(self):
+        canv = self.canv
+        form = "img" + self.resource.name
+        if canv.hasForm(form):
+            _stats["xobject_reuses"] += 1
+        else:
+            # A unit square holding the image, scaled to size wherever it is drawn
+            canv.beginForm(form, 0, 0, 1, 1)
+            canv.drawImage(self.resource.image, 0, 0, 1, 1)
+            canv.endForm()
+        canv.saveState()
+        canv.scale(self.drawWidth, self.drawHeight)
+        canv.doForm(form)
+        canv.restoreState()
+
+
+def image_flowable(path, width=None, height=None, dpi=DEFAULT_DPI):
+    """A ResourceImage of the file at ``path`` fitted to ``width`` x ``height`` points."""
+    return ResourceImage(load_image(path, width, height, dpi), width, height)
+
+
+def cache_info():
+    """Hit and load counters, plus the number and size of cached images."""
+    return dict(_stats, images=len(_images), image_bytes=sum(r.size for r in _images.values()))
+
+
+def clear_cache():
+    _images.clear()
+    _fonts.clear()
+    for key in _stats:
+        _stats[key] = 0
@@ -0,0 +1,176 @@
+"""
+Shared colours and paragraph styles for the BBS PDF generators
+"""
+
+from functools import lru_cache
+from types import MappingProxyType
+
+from reportlab.lib.colors import HexColor, white
+from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
+from reportlab.lib.enums import TA_RIGHT
+from reportlab.platypus import TableStyle
+
+# Colors
+DARK_BG = HexColor("#1a1a2e")
+ACCENT = HexColor("#e94560")
+ACCENT_LIGHT = HexColor("#f5e6cc")
+HEADER_BG = HexColor("#16213e")
+ROW_ALT = HexColor("#f7f7f7")
+LINK_COLOR = HexColor("#0066cc")
+GREEN = HexColor("#2d6a4f")
+ORANGE = HexColor("#e76f51")
+RED = HexColor("#c1121f")
+GOLD = HexColor("#b8860b")
+LIGHT_GREEN = HexColor("#d8f3dc")
+LIGHT_ORANGE = HexColor("#fde8d0")
+LIGHT_RED = HexColor("#fcd5ce")
+LIGHT_BLUE = HexColor("#e8f0fe")
+RULE_GREY = HexColor("#cccccc")
+RULE_LIGHT = HexColor("#eeeeee")
+
+# Priority levels -> (text colour, background colour)
+PRIORITY_COLORS = {
+    "urgent": (RED, LIGHT_RED),
+    "high": (ORANGE, LIGHT_ORANGE),
+    "normal": (GREEN, LIGHT_GREEN),
+}
+
+# Verdict colour names used by the bank records
+VERDICT_COLORS = {
+    "green": GREEN,
+    "orange": ORANGE,
+    "gold": GOLD,
+}
+
+
+def priority_level(priority):
+    """Map a free-text priority ("URGENT - DEADLINE APRIL 9", "HIGH", ...) to a PRIORITY_COLORS key."""
+    if "URGENT" in priority:
+        return "urgent"
+    elif priority == "HIGH":
+        return "high"
+    return "normal"
+
+
+@lru_cache(maxsize=None)
+def get_styles():
+    """Build every paragraph style once per process.
+
+    The returned mapping is read-only and the styles it holds are shared by
+    every document built in the process, so callers must never mutate them.
+    Per-priority and per-verdict variants are precomputed as
+    ``priority_<level>`` and ``verdict_<colour>`` entries.
+    """
+    base = getSampleStyleSheet()
+    s = {}
+
+    s["title"] = ParagraphStyle('CustomTitle', parent=base['Title'], fontSize=22, leading=26, textColor=DARK_BG, spaceAfter=4, fontName='Helvetica-Bold')
+    s["subtitle"] = ParagraphStyle('Subtitle', parent=base['Normal'], fontSize=12, leading=16, textColor=HexColor("#555555"), spaceAfter=2, fontName='Helvetica')
+    s["heading"] = ParagraphStyle('CustomHeading', parent=base['Heading2'], fontSize=14, leading=18, textColor=DARK_BG, spaceBefore=16, spaceAfter=8, fontName='Helvetica-Bold')
+    s["heading_compact"] = ParagraphStyle('CompactHeading', parent=s["heading"], spaceBefore=14)
+    s["section"] = ParagraphStyle('SectionHead', parent=base['Heading3'], fontSize=11, leading=14, textColor=ACCENT, spaceBefore=12, spaceAfter=4, fontName='Helvetica-Bold')
+    s["section_compact"] = ParagraphStyle('CompactSection', parent=s["section"], spaceBefore=10)
+    s["body"] = ParagraphStyle('CustomBody', parent=base['Normal'], fontSize=9.5, leading=13, textColor=HexColor("#333333"), spaceAfter=6, fontName='Helvetica')
+    s["small"] = ParagraphStyle('Small', parent=base['Normal'], fontSize=8, leading=10, textColor=HexColor("#666666"), fontName='Helvetica')
+    s["link"] = ParagraphStyle('Link', parent=base['Normal'], fontSize=8.5, leading=11, textColor=LINK_COLOR, fontName='Helvetica')
+    s["bold"] = ParagraphStyle('BoldBody', parent=s["body"], fontName='Helvetica-Bold')
+
+    # Task sheet
+    s["checklist"] = ParagraphStyle('Checklist', parent=s["body"], fontSize=9, leading=12, leftIndent=15, spaceAfter=3)
+    s["instruction"] = ParagraphStyle('Instruction', parent=s["body"], fontSize=9.5, leading=13, textColor=HexColor("#1a1a2e"), backColor=HexColor("#f0f4ff"), borderPadding=(6, 8, 6, 8), spaceAfter=8)
+
+    # Sponsor blocks
+    s["sponsor_name"] = ParagraphStyle('SponsorName', parent=s["bold"], fontSize=10, leading=13)
+    for level, (color, _bg) in PRIORITY_COLORS.items():
+        s["priority_" + level] = ParagraphStyle('Priority', parent=s["small"], fontSize=8, textColor=color, alignment=TA_RIGHT)
+    s["status_good"] = ParagraphStyle('StatusGood', parent=s["small"], textColor=GREEN, fontName='Helvetica-Bold')
+    s["dead"] = ParagraphStyle('Dead', parent=s["small"], textColor=RED)
+    s["broken_name"] = ParagraphStyle('BrokenName', parent=s["bold"], fontSize=9.5, textColor=RED)
+    s["dead_url"] = ParagraphStyle('DeadUrl', parent=s["small"], textColor=HexColor("#999999"))
+
+    # Banking options
+    s["recommendation"] = ParagraphStyle('Recommendation', parent=s["body"], fontSize=10, leading=14, textColor=GREEN, fontName='Helvetica-Bold', backColor=LIGHT_GREEN, borderPadding=(8, 10, 8, 10))
+    s["callout"] = ParagraphStyle('Callout', parent=s["body"], fontSize=9.5, leading=13, textColor=DARK_BG, backColor=LIGHT_BLUE, borderPadding=(8, 10, 8, 10), spaceAfter=10)
+    s["rank"] = ParagraphStyle('Rank', parent=s["bold"], fontSize=18, leading=22, textColor=ACCENT, fontName='Helvetica-Bold')
+    s["recommendation_name"] = ParagraphStyle('RecommendationName', parent=s["bold"], fontSize=14, leading=18, textColor=GREEN)
+    s["bank_name"] = ParagraphStyle('BankName', parent=s["bold"], fontSize=12, leading=16, textColor=DARK_BG)
+    s["pros"] = ParagraphStyle('Pros', parent=s["small"], textColor=GREEN)
+    s["cons"] = ParagraphStyle('Cons', parent=s["small"], textColor=RED)
+    for name, color in VERDICT_COLORS.items():
+        s["verdict_" + name] = ParagraphStyle('Verdict', parent=s["small"], fontSize=9, textColor=color, fontName='Helvetica-Bold')
+    s["step_label"] = ParagraphStyle('StepLabel', parent=s["small"], textColor=ACCENT, fontName='Helvetica-Bold')
+    s["action"] = ParagraphStyle('Action', parent=s["body"], textColor=RED, fontName='Helvetica-Bold')
+
+    return MappingProxyType(s)
+
+
+def priority_style(priority):
+    """Precomputed style for a sponsor's priority label."""
+    return get_styles()["priority_" + priority_level(priority)]
+
+
+def verdict_style(color_name):
+    """Precomputed style for a bank verdict line, keyed by VERDICT_COLORS name."""
+    return get_styles()["verdict_" + color_name]
+
+
+def comparison_table_style(rows, *commands, stripe_from=2):
+    """The banking comparison table's look for a table of ``rows`` rows: dark header, grey grid, alternating rows.
+
+    Every other row from ``stripe_from`` is shaded. Extra ``commands`` are
+    appended, so they win over the defaults.
+    """
+    return TableStyle([
+        ('BACKGROUND', (0, 0), (-1, 0), HEADER_BG),
+        ('TEXTCOLOR', (0, 0), (-1, 0), white),
+        ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+        ('FONTSIZE', (0, 0), (-1, 0), 8),
+        ('FONTNAME', (0, 1), (-1, -1), 'Helvetica'),
+        ('FONTSIZE', (0, 1), (-1, -1), 8),
+        ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
+        ('TOPPADDING', (0, 0), (-1, -1), 5),
+        ('BOTTOMPADDING', (0, 0), (-1, -1), 5),
+        ('GRID', (0, 0), (-1, -1), 0.5, RULE_GREY),
+        *[('BACKGROUND', (0, i), (-1, i), ROW_ALT) for i in range(stripe_from, rows, 2)],
+        *commands,
+    ])
+
+
+@lru_cache(maxsize=None)
+def get_table_styles():
+    """TableStyles shared by every per-sponsor and per-bank table, built once per process."""
+    return MappingProxyType({
+        "sponsor_header": TableStyle([
+            ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
+            ('TOPPADDING', (0, 0), (-1, -1), 2),
+            ('BOTTOMPADDING', (0, 0), (-1, -1), 2),
+        ]),
+        "sponsor_detail": TableStyle([
+            ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
+            ('TOPPADDING', (0, 0), (-1, -1), 1),
+            ('BOTTOMPADDING', (0, 0), (-1, -1), 1),
+        ]),
+        "checklist": TableStyle([
+            ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
+            ('TOPPADDING', (0, 0), (-1, -1), 1),
+            ('BOTTOMPADDING', (0, 0), (-1, -1), 1),
+            ('BACKGROUND', (0, 0), (-1, -1), HexColor("#f8f8f8")),
+            ('BOX', (0, 0), (-1, -1), 0.5, HexColor("#dddddd")),
+        ]),
+        "findings": TableStyle([
+            ('TOPPADDING', (0, 0), (-1, -1), 4),
+            ('BOTTOMPADDING', (0, 0), (-1, -1), 4),
+            ('BACKGROUND', (0, 0), (-1, -1), HexColor("#fffef5")),
+            ('BOX', (0, 0), (-1, -1), 0.5, HexColor("#dddddd")),
+        ]),
+        "bank_rank": TableStyle([
+            ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
+            ('TOPPADDING', (0, 0), (-1, -1), 4),
+            ('BOTTOMPADDING', (0, 0), (-1, -1), 2),
+        ]),
+        "step": TableStyle([
+            ('VALIGN', (0, 0), (-1, -1), 'TOP'),
+            ('TOPPADDING', (0, 0), (-1, -1), 2),
+            ('BOTTOMPADDING', (0, 0), (-1, -1), 2),
+        ]),
+    })
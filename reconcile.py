@@ -0,0 +1,322 @@
+#!/usr/bin/env python3
+"""
+Reconcile the chequing statements against the AETSA logbooks and the Reimbursement Tracker
+
+Both sides are held as columns (day ordinal, amount in cents, direction,
+description, source) in stdlib arrays. Matching is a hash join on
+(direction, amount) followed by a sort-and-sweep over each bucket by date:
+a ledger entry takes the unmatched bank transaction closest in date within
+the window, ties going to the one whose description shares the most words.
+Undated ledger entries (the tracker has no dates) match on description
+alone. Nothing compares every entry with every transaction, so a decade of
+daily transactions reconciles in well under a second.
+
+    python reconcile.py [--window DAYS]
+"""
+
+import argparse
+import glob
+import os
+import re
+from array import array
+from collections import defaultdict
+from datetime import date, datetime
+
+from bank_statements import format_cents, load_statements, transaction_table
+from workbooks import read_sheet, sheet_names
+
+ROOT = os.path.dirname(os.path.abspath(__file__))
+LEDGER_DIR = os.path.join(ROOT, "BBS Finances 2024-2025", "3. Financial Docs")
+WORKBOOK_GLOB = "BBS Financial Documents*.xlsx"
+TRACKER_PATH = os.path.join(LEDGER_DIR, "Reimbursement Tracker.xlsx")
+
+DEFAULT_WINDOW = 7
+
+# Words that say nothing about who or what a transaction was for
+STOPWORDS = frozenset({
+    "the", "and", "for", "from", "sent", "trans", "transfer", "e-transfer", "e-trans", "etransfer",
+    "pmt", "payment", "bbs", "reimbursed", "reimbursement",
+})
+
+_WORD_RE = re.compile(r"[a-z0-9][a-z0-9-]{2,}")
+_DATE_FORMATS = ("%d-%b-%Y", "%Y-%m-%d", "%d/%m/%Y", "%B %d, %Y", "%b %d, %Y")
+
+
+def words(text):
+    return frozenset(w for w in _WORD_RE.findall(text.lower()) if w not in STOPWORDS)
+
+
+class Entries:
+    """One side of a reconciliation, stored column by column.
+
+    ``day`` holds date ordinals (0 when the entry has no date), ``amount``
+    cents and ``credit`` 1 for money in / 0 for money out.
+    """
+
+    def __init__(self):
+        self.day = array("l")
+        self.amount = array("q")
+        self.credit = array("b")
+        self.description = []
+        self.source = []
+        self.words = []
+
+    def __len__(self):
+        return len(self.amount)
+
+    def add(self, day, amount, credit, description, source):
+        self.day.append(day.toordinal() if day else 0)
+        self.amount.append(amount)
+        self.credit.append(1 if credit else 0)
+        self.description.append(description)
+        self.source.append(source)
+        self.words.append(words(description))
+
+    def date(self, i):
+        return date.fromordinal(self.day[i]) if self.day[i] else None
+
+    @classmethod
+    def from_transactions(cls, table):
+        """Bank side, from a bank_statements.TransactionTable."""
+        entries = cls()
+        for day, description, debit, credit, _, statement in table.rows():
+            entries.add(day, credit or debit, bool(credit), description, f"Statement {statement}")
+        return entries
+
+
+class Reconciliation:
+    def __init__(self, bank, ledger, matches, window, coverage=None):
+        self.bank = bank
+        self.ledger = ledger
+        # (bank index, ledger index, days apart or None, shared words)
+        self.matches = matches
+        self.window = window
+        matched_bank = {m[0] for m in matches}
+        matched_ledger = {m[1] for m in matches}
+        self.unmatched_bank = [i for i in range(len(bank)) if i not in matched_bank]
+        self.unmatched_ledger = []
+        # Dated ledger entries outside the statements' period can't be checked
+        self.uncovered_ledger = []
+        first, last = (coverage[0].toordinal(), coverage[1].toordinal()) if coverage else (None, None)
+        for j in range(len(ledger)):
+            if j in matched_ledger:
+                continue
+            day = ledger.day[j]
+            if coverage and day and not first - window <= day <= last + window:
+                self.uncovered_ledger.append(j)
+            else:
+                self.unmatched_ledger.append(j)
+
+    def unmatched_total(self, side, indexes):
+        """Net cents (credits positive) of the given entries."""
+        return sum(side.amount[i] if side.credit[i] else -side.amount[i] for i in indexes)
+
+
+def reconcile(bank, ledger, window=DEFAULT_WINDOW, coverage=None):
+    """Match ledger entries one-to-one with bank transactions of the same amount and direction.
+
+    ``coverage`` is the (first, last) date the bank side covers; unmatched
+    ledger entries dated outside it are reported as uncovered, not missing.
+    """
+    buckets = defaultdict(lambda: ([], []))
+    for i in range(len(bank)):
+        buckets[(bank.credit[i], bank.amount[i])][0].append(i)
+    for j in range(len(ledger)):
+        buckets[(ledger.credit[j], ledger.amount[j])][1].append(j)
+
+    matches = []
+    for bank_ids, ledger_ids in buckets.values():
+        if not bank_ids or not ledger_ids:
+            continue
+        bank_ids.sort(key=bank.day.__getitem__)
+        ledger_ids.sort(key=ledger.day.__getitem__)
+        taken = set()
+        lo = 0
+        undated = []
+        for j in ledger_ids:
+            day = ledger.day[j]
+            if not day:
+                undated.append(j)
+                continue
+            while lo < len(bank_ids) and bank.day[bank_ids[lo]] < day - window:
+                lo += 1
+            best = None
+            for k in range(lo, len(bank_ids)):
+                i = bank_ids[k]
+                if bank.day[i] > day + window:
+                    break
+                if i in taken:
+                    continue
+                shared = len(bank.words[i] & ledger.words[j])
+                key = (abs(bank.day[i] - day), -shared)
+                if best is None or key < best[0]:
+                    best = (key, i, shared)
+            if best:
+                (apart, _), i, shared = best
+                taken.add(i)
+                matches.append((i, j, apart, shared))
+        for j in undated:
+            # No date to go on: require at least one shared word
+            best = None
+            for i in bank_ids:
+                if i in taken:
+                    continue
+                shared = len(bank.words[i] & ledger.words[j])
+                if shared and (best is None or shared > best[1]):
+                    best = (i, shared)
+            if best:
+                taken.add(best[0])
+                matches.append((best[0], j, None, best[1]))
+
+    matches.sort(key=lambda m: (bank.day[m[0]], m[0]))
+    return Reconciliation(bank, ledger, matches, window, coverage)
+
+
+def _cell_date(value):
+    if isinstance(value, datetime):
+        return value.date()
+    if isinstance(value, date):
+        return value
+    if isinstance(value, str):
+        text = value.strip().replace("Sept", "Sep")
+        for fmt in _DATE_FORMATS:
+            try:
+                return datetime.strptime(text, fmt).date()
+            except ValueError:
+                pass
+    return None
+
+
+def _cell_cents(value):
+    if isinstance(value, bool) or not isinstance(value, (int, float)):
+        return None
+    return round(value * 100)
+
+
+def _header_columns(row, names):
+    """Map each wanted header name to its column index, or None if the row lacks any of them."""
+    found = {}
+    for index, cell in enumerate(row):
+        if isinstance(cell, str) and cell.strip().lower() in names and cell.strip().lower() not in found:
+            found[cell.strip().lower()] = index
+    return found if len(found) == len(names) else None
+
+
+def read_logbooks(paths, entries=None, skipped=None):
+    """Add every Logbook sheet row of the given workbooks to ``entries``.
+
+    The same logbook copied into a later year's workbook is only added once:
+    a row is skipped if a workbook before it had the same row of a sheet of
+    the same title with the same date, amount and description.
+    Rows with no usable amount are appended to ``skipped`` as (source, reason).
+    Returns (entries, skipped).
+    """
+    entries = entries if entries is not None else Entries()
+    skipped = skipped if skipped is not None else []
+    seen = set()
+    for path in paths:
+        book = os.path.splitext(os.path.basename(path))[0]
+        for title in sheet_names(path):
+            if "logbook" not in title.lower():
+                continue
+            sheet = title.strip()
+            columns = None
+            for r, row in enumerate(read_sheet(path, title), 1):
+                if columns is None:
+                    columns = _header_columns(row, ("date", "description", "debit", "credit"))
+                    continue
+                first = row[0] if row else None
+                if isinstance(first, str) and first.strip().lower().startswith("amount carried"):
+                    break
+                cells = [row[columns[name]] if columns[name] < len(row) else None
+                         for name in ("date", "description", "debit", "credit")]
+                day, description, debit, credit = cells
+                if all(c is None for c in cells):
+                    continue
+                source = f"{book} / {sheet} row {r}"
+                debit, credit = _cell_cents(debit), _cell_cents(credit)
+                if not debit and not credit:
+                    skipped.append((source, "no debit or credit amount"))
+                    continue
+                day = _cell_date(day)
+                description = str(description or "").strip()
+                # The position keeps two identical payments on one day as two
+                # entries; the contents keep a later year's different row of the
+                # same sheet title
+                key = (sheet, r, day, debit, credit, description)
+                if key in seen:
+                    continue
+                seen.add(key)
+                entries.add(day, credit or debit, bool(credit), description, source)
+    return entries, skipped
+
+
+def read_tracker(path=TRACKER_PATH, entries=None, skipped=None):
+    """Add the Reimbursement Tracker's rows (money owed out) to ``entries``; returns (entries, skipped)."""
+    entries = entries if entries is not None else Entries()
+    skipped = skipped if skipped is not None else []
+    columns = None
+    for r, row in enumerate(read_sheet(path), 1):
+        if columns is None:
+            columns = _header_columns(row, ("date", "person", "amount", "description"))
+            continue
+        if all(c is None for c in row):
+            # The tracker ends at its first blank row; anything below is scratch work
+            break
+        get = lambda name: row[columns[name]] if columns[name] < len(row) else None
+        source = f"Reimbursement Tracker row {r}"
+        amount = _cell_cents(get("amount"))
+        if not amount:
+            skipped.append((source, f"amount {get('amount')!r} is not a number"))
+            continue
+        description = " - ".join(str(v).strip() for v in (get("person"), get("description")) if v)
+        entries.add(_cell_date(get("date")), amount, False, description, source)
+    return entries, skipped
+
+
+def find_workbooks(folder=LEDGER_DIR):
+    """AETSA financial workbooks under ``folder``, templates excluded."""
+    paths = glob.glob(os.path.join(glob.escape(folder), "**", WORKBOOK_GLOB), recursive=True)
+    return sorted(p for p in paths if "template" not in os.path.basename(p).lower())
+
+
+def reconcile_all(window=DEFAULT_WINDOW, statements=None):
+    """Reconcile the statements against the logbooks and, separately, the tracker.
+
+    Returns (logbook reconciliation, tracker reconciliation, skipped rows, statements).
+    """
+    statements = statements if statements is not None else load_statements()
+    bank = Entries.from_transactions(transaction_table(statements))
+    coverage = (statements[0]["period_start"], statements[-1]["period_end"]) if statements else None
+    logbook, skipped = read_logbooks(find_workbooks())
+    tracker = Entries()
+    if os.path.exists(TRACKER_PATH):
+        read_tracker(TRACKER_PATH, tracker, skipped)
+    return (reconcile(bank, logbook, window, coverage), reconcile(bank, tracker, window, coverage),
+            skipped, statements)
+
+
+def _describe(side, i):
+    day = side.date(i)
+    sign = "+" if side.credit[i] else "-"
+    return f"{day.isoformat() if day else '(no date)':<10}  {sign}{format_cents(side.amount[i]):>10}  {side.description[i]}"
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--window", type=int, default=DEFAULT_WINDOW,
+                        help="days a ledger date may differ from the bank date (default: %(default)s)")
+    args = parser.parse_args()
+
+    logbook, tracker, skipped, _ = reconcile_all(args.window)
+    for name, rec in (("Logbooks", logbook), ("Reimbursement Tracker", tracker)):
+        print(f"{name}: {len(rec.matches)} matched, {len(rec.unmatched_ledger)} of {len(rec.ledger)} ledger entries unmatched")
+        for j in rec.unmatched_ledger:
+            print(f"  ledger  {_describe(rec.ledger, j)}  [{rec.ledger.source[j]}]")
+        if rec.uncovered_ledger:
+            print(f"  ({len(rec.uncovered_ledger)} more dated outside the statements)")
+    print(f"Bank transactions with no logbook entry: {len(logbook.unmatched_bank)} of {len(logbook.bank)}")
+    for i in logbook.unmatched_bank:
+        print(f"  bank    {_describe(logbook.bank, i)}")
+    for source, reason in skipped:
+        print(f"skipped {source}: {reason}")
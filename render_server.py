@@ -0,0 +1,361 @@
+#!/usr/bin/env python3
+"""
+Local render service: the PDF generators kept warm behind HTTP
+
+Running `python generate_lola_pdf.py` for every "regenerate my task sheet"
+click pays for the interpreter, the reportlab imports, the style registry and
+the datasets each time. The server pays for them once. It loads the
+datasets, renders every document once to warm the per-process caches (styles,
+the task sheet's parsed fixed text, the sponsor catalog, font metrics), and
+then forks a bounded pool of workers that inherit all of it. After that a
+request costs only its render.
+
+    python render_server.py                          # http://127.0.0.1:8765
+    python render_server.py --socket /tmp/bbs.sock -j 2 lola working-links
+
+    curl -d '{"researcher": "Amara", "volunteers": ["Amara", "Ben"]}' \\
+        http://127.0.0.1:8765/render/lola -o amara.pdf
+    curl http://127.0.0.1:8765/health
+
+POST /render/<document> takes a JSON object of parameters and answers with
+the PDF; X-Render-Seconds gives the time spent rendering. A document's
+datasets may be passed as record lists, validated like the data files.
+Otherwise the server's copy of data/ is used, reloaded when a file changes.
+lola also takes "researcher" and "volunteers": unless the request brings
+its own lola_sponsors, the sheet then holds that researcher's share of the
+sponsors, dealt out the way mail_merge.py does.
+
+At most --jobs renders run at once and --backlog more wait; after that the
+server answers 503.
+"""
+
+import argparse
+import contextlib
+import importlib
+import io
+import json
+import multiprocessing
+import os
+import signal
+import socketserver
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from datetime import date
+from http import HTTPStatus
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from dataset_loader import DATASETS, DEFAULT_RESEARCHER, DatasetError, dataset_path, load_dataset
+from mail_merge import partition
+
+DEFAULT_PORT = 8765
+DEFAULT_BACKLOG = 8
+
+# Seconds a request waits for its render
+RENDER_TIMEOUT = 300
+
+# Largest request body accepted; a full sponsor tracker is well under this
+MAX_BODY = 16 * 1024 * 1024
+
+
+class RenderError(ValueError):
+    """Raised for a render request the server can't act on: unknown parameters or bad values."""
+
+
+class Busy(Exception):
+    """Raised when --jobs renders are running and --backlog more are waiting."""
+
+
+class RenderFailed(Exception):
+    """Raised when a valid request's render fails in the worker; the cause is chained."""
+
+
+def _text(value):
+    if not isinstance(value, str):
+        raise RenderError(f"expected a string, got {value!r}")
+    return value
+
+
+def _names(value):
+    if not isinstance(value, list):
+        raise RenderError(f"expected a list of names, got {value!r}")
+    return [_text(v) for v in value]
+
+
+def _day(value):
+    try:
+        return date.fromisoformat(_text(value))
+    except ValueError:
+        raise RenderError(f"expected a YYYY-MM-DD date, got {value!r}")
+
+
+def _days(value):
+    if not isinstance(value, int) or isinstance(value, bool) or value < 0:
+        raise RenderError(f"expected a number of days, got {value!r}")
+    return value
+
+
+# Document -> (generator module, build_pdf()'s dataset parameters, its other parameters: name -> parser)
+RENDERERS = {
+    "lola": ("generate_lola_pdf", ("lola_sponsors",), {"researcher": _text, "volunteers": _names}),
+    "working-links": ("generate_working_links_pdf", ("working_links", "broken_links", "timed_out_links"), {}),
+    "banking": ("generate_banking_pdf", ("banks", "bank_comparison"), {}),
+    "calendar": ("generate_calendar_pdf", (), {"today": _day}),
+    "reconciliation": ("generate_reconciliation_pdf", (), {"window": _days}),
+    "budget": ("generate_budget_pdf", (), {}),
+}
+
+
+def render(document, kwargs):
+    """Worker side: build one document in memory and return (PDF bytes, seconds)."""
+    module = importlib.import_module(RENDERERS[document][0])
+    buffer = io.BytesIO()
+    start = time.perf_counter()
+    # The generators announce the file they wrote; there is none here
+    with contextlib.redirect_stdout(io.StringIO()):
+        module.build_pdf(buffer, **kwargs)
+    return buffer.getvalue(), time.perf_counter() - start
+
+
+def warm(documents):
+    """Import the generators and render each document once, so every per-process cache is filled.
+
+    Called in the server before the pool starts so forked workers inherit the
+    warm caches; on platforms without fork it runs again as the worker
+    initializer.
+    """
+    for document in documents:
+        render(document, {})
+
+
+class RenderService:
+    def __init__(self, documents, jobs=None, backlog=DEFAULT_BACKLOG):
+        self.documents = list(documents)
+        self.jobs = jobs or os.cpu_count() or 1
+        self.started = time.time()
+        self.served = 0
+        self._slots = threading.BoundedSemaphore(self.jobs + backlog)
+        self._lock = threading.Lock()
+        # Dataset name -> (file stamp, records)
+        self._datasets = {}
+        self._pool = None
+
+    def start(self):
+        warm(self.documents)
+        for document in self.documents:
+            for name in RENDERERS[document][1]:
+                self.dataset(name)
+        self._pool = self._new_pool()
+
+    def close(self):
+        if self._pool:
+            self._pool.shutdown(cancel_futures=True)
+
+    def _new_pool(self):
+        methods = multiprocessing.get_all_start_methods()
+        ctx = multiprocessing.get_context("fork" if "fork" in methods else None)
+        pool = ProcessPoolExecutor(max_workers=self.jobs, mp_context=ctx,
+                                   initializer=None if "fork" in methods else warm, initargs=(self.documents,))
+        # With fork every worker starts on the first submit; do that now, not
+        # from a request thread
+        pool.submit(os.getpid).result()
+        return pool
+
+    def dataset(self, name):
+        """The default records of a dataset, reloaded only when its file has changed."""
+        path = dataset_path(name)
+        st = os.stat(path)
+        stamp = (st.st_mtime_ns, st.st_size)
+        with self._lock:
+            loaded = self._datasets.get(name)
+            if loaded is None or loaded[0] != stamp:
+                loaded = self._datasets[name] = (stamp, load_dataset(name))
+            return loaded[1]
+
+    def prepare(self, document, params):
+        """build_pdf() keyword arguments for a request's parameters."""
+        _, datasets, options = RENDERERS[document]
+        unknown = sorted(set(params) - set(datasets) - set(options))
+        if unknown:
+            raise RenderError(f"{document} takes no parameter(s) {', '.join(unknown)}")
+        kwargs = {}
+        for name in datasets:
+            if name in params:
+                records = params[name]
+                if not isinstance(records, list):
+                    raise RenderError(f"{name}: expected a list of records")
+                schema = DATASETS[name][1]
+                kwargs[name] = [schema.validate(dict(r) if isinstance(r, dict) else r, f"{name} record {i}")
+                                for i, r in enumerate(records, 1)]
+            else:
+                kwargs[name] = self.dataset(name)
+        for name, parse in options.items():
+            if name in params:
+                kwargs[name] = parse(params[name])
+        if "volunteers" in kwargs and "lola_sponsors" in params:
+            raise RenderError("volunteers only applies to the server's own lola_sponsors")
+        if document == "lola" and "lola_sponsors" not in params and ("researcher" in kwargs or "volunteers" in kwargs):
+            researcher = kwargs.get("researcher", DEFAULT_RESEARCHER)
+            people = partition(kwargs["lola_sponsors"], kwargs.pop("volunteers", ()))
+            if researcher not in people:
+                raise RenderError(f"no sponsors are assigned to {researcher!r}")
+            kwargs["lola_sponsors"] = people[researcher]
+            kwargs["researcher"] = researcher
+        return kwargs
+
+    def render(self, document, params):
+        """Render a document for a request and return (PDF bytes, seconds).
+
+        A bad request raises RenderError or DatasetError; a render that fails
+        in the worker raises RenderFailed.
+        """
+        if not self._slots.acquire(blocking=False):
+            raise Busy()
+        release = True
+        try:
+            kwargs = self.prepare(document, params)
+            pool = self._pool
+            future = pool.submit(render, document, kwargs)
+            try:
+                result = future.result(timeout=RENDER_TIMEOUT)
+            except TimeoutError:
+                if not future.cancel():
+                    # Still rendering: its worker stays taken until it is done, and so does the slot
+                    release = False
+                    future.add_done_callback(lambda _: self._slots.release())
+                raise
+            except BrokenProcessPool:
+                # A worker died mid-render; start a fresh pool for the next request
+                with self._lock:
+                    if self._pool is pool:
+                        self._pool = self._new_pool()
+                raise
+            except Exception as exc:
+                # Not the request's fault, whatever the type: a reconciliation's
+                # StatementError or a bad markup ValueError is the server's failure
+                raise RenderFailed(f"{type(exc).__name__}: {exc}") from exc
+            self.served += 1
+            return result
+        finally:
+            if release:
+                self._slots.release()
+
+    def status(self):
+        return {
+            "documents": self.documents,
+            "workers": self.jobs,
+            "served": self.served,
+            "uptime_seconds": round(time.time() - self.started, 1),
+        }
+
+
+class Handler(BaseHTTPRequestHandler):
+    server_version = "BBSRender/1.0"
+
+    def _send(self, status, content_type, body, headers=()):
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(body)))
+        for name, value in headers:
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _error(self, status, message):
+        self._send(status, "application/json", json.dumps({"error": message}).encode() + b"\n")
+
+    def do_GET(self):
+        if self.path != "/health":
+            return self._error(HTTPStatus.NOT_FOUND, "GET /health, or POST /render/<document>")
+        self._send(HTTPStatus.OK, "application/json", json.dumps(self.server.service.status()).encode() + b"\n")
+
+    def do_POST(self):
+        service = self.server.service
+        document = self.path.removeprefix("/render/") if self.path.startswith("/render/") else None
+        if document not in service.documents:
+            return self._error(HTTPStatus.NOT_FOUND, f"documents served: {', '.join(service.documents)}")
+        try:
+            length = int(self.headers.get("Content-Length") or 0)
+        except ValueError:
+            length = -1
+        if length < 0:
+            return self._error(HTTPStatus.BAD_REQUEST, "invalid Content-Length")
+        if length > MAX_BODY:
+            return self._error(HTTPStatus.REQUEST_ENTITY_TOO_LARGE, f"request body over {MAX_BODY} bytes")
+        try:
+            params = json.loads(self.rfile.read(length) or b"{}")
+        except ValueError as exc:
+            return self._error(HTTPStatus.BAD_REQUEST, f"invalid JSON: {exc}")
+        if not isinstance(params, dict):
+            return self._error(HTTPStatus.BAD_REQUEST, "expected a JSON object of parameters")
+
+        try:
+            pdf, seconds = service.render(document, params)
+        except Busy:
+            return self._error(HTTPStatus.SERVICE_UNAVAILABLE, "every worker is busy; try again shortly")
+        except (RenderError, DatasetError) as exc:
+            # Raised by prepare(): the request's parameters or records
+            return self._error(HTTPStatus.BAD_REQUEST, str(exc))
+        except TimeoutError:
+            return self._error(HTTPStatus.GATEWAY_TIMEOUT, f"render took longer than {RENDER_TIMEOUT}s")
+        except Exception as exc:
+            self.log_error("render of %s failed: %r", document, exc.__cause__ or exc)
+            return self._error(HTTPStatus.INTERNAL_SERVER_ERROR, f"render failed: {exc}")
+        self._send(HTTPStatus.OK, "application/pdf", pdf, [("X-Render-Seconds", f"{seconds:.3f}")])
+
+    def address_string(self):
+        # Unix socket peers have no address
+        return self.client_address[0] if self.client_address else "local"
+
+
+class UnixHTTPServer(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+    daemon_threads = True
+
+
+def _interrupt(signum, frame):
+    raise KeyboardInterrupt
+
+
+def serve(service, port=DEFAULT_PORT, socket_path=None):
+    """Start ``service`` and answer requests until interrupted."""
+    service.start()
+    if socket_path:
+        with contextlib.suppress(FileNotFoundError):
+            os.remove(socket_path)
+        server = UnixHTTPServer(socket_path, Handler)
+        where = socket_path
+    else:
+        server = ThreadingHTTPServer(("127.0.0.1", port), Handler)
+        where = f"http://127.0.0.1:{server.server_address[1]}"
+    server.service = service
+    # Shut down cleanly on SIGTERM too; installed after the workers forked so they keep the default
+    signal.signal(signal.SIGTERM, _interrupt)
+    print(f"Serving {', '.join(service.documents)} on {where} with {service.jobs} worker(s)", flush=True)
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        service.close()
+        if socket_path:
+            with contextlib.suppress(FileNotFoundError):
+                os.remove(socket_path)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("documents", nargs="*", metavar="DOCUMENT",
+                        help=f"documents to serve (default: all of {', '.join(RENDERERS)})")
+    parser.add_argument("--port", type=int, default=DEFAULT_PORT, help="localhost port to listen on (default: %(default)s)")
+    parser.add_argument("--socket", metavar="PATH", help="listen on this Unix socket instead of a port")
+    parser.add_argument("-j", "--jobs", type=int, help="worker processes (default: one per CPU)")
+    parser.add_argument("--backlog", type=int, default=DEFAULT_BACKLOG,
+                        help="requests that may wait for a worker before the server answers 503 (default: %(default)s)")
+    args = parser.parse_args()
+    unknown = [name for name in args.documents if name not in RENDERERS]
+    if unknown:
+        parser.error(f"unknown document(s): {', '.join(unknown)}")
+
+    serve(RenderService(args.documents or RENDERERS, args.jobs, args.backlog), args.port, args.socket)
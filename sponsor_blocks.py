@@ -0,0 +1,103 @@
+"""
+Per-sponsor flowables shared by the Lola task sheet and the working-links PDF
+
+Everything that is identical from one sponsor to the next - table styles,
+the checklist cells and the findings line - is built once and reused, so a
+record only pays for the Paragraphs that carry its own data.
+
+Only table *cell* contents are shared. Top-level flowables are always fresh
+instances: reportlab marks a flowable that is pushed to the next page, and a
+shared instance carrying that mark would fail the next time it lands at the
+bottom of a page. Paragraphs come from paragraph_cache instead, which hands
+out a new instance each time but parses and line-breaks repeated markup
+once.
+"""
+
+from functools import lru_cache
+
+from reportlab.lib.units import inch
+from reportlab.platypus import Spacer, Table, HRFlowable
+
+from dataset_loader import DEFAULT_RESEARCHER
+from paragraph_cache import paragraph
+from pdf_theme import ACCENT, RULE_LIGHT, get_styles, get_table_styles, priority_style
+
+HEADER_COLS = [5.2*inch, 1.8*inch]
+DETAIL_COLS = [3.5*inch, 3.5*inch]
+CHECKLIST_COLS = [1.75*inch, 1.75*inch, 1.75*inch, 1.75*inch]
+FINDINGS_COLS = [7*inch]
+
+TASK_CHECKLIST = ("Active?", "Deadline confirmed?", "Max amount?", "Docs needed?")
+LINK_CHECKLIST = ("Active?", "Deadline?", "Max $?", "Docs needed?")
+
+
+def fixed_paragraph(text, style_name):
+    """A new Paragraph of ``text`` in a registry style, from the paragraph cache."""
+    return paragraph(text, get_styles()[style_name])
+
+
+@lru_cache(maxsize=None)
+def checklist_row(labels):
+    """The checkbox cells ("Active?", "Deadline?", ...), built once per label set."""
+    small = get_styles()["small"]
+    return [[paragraph(f"\u2610 {label}", small) for label in labels]]
+
+
+@lru_cache(maxsize=None)
+def findings_row(researcher=DEFAULT_RESEARCHER):
+    small = get_styles()["small"]
+    return [[paragraph(f"<b>{researcher}'s Findings:</b> _______________________________________________________________________________", small)]]
+
+
+def sponsor_block(s, checklist=TASK_CHECKLIST, status=None, researcher=DEFAULT_RESEARCHER):
+    """Flowables for one sponsor: header, optional status line, link, details, deadline, notes, checklist and findings."""
+    styles = get_styles()
+    table_styles = get_table_styles()
+    small_style = styles["small"]
+    priority = s["priority"]
+
+    header_data = [[
+        paragraph(f"<b>#{s['num']}</b>  <b>{s['name']}</b>", styles["sponsor_name"]),
+        paragraph(f"<b>{priority}</b>", priority_style(priority)),
+    ]]
+    block = [Table(header_data, colWidths=HEADER_COLS, style=table_styles["sponsor_header"])]
+
+    if status:
+        block.append(paragraph(f"<b>STATUS: {status}</b>", styles["status_good"]))
+    block.append(paragraph(f'<link href="{s["url"]}">{s["url"]}</link>', styles["link"]))
+
+    detail_data = [[
+        paragraph(f"<b>Ask:</b> {s['amount']}", small_style),
+        paragraph(f"<b>Likelihood:</b> {s['likelihood']}", small_style),
+    ]]
+    block.append(Table(detail_data, colWidths=DETAIL_COLS, style=table_styles["sponsor_detail"]))
+    if s.get("deadline"):
+        block.append(paragraph(f"<b>Apply by:</b> {s['deadline']}", small_style))
+    block.append(paragraph(f"<b>Notes:</b> {s['notes']}", small_style))
+
+    block.append(Spacer(1, 3))
+    block.append(Table(checklist_row(checklist), colWidths=CHECKLIST_COLS, style=table_styles["checklist"]))
+    block.append(Spacer(1, 2))
+    block.append(Table(findings_row(researcher), colWidths=FINDINGS_COLS, style=table_styles["findings"]))
+
+    block.append(Spacer(1, 10))
+    block.append(HRFlowable(width="100%", thickness=0.5, color=RULE_LIGHT, spaceAfter=6))
+    return block
+
+
+def sponsor_section(sponsors, checklist=TASK_CHECKLIST, status=None, researcher=DEFAULT_RESEARCHER):
+    """Yield the flowables for a sponsor list, with a heading wherever the tier changes.
+
+    A generator, so StreamingDocTemplate can lay out very long lists without
+    every block existing at once.
+    """
+    heading_style = get_styles()["heading"]
+    current_tier = None
+    for s in sponsors:
+        if "tier" in s and s["tier"] != current_tier:
+            current_tier = s["tier"]
+            yield Spacer(1, 10)
+            yield paragraph(current_tier, heading_style)
+            yield HRFlowable(width="100%", thickness=1.5, color=ACCENT, spaceAfter=8)
+
+        yield from sponsor_block(s, checklist, status, researcher)
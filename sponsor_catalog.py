@@ -0,0 +1,297 @@
+#!/usr/bin/env python3
+"""
+One merged record per sponsor across the datasets and the strategy doc
+
+The same sponsor turns up in lola_sponsors, working_links, the broken and
+timed-out link lists and BBS-SPONSORSHIP-STRATEGY-2025-2026.md, under
+slightly different names ("Shopify - Social Impact" / "SHOPIFY -
+Community/Campus Partnership") and sometimes with different figures.
+build_catalog() merges them in two passes:
+
+1. A hash index on the canonical URL - scheme, "www.", locale segments
+   ("/ca/en/", "/en-ca/"), "index.html" and trailing slashes dropped - and
+   on the canonical name. Two records linking different pages are never
+   merged by name: they are different programs.
+2. Records with no URL (most strategy entries) are matched by name within
+   their brand's block ("RBC", "Shopify"): the block's only entry, or the
+   one sharing the most name words. Entries naming several firms ("BIG 4
+   FIRMS (Deloitte, EY, KPMG, PwC)") stay on their own.
+
+Each merged field takes the first value in SOURCES order - the strategy doc
+first, as the overlay it replaces did - and fields the sources disagree on
+are reported as conflicts. apply_catalog() fills in the figures a document's
+record leaves empty from its merged sponsor; a figure the record has, from
+its data file or from --lola-sponsors and the like, is always kept.
+
+    python sponsor_catalog.py              # merge summary and conflicts
+    python sponsor_catalog.py --json       # the merged records
+"""
+
+import argparse
+import json
+import os
+import re
+import sys
+from urllib.parse import urlsplit
+
+from dataset_loader import dataset_path, load_dataset
+from sponsor_strategy import STRATEGY_PATH, load_strategy
+
+STRATEGY = "strategy"
+# Most trusted first; a merged field takes its value from the first source that has one
+SOURCES = (STRATEGY, "lola_sponsors", "working_links", "broken_links", "timed_out_links")
+
+# Fields the merged record carries, and those apply_catalog() fills in on a document's records
+FIELDS = ("amount", "likelihood", "priority", "deadline", "notes", "suggestion")
+RENDER_FIELDS = ("amount", "likelihood", "priority", "deadline")
+# Free-text fields every source words its own way; not worth reporting as conflicts
+FREE_TEXT = frozenset({"notes", "suggestion"})
+
+# Share of name words two records must have in common to merge by name
+NAME_THRESHOLD = 0.5
+
+_LOCALE_PARTS = frozenset({"en", "fr", "ca", "us", "intl"})
+_INDEX_RE = re.compile(r"^(?:index|default)\.(?:html?|jsp|php|aspx?)$")
+_NAME_STOPWORDS = frozenset({"a", "an", "and", "for", "of", "the"})
+
+# In-process copy: input stamps -> Catalog
+_memo = {}
+
+
+def canonical_url(url):
+    """"https://www.rbc.com/en/x/index.html" -> "rbc.com/x"."""
+    url = url.strip().lower()
+    parts = urlsplit(url if "://" in url else "//" + url)
+    host = (parts.hostname or "").removeprefix("www.")
+    segments = [s for s in parts.path.split("/") if s]
+    if segments and _INDEX_RE.match(segments[-1]):
+        segments.pop()
+    segments = [s for s in segments if not all(p in _LOCALE_PARTS for p in re.split(r"[-_]", s))]
+    return "/".join([host] + segments)
+
+
+def name_words(name):
+    """Lower-case words of a name, "&" read as "and", plurals folded and filler words dropped."""
+    words = re.findall(r"[a-z0-9]+", name.lower().replace("&", " and ").replace("'", ""))
+    return [w[:-1] if len(w) > 3 and w.endswith("s") and not w.endswith("ss") else w
+            for w in words if w not in _NAME_STOPWORDS]
+
+
+def canonical_name(name):
+    return " ".join(name_words(name))
+
+
+def brand(name):
+    """The organization a name starts with ("rbc", "td"), or None for entries naming several."""
+    org = name.split(" - ", 1)[0]
+    if re.search(r"[/,(]", org):
+        return None
+    words = name_words(org)
+    return words[0] if words else None
+
+
+class Sponsor:
+    """A merged sponsor: display name, URL, merged fields and every source record behind it."""
+
+    __slots__ = ("name", "url", "fields", "records")
+
+    def __init__(self, name, url):
+        self.name = name
+        self.url = url
+        self.fields = {}
+        # [(source, record)] in the order they were merged
+        self.records = []
+
+    def __repr__(self):
+        return f"Sponsor({self.name!r}, {len(self.records)} records)"
+
+    def add(self, source, record):
+        self.records.append((source, record))
+        if not self.url and record.get("url"):
+            self.url = record["url"]
+
+    def merge(self):
+        rank = {source: i for i, source in enumerate(SOURCES)}
+        self.records.sort(key=lambda sr: rank[sr[0]])
+        self.fields = {}
+        for field in FIELDS:
+            for _, record in self.records:
+                value = record.get(field) or record.get("details", {}).get(field)
+                if value:
+                    self.fields[field] = value
+                    break
+
+    def conflicts(self):
+        """{field: {source: value}} for the fields the sources disagree on."""
+        found = {}
+        for field in FIELDS:
+            if field in FREE_TEXT:
+                continue
+            values = {}
+            for source, record in self.records:
+                value = record.get(field)
+                if value and source not in values:
+                    values[source] = value
+            if len({" ".join(v.lower().split()) for v in values.values()}) > 1:
+                found[field] = values
+        return found
+
+
+class Catalog:
+    def __init__(self, sponsors):
+        self.sponsors = sponsors
+        self._by_url = {}
+        self._by_name = {}
+        for sponsor in sponsors:
+            for _, record in sponsor.records:
+                if record.get("url"):
+                    self._by_url.setdefault(canonical_url(record["url"]), sponsor)
+                self._by_name.setdefault(canonical_name(record["name"]), sponsor)
+
+    def __len__(self):
+        return len(self.sponsors)
+
+    def __iter__(self):
+        return iter(self.sponsors)
+
+    def find(self, record):
+        """The merged Sponsor for a record, by URL, then by name when the record has no URL."""
+        if record.get("url"):
+            return self._by_url.get(canonical_url(record["url"]))
+        return self._by_name.get(canonical_name(record["name"]))
+
+
+def _records(source):
+    if source == STRATEGY:
+        return load_strategy() if os.path.exists(STRATEGY_PATH) else []
+    return load_dataset(source)
+
+
+def build_catalog(sources=None):
+    """Merge ``sources`` ([(source name, records)], default: every SOURCES) into a Catalog."""
+    if sources is None:
+        sources = [(source, _records(source)) for source in SOURCES]
+    sponsors = []
+    by_url, by_name = {}, {}
+    blocks = {}
+    unlinked = []
+
+    def new(source, record):
+        sponsor = Sponsor(record["name"], record.get("url"))
+        sponsors.append(sponsor)
+        key = brand(record["name"])
+        if key:
+            blocks.setdefault(key, []).append(sponsor)
+        return sponsor
+
+    # Pass 1: hash lookups on URL and name
+    for source, records in sources:
+        for record in records:
+            url = canonical_url(record["url"]) if record.get("url") else None
+            name = canonical_name(record["name"])
+            if not url:
+                unlinked.append((source, record))
+                continue
+            sponsor = by_url.get(url)
+            if sponsor is None:
+                # Never merged by name: the same name linking a different page is a different program
+                sponsor = by_url[url] = new(source, record)
+            by_name.setdefault(name, sponsor)
+            sponsor.add(source, record)
+
+    # Pass 2: records with no URL, by exact name, then by name words within the brand's block
+    for source, record in unlinked:
+        name = canonical_name(record["name"])
+        sponsor = by_name.get(name)
+        key = brand(record["name"])
+        if sponsor is None and key in blocks:
+            words = set(name_words(record["name"]))
+            best, score = None, 0.0
+            for candidate in blocks[key]:
+                theirs = set()
+                for _, r in candidate.records:
+                    theirs.update(name_words(r["name"]))
+                overlap = len(words & theirs) / len(words | theirs)
+                if overlap > score:
+                    best, score = candidate, overlap
+            if best is not None and (score >= NAME_THRESHOLD or len(blocks[key]) == 1):
+                sponsor = best
+        if sponsor is None:
+            sponsor = new(source, record)
+        by_name.setdefault(name, sponsor)
+        sponsor.add(source, record)
+
+    for sponsor in sponsors:
+        sponsor.merge()
+        # Prefer a dataset's wording of the name over the strategy doc's capitals
+        sponsor.name = next((r["name"] for s, r in sponsor.records if s != STRATEGY), sponsor.name)
+    return Catalog(sponsors)
+
+
+def _stamp(path):
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    return st.st_mtime_ns, st.st_size
+
+
+def load_catalog():
+    """The catalog of the default sources, rebuilt only when one of their files has changed."""
+    paths = [STRATEGY_PATH] + [dataset_path(source) for source in SOURCES if source != STRATEGY]
+    key = tuple(_stamp(path) for path in paths)
+    catalog = _memo.get(key)
+    if catalog is None:
+        _memo.clear()
+        catalog = _memo[key] = build_catalog()
+    return catalog
+
+
+def apply_catalog(records, catalog=None):
+    """Return copies of ``records`` with the RENDER_FIELDS they leave empty taken from their merged sponsor.
+
+    Records the catalog doesn't know, or that have nothing to fill, are
+    returned unchanged (not copied).
+    """
+    catalog = catalog if catalog is not None else load_catalog()
+    merged = []
+    for record in records:
+        sponsor = catalog.find(record)
+        if sponsor:
+            missing = {field: sponsor.fields[field] for field in RENDER_FIELDS
+                       if not record.get(field) and field in sponsor.fields}
+            if missing:
+                record = dict(record, **missing)
+        merged.append(record)
+    return merged
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--json", action="store_true", help="print the merged records as JSON")
+    args = parser.parse_args()
+
+    catalog = load_catalog()
+    if args.json:
+        records = [dict(name=s.name, url=s.url, **s.fields, sources=sorted({source for source, _ in s.records}))
+                   for s in catalog]
+        json.dump(records, sys.stdout, indent=2)
+        sys.stdout.write("\n")
+        sys.exit()
+
+    total = sum(len(s.records) for s in catalog)
+    print(f"{total} records -> {len(catalog)} sponsors")
+    for sponsor in catalog:
+        names = sorted({r["name"] for _, r in sponsor.records} - {sponsor.name})
+        if names:
+            print(f"\n{sponsor.name}  ({sponsor.url or 'no URL'})")
+            for name in names:
+                print(f"    also: {name}")
+    conflicted = [(s, s.conflicts()) for s in catalog]
+    conflicted = [(s, c) for s, c in conflicted if c]
+    print(f"\n{len(conflicted)} sponsor(s) with conflicting fields")
+    for sponsor, conflicts in conflicted:
+        print(f"\n{sponsor.name}")
+        for field, values in conflicts.items():
+            for source, value in values.items():
+                print(f"    {field:<11} {source:<16} {value}")
@@ -0,0 +1,144 @@
+#!/usr/bin/env python3
+"""
+Compile the master sponsor list in BBS-SPONSORSHIP-STRATEGY-2025-2026.md into records
+
+The strategy doc lists sponsors under "## TIER n: ..." sections as
+
+    ### 1. SCOTIABANK - ScotiaRISE Program
+    - **Ask Amount**: $5,000 - $10,000/year
+    - **Likelihood**: 85%
+    - **URL**: https://...
+    - **APPLY BY**: March 2025
+
+parse_strategy() reads that in one pass over the lines. The compiled records
+are cached in .strategy-cache.json keyed by the file's (mtime, size), so an
+unchanged doc is never parsed twice. sponsor_catalog merges these records
+with the datasets', which is how the strategy's figures reach the PDFs'
+records that have none of their own.
+"""
+
+import json
+import os
+import re
+import sys
+
+ROOT = os.path.dirname(os.path.abspath(__file__))
+STRATEGY_PATH = os.path.join(ROOT, "BBS-SPONSORSHIP-STRATEGY-2025-2026.md")
+CACHE_PATH = os.path.join(ROOT, ".strategy-cache.json")
+
+# Bold field labels -> record keys; other labels are kept under "details"
+FIELDS = {
+    "ask amount": "amount",
+    "likelihood": "likelihood",
+    "url": "url",
+    "apply by": "deadline",
+}
+
+# In-process copy of compiled docs: abspath -> (stamp, records)
+_memo = {}
+
+_TIER_RE = re.compile(r"^## (TIER \d+\b.*?)\s*$")
+_SPONSOR_RE = re.compile(r"^### (\d+)\.\s+(.+?)\s*$")
+_FIELD_RE = re.compile(r"^- \*\*(.+?)\*\*:\s*(.*?)\s*$")
+_BULLET_RE = re.compile(r"^- (.*?)\s*$")
+_SUB_BULLET_RE = re.compile(r"^\s+- (.*?)\s*$")
+
+
+def _label_key(label):
+    key = label.strip().lower()
+    return FIELDS.get(key) or re.sub(r"[^a-z0-9]+", "_", key).strip("_")
+
+
+def parse_strategy(lines):
+    """Yield one record per "### N. NAME" heading inside a TIER section.
+
+    Each record has ``num``, ``name`` and ``tier``, the FIELDS keys the entry
+    provides, and a ``details`` dict for every other labelled bullet.
+    Indented bullets are appended to the field above them.
+    """
+    tier = None
+    record = None
+    last = None
+    for line in lines:
+        line = line.rstrip("\n")
+        if line.startswith("## "):
+            if record:
+                yield record
+                record = None
+            m = _TIER_RE.match(line)
+            tier = m.group(1) if m else None
+            continue
+        if tier is None:
+            continue
+        m = _SPONSOR_RE.match(line)
+        if m:
+            if record:
+                yield record
+            record = {"num": int(m.group(1)), "name": m.group(2), "tier": tier, "details": {}}
+            last = None
+            continue
+        if record is None:
+            continue
+        m = _FIELD_RE.match(line)
+        if m:
+            key = _label_key(m.group(1))
+            if key in FIELDS.values():
+                record[key] = m.group(2)
+            else:
+                record["details"][key] = m.group(2)
+            last = key
+            continue
+        m = _SUB_BULLET_RE.match(line)
+        if m and last:
+            target = record if last in record else record["details"]
+            target[last] = f"{target[last]}\n{m.group(1)}".lstrip("\n")
+            continue
+        m = _BULLET_RE.match(line)
+        if m:
+            # Free-standing bullets ("- **More likely in-kind ...**") are notes
+            note = m.group(1).replace("**", "")
+            notes = record["details"].get("notes")
+            record["details"]["notes"] = f"{notes}\n{note}" if notes else note
+            last = "notes"
+    if record:
+        yield record
+
+
+def _load_cache(path):
+    try:
+        with open(path, encoding="utf-8") as fh:
+            return json.load(fh)
+    except (OSError, ValueError):
+        return {}
+
+
+def load_strategy(path=STRATEGY_PATH, cache_path=CACHE_PATH):
+    """Return the compiled records for a strategy doc, reparsing only when it has changed."""
+    st = os.stat(path)
+    stamp = [st.st_mtime_ns, st.st_size]
+    key = os.path.abspath(path)
+    cached = _memo.get(key)
+    if cached and cached[0] == stamp:
+        return cached[1]
+
+    cache = _load_cache(cache_path) if cache_path else {}
+    entry = cache.get(key)
+    if entry and entry["stamp"] == stamp:
+        records = entry["records"]
+    else:
+        with open(path, encoding="utf-8") as fh:
+            records = list(parse_strategy(fh))
+        if cache_path:
+            cache[key] = {"stamp": stamp, "records": records}
+            tmp = cache_path + ".tmp"
+            with open(tmp, "w", encoding="utf-8") as fh:
+                json.dump(cache, fh)
+            os.replace(tmp, cache_path)
+    _memo[key] = (stamp, records)
+    return records
+
+
+if __name__ == "__main__":
+    path = sys.argv[1] if len(sys.argv) > 1 else STRATEGY_PATH
+    json.dump(load_strategy(path), sys.stdout, indent=2)
+    sys.stdout.write("\n")
@@ -0,0 +1,113 @@
+"""
+Aggregate sponsor records into the counts and revenue figures the PDFs print
+
+Ask amounts are free text ("$3,000 - $10,000", "Up to $150,000/year",
+"Partnership + $10K scholarships", "Various"); parse_amount turns them into
+numeric (min, max) ranges. summarize() then walks the records once and
+totals counts, revenue ranges and likelihood-weighted expected value per
+tier.
+"""
+
+import re
+
+_MONEY = r"\$\s*([\d,]+(?:\.\d+)?)\s*([KkMm])?(\+)?"
+_RANGE_RE = re.compile(_MONEY + r"\s*(?:-|to|–)\s*" + _MONEY)
+_SINGLE_RE = re.compile(_MONEY)
+_UP_TO_RE = re.compile(r"\bup to\s*$", re.IGNORECASE)
+_PERCENT_RE = re.compile(r"(\d+(?:\.\d+)?)\s*%")
+_SCALE = {"": 1, "k": 1_000, "m": 1_000_000}
+
+
+def _money(number, suffix):
+    return float(number.replace(",", "")) * _SCALE[(suffix or "").lower()]
+
+
+def parse_amount(text):
+    """Parse an ask amount into (low, high, open_ended), or None if it names no dollar figure.
+
+    Only the text before any parenthetical is read, so
+    "$5,000 - $10,000/year (multi-year: $15,000-$30,000 over 3 years)"
+    yields the headline 5,000-10,000 range.
+    """
+    head = text.split("(", 1)[0]
+    m = _RANGE_RE.search(head)
+    if m:
+        low, high = _money(m.group(1), m.group(2)), _money(m.group(4), m.group(5))
+        return low, high, bool(m.group(6)) or "in-kind" in head.lower()
+    m = _SINGLE_RE.search(head)
+    if not m:
+        return None
+    value = _money(m.group(1), m.group(2))
+    low = 0.0 if _UP_TO_RE.search(head[:m.start()]) else value
+    return low, value, bool(m.group(3)) or "in-kind" in head.lower()
+
+
+def parse_likelihood(text):
+    """"80%" -> 0.8; None when the likelihood is not a percentage ("N/A - Research Tool")."""
+    m = _PERCENT_RE.search(text)
+    return float(m.group(1)) / 100 if m else None
+
+
+class Totals:
+    """Running totals for one tier (or the whole list)."""
+
+    __slots__ = ("count", "priced", "low", "high", "expected", "open_ended")
+
+    def __init__(self):
+        self.count = 0
+        self.priced = 0
+        self.low = 0.0
+        self.high = 0.0
+        self.expected = 0.0
+        self.open_ended = False
+
+    def add(self, amount, likelihood):
+        self.count += 1
+        if likelihood == 0:
+            # Reference-only entries (e.g. out-of-province programs) add no revenue
+            return
+        if amount is None:
+            self.open_ended = True
+            return
+        low, high, open_ended = amount
+        self.priced += 1
+        self.low += low
+        self.high += high
+        self.open_ended = self.open_ended or open_ended
+        if likelihood is not None:
+            self.expected += likelihood * (low + high) / 2
+
+    def revenue_range(self):
+        """e.g. "$30,000 - $250,000+"; the "+" marks asks with no fixed dollar figure."""
+        plus = "+" if self.open_ended else ""
+        if not self.priced:
+            return "Not quantified"
+        if self.low == self.high:
+            return f"{format_money(self.high)}{plus}"
+        return f"{format_money(self.low)} - {format_money(self.high)}{plus}"
+
+
+class Summary:
+    def __init__(self):
+        self.total = Totals()
+        self.tiers = {}
+
+
+def summarize(records):
+    """One pass over sponsor records; tiers carry forward from the last record that named one."""
+    summary = Summary()
+    tier = None
+    for s in records:
+        tier = s.get("tier", tier)
+        amount = parse_amount(s["amount"])
+        likelihood = parse_likelihood(s["likelihood"])
+        summary.total.add(amount, likelihood)
+        tier_totals = summary.tiers.get(tier)
+        if tier_totals is None:
+            tier_totals = summary.tiers[tier] = Totals()
+        tier_totals.add(amount, likelihood)
+    return summary
+
+
+def format_money(value):
+    return f"${value:,.0f}"
@@ -0,0 +1,53 @@
+"""
+Streaming document build for sponsor lists too long to hold as one flowable list
+
+SimpleDocTemplate.build() takes a list and keeps every flowable alive until
+the last page is drawn. StreamingDocTemplate.build() accepts any iterable -
+typically a generator yielding one sponsor block at a time - and pulls it in
+chunks, so only the flowables waiting to be laid out are in memory at once.
+Layout and output are identical to building from the equivalent list.
+
+Only the flowables are bounded. The generators still load every record
+(load_dataset() returns a list), count them for the intro text and keep a
+row per record for the closing summary table, so memory still grows with
+the record count - by the records and one table row each, rather than by
+the dozen or so flowables each sponsor block is made of.
+"""
+
+from itertools import islice
+
+from reportlab.platypus import SimpleDocTemplate
+
+# Flowables pulled from the iterable per refill; comfortably more than any
+# keepWithNext run, which reportlab resolves by looking ahead in the list
+CHUNK = 200
+
+
+class StreamingDocTemplate(SimpleDocTemplate):
+    _pending = None
+
+    def build(self, flowables, *args, chunk=CHUNK, **kwargs):
+        """Build the document from an iterable of flowables, ``chunk`` at a time."""
+        self._stream = iter(flowables)
+        self._chunk = chunk
+        self._pending = []
+        self._refill()
+        try:
+            super().build(self._pending, *args, **kwargs)
+        finally:
+            self._stream = self._pending = None
+
+    def _refill(self):
+        if len(self._pending) < self._chunk:
+            self._pending.extend(islice(self._stream, self._chunk))
+
+    def handle_flowable(self, flowables):
+        # reportlab also calls this for its own internal queues; only the
+        # build list is fed from the stream
+        if flowables is not self._pending:
+            return super().handle_flowable(flowables)
+        # The base build loop stops as soon as its list is empty, so top it up
+        # both before a flowable is placed (for lookahead) and after
+        self._refill()
+        super().handle_flowable(flowables)
+        self._refill()
@@ -0,0 +1,84 @@
+import os
+from datetime import date
+
+from PIL import Image
+from pypdf import PdfReader
+from reportlab.pdfgen.canvas import Canvas
+
+import audit_packet
+from audit_packet import build_packet, find_documents, in_period, name_date, period_statements
+
+
+def test_name_date():
+    assert name_date("Receipts/Canva Invoice Jun 22, 2024.pdf") == date(2024, 6, 22)
+    assert name_date("Receipts/September 2024/bbq.pdf") == date(2024, 9, 1)
+    assert name_date("Receipts/Canva 10.24.png") == date(2024, 10, 1)
+    assert name_date("Receipts/invoice 13.24.pdf") is None
+    assert name_date("Receipts/v1.2.3.pdf") is None
+
+
+def test_in_period():
+    start, end = date(2024, 5, 15), date(2024, 8, 31)
+    assert in_period("Canva 05.24.png", start, end)
+    assert not in_period("Canva 04.24.png", start, end)
+    assert not in_period("Canva 09.24.png", start, end)
+    assert not in_period("undated receipt.pdf", start, end)
+
+
+def test_find_documents(tmp_path):
+    for name in ("a Jun 2024.pdf", "b 07.24.png", "c Jul 2024.docx", "Receipt Template.pdf", "d Dec 2024.pdf", "~$e.pdf"):
+        (tmp_path / name).write_bytes(b"")
+    (tmp_path / "Aug 2024").mkdir()
+    (tmp_path / "Aug 2024" / "lunch.pdf").write_bytes(b"")
+    (tmp_path / "BBQ Expense.png").write_bytes(b"")
+    documents, others, undated = find_documents(str(tmp_path), date(2024, 5, 1), date(2024, 8, 31))
+    assert [os.path.relpath(p, tmp_path) for p in documents] == [
+        os.path.join("Aug 2024", "lunch.pdf"), "a Jun 2024.pdf", "b 07.24.png"]
+    assert [os.path.basename(p) for p in others] == ["c Jul 2024.docx"]
+    # Listed for every period, copied into none
+    assert [os.path.basename(p) for p in undated] == ["BBQ Expense.png"]
+    assert find_documents(str(tmp_path), date(2025, 1, 1), date(2025, 4, 30))[2] == undated
+
+
+def test_period_statements_overlap():
+    statements = [{"period_start": date(2024, m, 15), "period_end": date(2024, m + 1, 14)} for m in range(3, 10)]
+    found = period_statements(date(2024, 5, 1), date(2024, 6, 30), statements)
+    assert [s["period_start"].month for s in found] == [4, 5, 6]
+
+
+def test_build_packet_appends_sources_with_bookmarks(tmp_path, monkeypatch):
+    monkeypatch.setattr(audit_packet, "period_statements", lambda start, end: [])
+    receipt = str(tmp_path / "Store Jun 2024.pdf")
+    canvas = Canvas(receipt)
+    for page in range(2):
+        canvas.drawString(72, 720, f"receipt page {page + 1}")
+        canvas.showPage()
+    canvas.save()
+    photo = str(tmp_path / "lunch 06.24.png")
+    Image.new("RGB", (40, 30), "white").save(photo)
+
+    output, pages = build_packet(date(2024, 6, 1), date(2024, 6, 30), str(tmp_path / "packet.pdf"),
+                                 receipts=[receipt, photo], minutes=[])
+    reader = PdfReader(output)
+    assert len(reader.pages) == pages == 1 + 2 + 1
+    assert "receipt page 2" in reader.pages[2].extract_text()
+    cover = reader.pages[0].extract_text()
+    assert "No bank statement covers this period." in cover and "Store Jun 2024" in cover
+    outline = reader.outline
+    assert [item.title for item in outline if not isinstance(item, list)] == ["Cover and contents", "Receipts"]
+    assert [reader.get_destination_page_number(item) for item in outline[2]] == [1, 3]
+
+
+def test_undated_files_are_listed_on_the_cover_not_appended(tmp_path, monkeypatch):
+    receipts = tmp_path / "receipts"
+    receipts.mkdir()
+    Image.new("RGB", (40, 30), "white").save(receipts / "BBQ Expense.png")
+    Image.new("RGB", (40, 30), "white").save(receipts / "Lunch Jun 2024.png")
+    monkeypatch.setattr(audit_packet, "period_statements", lambda start, end: [])
+    monkeypatch.setattr(audit_packet, "RECEIPTS_DIR", str(receipts))
+    monkeypatch.setattr(audit_packet, "FINANCES_DIR", str(tmp_path))
+    output, pages = build_packet(date(2024, 6, 1), date(2024, 6, 30), str(tmp_path / "packet.pdf"), minutes=[])
+    assert pages == 2
+    cover = " ".join(PdfReader(output).pages[0].extract_text().split())
+    assert "UNDATED" in cover and "BBQ Expense.png" in cover
+    assert [item.title for item in PdfReader(output).outline[2]] == ["Lunch Jun 2024"]
@@ -0,0 +1,67 @@
+from datetime import date
+
+import pytest
+
+from bank_statements import StatementError, cents, find_statements, format_cents, parse_statement, parse_statement_text
+
+STATEMENT = """\
+Your business account statement
+December 15, 2024 to January 14, 2025
+Account number: 01234 100-172-6
+Total deposits & credits (2) + 1,050.00
+Total cheques & debits (2) - 56.00
+Account Activity Details
+Date Description Withdrawals ($) Deposits ($) Balance ($)
+Opening balance 1,000.00
+20 Dec Mobile cheque deposit 1,000.00
+20 Dec Monthly fee 6.00 1,994.00
+Page 1 of 2
+02 Jan02 Jan e-Transfer sent Coffee Co 50.00
+Payable pmt refund 50.00 1,994.00
+Closing balance 1,994.00
+"""
+
+
+def test_cents_and_format_cents():
+    assert cents("1,234.56") == 123456
+    assert cents("0.05") == 5
+    assert format_cents(123456) == "$1,234.56"
+    assert format_cents(-5) == "-$0.05"
+
+
+def test_parse_statement_text_signs_each_group_from_the_balance():
+    statement = parse_statement_text(STATEMENT)
+    assert statement["account"] == "01234 100-172-6"
+    assert (statement["period_start"], statement["period_end"]) == (date(2024, 12, 15), date(2025, 1, 14))
+    assert (statement["opening"], statement["closing"]) == (100000, 199400)
+    columns = statement["transactions"]
+    # Dated across New Year; an undated line takes the date above it
+    assert columns["date"] == [date(2024, 12, 20), date(2024, 12, 20), date(2025, 1, 2), date(2025, 1, 2)]
+    assert columns["credit"] == [100000, 0, 0, 5000]
+    assert columns["debit"] == [0, 600, 5000, 0]
+    assert columns["balance"] == [200000, 199400, 194400, 199400]
+
+
+def test_unbalanced_statement_is_an_error():
+    with pytest.raises(StatementError, match="no debit/credit split"):
+        parse_statement_text(STATEMENT.replace("6.00 1,994.00", "7.00 1,994.00"), "bad.pdf")
+
+
+def test_summary_totals_are_checked():
+    with pytest.raises(StatementError, match="summary says"):
+        parse_statement_text(STATEMENT.replace("(2) - 56.00", "(2) - 57.00"))
+
+
+def test_missing_period_or_balances():
+    with pytest.raises(StatementError, match="no statement period"):
+        parse_statement_text("Date Description\nOpening balance 1.00\n")
+    with pytest.raises(StatementError, match="opening/closing"):
+        parse_statement_text(STATEMENT.split("Closing balance")[0])
+
+
+def test_shipped_statements_parse():
+    paths = find_statements()
+    if not paths:
+        pytest.skip("no statements in this checkout")
+    statement = parse_statement(paths[0])
+    assert statement["transactions"]["balance"][-1:] in ([], [statement["closing"]])
@@ -0,0 +1,51 @@
+import os
+import subprocess
+import sys
+
+import pytest
+
+import bbs_docs
+from bbs_docs import COMMANDS
+
+ROOT = os.path.dirname(os.path.abspath(bbs_docs.__file__))
+
+# Runs bbs_docs with the given arguments, then reports whether reportlab got imported
+PROBE = """
+import runpy, sys
+sys.argv = ["bbs_docs.py"] + sys.argv[1:]
+try:
+    runpy.run_path("bbs_docs.py", run_name="__main__")
+except SystemExit:
+    pass
+sys.stdout.flush()
+print("reportlab loaded:", "reportlab" in sys.modules)
+"""
+
+
+def run(*args):
+    return subprocess.run([sys.executable, "-c", PROBE, *args], cwd=ROOT, capture_output=True, text=True, timeout=60)
+
+
+def test_every_command_is_a_script():
+    for name, (module, _) in COMMANDS.items():
+        with open(os.path.join(ROOT, module + ".py"), encoding="utf-8") as fh:
+            assert 'if __name__ == "__main__":' in fh.read(), name
+
+
+def test_listing_the_commands_skips_reportlab():
+    result = run()
+    assert "commands:" in result.stdout and "audit-packet" in result.stdout
+    assert result.stdout.rstrip().endswith("reportlab loaded: False")
+
+
+@pytest.mark.parametrize("command", ["banking", "calendar", "build"])
+def test_subcommand_help_skips_reportlab(command):
+    result = run(command, "--help")
+    # The script's own help, as if it had been run directly
+    assert result.stdout.startswith(f"usage: {COMMANDS[command][0]}.py")
+    assert result.stdout.rstrip().endswith("reportlab loaded: False")
+
+
+def test_unknown_command():
+    result = run("nope")
+    assert "invalid choice: 'nope'" in result.stderr
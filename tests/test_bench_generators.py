@@ -0,0 +1,44 @@
+import importlib.util
+import os
+
+import pytest
+
+import build_all
+
+spec = importlib.util.spec_from_file_location(
+    "bench_generators", os.path.join(build_all.ROOT, "benchmarks", "bench_generators.py"))
+bench_generators = importlib.util.module_from_spec(spec)
+spec.loader.exec_module(bench_generators)
+
+
+def test_synth_dataset_cycles_and_renumbers():
+    records = bench_generators.synth_dataset("lola_sponsors", 25)
+    assert len(records) == 25
+    assert [r["num"] for r in records] == list(range(1, 26))
+
+
+@pytest.mark.parametrize("document", bench_generators.SCALED)
+def test_scaled_documents_take_their_datasets(document):
+    kwargs = bench_generators.synth_inputs(document, 3)
+    lookups = bench_generators.LOOKUP_DATASETS.get(document, ())
+    assert {name for name in kwargs if name != "link_status"} == \
+        {name for name in build_all.DOCUMENTS[document][2] if name not in lookups}
+
+
+def test_bench_runs_a_document_in_a_worker(tmp_path):
+    result = bench_generators.bench("banking", 10, str(tmp_path))
+    assert result["pages"] > 0 and result["output_bytes"] > 0
+    assert result["peak_rss_kb"] >= result["rss_before_kb"] > 0
+
+
+def test_compare_flags_regressions(capsys):
+    old = {"document": "lola", "records": 10, "seconds": 1.0, "peak_rss_kb": 1000, "output_bytes": 500}
+    baseline = {"environment": {"created": "then"}, "results": [old],
+                "startup": [{"command": "bbs-docs --help", "seconds": 0.1, "modules": 100}]}
+    results = [dict(old, seconds=1.5, peak_rss_kb=1050), dict(old, document="banking")]
+    startup = [{"command": "bbs-docs --help", "seconds": 0.3, "modules": 150}]
+    regressions = bench_generators.compare(results, baseline, 0.10, startup)
+    assert [(r[0], r[2]) for r in regressions] == [("lola", "seconds"), ("startup", "modules")]
+    assert "Against then" in capsys.readouterr().out
+    assert bench_generators.over_budget(
+        [{"command": "a", "seconds": 0.1, "pdf_stack": True}, {"command": "b", "seconds": 0.1, "pdf_stack": False}]) == ["a"]
@@ -0,0 +1,41 @@
+import pytest
+
+from budgets import ACTUAL, EXPENSES, PLANNED, REVENUE, group_totals, read_budget_sheet, sheet_kind, variance
+
+
+def test_sheet_kind():
+    assert sheet_kind("Fall 2024 Budget") == ("Fall 2024", PLANNED)
+    assert sheet_kind("Fall 2024 Actual Budget") == ("Fall 2024", ACTUAL)
+    assert sheet_kind("Example Budget") is None
+    assert sheet_kind("Notes") is None
+
+
+def test_read_budget_sheet_groups_lines_by_section():
+    rows = [
+        ("Projected Revenue", "Sep", "Oct", "Total"),
+        ("UOSU grant", 100, 50, None),
+        ("Sponsors", None, None, 200.5),
+        ("Total Revenue", None, None, 350.5),
+        ("Projected Expenses", None, None, None),
+        ("Net Summit", None, None, None),
+        ("Venue", 80, None, 80),
+        ("Total Expenses", None, None, 80),
+        ("Surplus", None, None, 270.5),
+    ]
+    totals = group_totals(read_budget_sheet(rows, "Fall 2024", PLANNED))
+    assert totals == {
+        ("Fall 2024", PLANNED, REVENUE, REVENUE): 35050,
+        ("Fall 2024", PLANNED, EXPENSES, "Net Summit"): 8000,
+    }
+
+
+def test_revenue_header_without_month_columns_is_an_error():
+    rows = [("Projected Revenue", None, "Total"), ("Grant", None, 100)]
+    with pytest.raises(ValueError, match="no month columns"):
+        read_budget_sheet(rows, "Fall 2024", PLANNED)
+
+
+def test_variance_needs_both_figures():
+    assert variance(10000, 8000) == -2000
+    assert variance(None, 8000) is None
+    assert variance(10000, None) is None
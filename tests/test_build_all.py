@@ -0,0 +1,48 @@
+import glob
+import os
+
+import pytest
+
+import build_all
+from build_cache import BuildCache
+
+
+def test_every_generator_is_registered():
+    generators = {os.path.basename(p)[:-3] for p in glob.glob(os.path.join(build_all.ROOT, "generate_*_pdf.py"))}
+    assert generators == {module for module, _, _, _ in build_all.DOCUMENTS.values()}
+
+
+def test_repeated_names_build_once(tmp_path, monkeypatch):
+    monkeypatch.setattr(build_all, "BuildCache", lambda: BuildCache(str(tmp_path / "cache.json")))
+    results = build_all.build_all(["banking", "banking"], jobs=1, output_dir=str(tmp_path))
+    assert [name for name, _, _ in results] == ["banking"]
+    # Nothing changed since, so the second run skips it
+    [(_, output, seconds)] = build_all.build_all(["banking"], jobs=1, output_dir=str(tmp_path))
+    assert seconds is None and os.path.exists(output)
+
+
+def test_dated_documents_go_stale_with_the_day(tmp_path):
+    cache = BuildCache(str(tmp_path / "cache.json"))
+    module, _, datasets, inputs = build_all.DOCUMENTS["calendar"]
+    assert cache.document_digest(module, datasets, inputs, ("2026-01-01",)) != \
+        cache.document_digest(module, datasets, inputs, ("2026-01-02",))
+
+
+def test_a_failed_document_does_not_lose_the_others(tmp_path, monkeypatch):
+    monkeypatch.setattr(build_all, "BuildCache", lambda: BuildCache(str(tmp_path / "cache.json")))
+    real_render = build_all.render
+
+    def render(name, output_dir=None):
+        if name == "lola":
+            raise ValueError("bad markup")
+        return real_render(name, output_dir)
+
+    monkeypatch.setattr(build_all, "render", render)
+    with pytest.raises(build_all.BuildFailed) as failed:
+        build_all.build_all(["lola", "banking"], jobs=1, output_dir=str(tmp_path))
+    assert [(name, str(exc)) for name, exc in failed.value.failures] == [("lola", "bad markup")]
+    assert [name for name, _, _ in failed.value.results] == ["banking"]
+    # banking's build was recorded, so only lola is tried again
+    monkeypatch.setattr(build_all, "render", real_render)
+    results = build_all.build_all(["lola", "banking"], jobs=1, output_dir=str(tmp_path))
+    assert [(name, seconds is None) for name, _, seconds in results] == [("lola", False), ("banking", True)]
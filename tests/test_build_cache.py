@@ -0,0 +1,64 @@
+import os
+
+import build_cache
+from build_cache import BuildCache
+
+
+def test_file_digest_is_memoised_by_stamp(tmp_path, monkeypatch):
+    path = tmp_path / "input.txt"
+    path.write_text("one")
+    cache = BuildCache(str(tmp_path / "cache.json"))
+    first = cache.file_digest(str(path))
+
+    opened = []
+    real_open = open
+    monkeypatch.setattr("builtins.open", lambda *a, **k: opened.append(a[0]) or real_open(*a, **k))
+    assert cache.file_digest(str(path)) == first
+    assert opened == []
+
+    monkeypatch.undo()
+    path.write_text("two!")
+    assert cache.file_digest(str(path)) != first
+
+
+def test_document_digest_follows_extra_inputs(tmp_path):
+    extra = tmp_path / "notes.md"
+    cache = BuildCache(str(tmp_path / "cache.json"))
+    missing = cache.document_digest("generate_banking_pdf", ("banks",), (str(extra),))
+    extra.write_text("draft")
+    drafted = cache.document_digest("generate_banking_pdf", ("banks",), (str(extra),))
+    assert drafted != missing
+    assert cache.document_digest("generate_banking_pdf", ("banks",), (str(extra),)) == drafted
+    assert cache.document_digest("generate_banking_pdf", ("banks", "bank_comparison"), (str(extra),)) != drafted
+
+
+def test_outputs_survive_a_reload(tmp_path):
+    path = str(tmp_path / "cache.json")
+    output = tmp_path / "out.pdf"
+    cache = BuildCache(path)
+    cache.record(str(output), "abc")
+    assert not cache.is_fresh(str(output), "abc")  # not written yet
+    output.write_bytes(b"%PDF")
+    cache.save()
+
+    reloaded = BuildCache(path)
+    assert reloaded.is_fresh(str(output), "abc")
+    assert not reloaded.is_fresh(str(output), "def")
+
+
+def test_save_skips_an_unchanged_cache(tmp_path):
+    path = str(tmp_path / "cache.json")
+    BuildCache(path).save()
+    assert not os.path.exists(path)
+
+
+def test_corrupt_cache_starts_empty(tmp_path):
+    path = tmp_path / "cache.json"
+    path.write_text("{not json")
+    cache = BuildCache(str(path))
+    assert cache.files == {} and cache.outputs == {}
+
+
+def test_shared_code_exists():
+    for name in build_cache.SHARED_CODE:
+        assert os.path.exists(os.path.join(build_cache.ROOT, name)), name
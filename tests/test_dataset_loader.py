@@ -0,0 +1,113 @@
+import csv
+import io
+import json
+
+import pytest
+
+from dataset_loader import DATASETS, VERDICT_COLORS, DatasetError, Schema, _iter_json_array, iter_dataset, load_dataset
+
+SPONSOR = {"num": 1, "name": "RBC", "url": "https://rbc.com", "amount": "$5,000", "likelihood": "80%",
+           "priority": "HIGH", "notes": "Apply in March"}
+
+
+@pytest.mark.parametrize("name", DATASETS)
+def test_the_shipped_data_files_validate(name):
+    assert load_dataset(name)
+
+
+def write(tmp_path, name, text):
+    path = tmp_path / name
+    path.write_text(text, encoding="utf-8")
+    return str(path)
+
+
+def csv_text(records):
+    out = io.StringIO()
+    writer = csv.DictWriter(out, fieldnames=list(records[0]))
+    writer.writeheader()
+    writer.writerows(records)
+    return out.getvalue()
+
+
+def test_every_format_reads_the_same_records(tmp_path):
+    paths = [
+        write(tmp_path, "s.json", json.dumps([SPONSOR, dict(SPONSOR, num=2)])),
+        write(tmp_path, "s.jsonl", "\n".join(json.dumps(r) for r in (SPONSOR, dict(SPONSOR, num=2))) + "\n\n"),
+        write(tmp_path, "s.csv", csv_text([dict(SPONSOR, tier=""), dict(SPONSOR, num=2, tier="")])),
+    ]
+    for path in paths:
+        assert load_dataset("lola_sponsors", path) == [SPONSOR, dict(SPONSOR, num=2)], path
+
+
+def test_yaml_needs_pyyaml_or_reads_like_json(tmp_path):
+    path = write(tmp_path, "s.yaml", "- " + "\n  ".join(f"{k}: {json.dumps(v)}" for k, v in SPONSOR.items()) + "\n")
+    try:
+        import yaml  # noqa: F401
+    except ImportError:
+        with pytest.raises(DatasetError, match="PyYAML"):
+            load_dataset("lola_sponsors", path)
+    else:
+        assert load_dataset("lola_sponsors", path) == [SPONSOR]
+
+
+def test_missing_required_field(tmp_path):
+    path = write(tmp_path, "s.json", json.dumps([SPONSOR, {"num": 2, "name": "TD"}]))
+    with pytest.raises(DatasetError, match=r"s.json record 2: missing required field 'url'"):
+        load_dataset("lola_sponsors", path)
+
+
+def test_wrong_type_names_the_field_and_value():
+    with pytest.raises(DatasetError, match=r"here: field 'num' should be int, got 'one'"):
+        Schema({"num": int}).validate({"num": "one"}, "here")
+    with pytest.raises(DatasetError, match="expected an object, got list"):
+        Schema({"num": int}).validate([1], "here")
+
+
+def test_verdict_colors_must_be_theme_colors(tmp_path):
+    pdf_theme = pytest.importorskip("pdf_theme")
+    assert VERDICT_COLORS == set(pdf_theme.VERDICT_COLORS)
+    bank = dict(load_dataset("banks")[0], verdict_color="gren")
+    path = write(tmp_path, "b.json", json.dumps([bank]))
+    with pytest.raises(DatasetError, match=r"b.json record 1: field 'verdict_color' should be one of gold, green, orange, got 'gren'"):
+        load_dataset("banks", path)
+
+
+def test_csv_strings_are_coerced_and_empty_optionals_dropped():
+    record = Schema({"num": int}, {"tier": str}).validate({"num": "7", "tier": ""}, "row")
+    assert record == {"num": 7}
+
+
+def test_unsupported_and_malformed_files(tmp_path):
+    with pytest.raises(DatasetError, match="unsupported data file type"):
+        load_dataset("banks", write(tmp_path, "b.txt", ""))
+    with pytest.raises(DatasetError, match="JSON array"):
+        load_dataset("banks", write(tmp_path, "b.json", "{}"))
+    with pytest.raises(DatasetError, match="truncated"):
+        load_dataset("banks", write(tmp_path, "c.json", '[{"rank": "1"'))
+
+
+def test_json_array_is_read_in_chunks():
+    records = [{"i": i, "text": "x" * i} for i in range(200)]
+    assert list(_iter_json_array(io.StringIO(json.dumps(records)), chunk_size=16)) == records
+
+
+@pytest.mark.parametrize("text", ['[{"i": 1},,,{"i": 2}]', '[,{"i": 1}]', '[{"i": 1},]', '[{"i": 1} {"i": 2}]'])
+def test_json_array_rejects_what_json_rejects(text):
+    with pytest.raises(ValueError):
+        json.loads(text)
+    for chunk_size in (4, 65536):
+        with pytest.raises(DatasetError):
+            list(_iter_json_array(io.StringIO(text), chunk_size=chunk_size))
+
+
+def test_json_array_whitespace_and_empty():
+    assert list(_iter_json_array(io.StringIO("[]"))) == []
+    assert list(_iter_json_array(io.StringIO(' [ {"i": 1} ,\n {"i": 2}\n] '), chunk_size=3)) == [{"i": 1}, {"i": 2}]
+
+
+def test_records_stream_one_at_a_time(tmp_path):
+    path = write(tmp_path, "s.jsonl", json.dumps(SPONSOR) + "\nnot json\n")
+    records = iter_dataset("lola_sponsors", path)
+    assert next(records) == SPONSOR
+    with pytest.raises(ValueError):
+        next(records)
@@ -0,0 +1,107 @@
+import calendar
+from datetime import date, datetime
+
+import pytest
+
+from deadlines import Deadline, DeadlineIndex, add_months, parse_deadlines, to_ics
+
+
+def test_parse_day_month_and_window():
+    found, per_year = parse_deadlines("April 9, 2025 (Expression of Interest) -> July 9 (Full Application)")
+    assert [(d.due, d.label) for d in found] == [
+        (date(2025, 4, 9), "Expression of Interest"), (date(2025, 7, 9), "Full Application")]
+    assert per_year == 0
+    [window], _ = parse_deadlines("May-July 2025 (for September start)")
+    assert (window.opens, window.due, window.label) == (date(2025, 5, 1), date(2025, 7, 31), "for September start")
+    [month], per_year = parse_deadlines("APPLY BY: March 2025, 4 intake deadlines per year")
+    assert (month.due, per_year) == (date(2025, 3, 31), 4)
+
+
+def test_text_without_a_year_has_no_deadline():
+    assert parse_deadlines("Check website for current grant cycles") == ([], 0)
+    assert parse_deadlines("Due March 3") == ([], 0)
+
+
+@pytest.mark.parametrize("day, months, expected", [
+    (date(2025, 1, 31), 1, date(2025, 2, 28)),
+    (date(2025, 2, 28), 1, date(2025, 3, 31)),   # month end stays at month end
+    (date(2025, 1, 30), 1, date(2025, 2, 28)),   # clamped
+    (date(2025, 1, 30), 2, date(2025, 3, 30)),   # counted from the original day
+    (date(2025, 11, 15), 3, date(2026, 2, 15)),
+])
+def test_add_months(day, months, expected):
+    assert add_months(day, months) == expected
+
+
+def test_next_due_of_a_recurring_deadline():
+    d = Deadline(date(2025, 8, 31), "TD", "", "for September review cycle", every=3)
+    assert d.next_due(date(2025, 8, 1)) == date(2025, 8, 31)
+    assert d.next_due(date(2025, 9, 1)) == date(2025, 11, 30)
+    assert d.next_due(date(2026, 3, 1)) == date(2026, 5, 31)
+    assert Deadline(date(2025, 3, 31), "RBC", "", "Apply by").next_due(date(2025, 4, 1)) is None
+
+
+def test_index_walks_occurrences_in_order():
+    td = Deadline(date(2025, 8, 31), "TD", "", "for September review cycle", every=3)
+    otf = Deadline(date(2025, 12, 1), "OTF", "", "Full Application")
+    index = DeadlineIndex([td, otf], date(2025, 9, 1))
+    assert index.next() == (date(2025, 11, 30), td)
+    upcoming = list(index.upcoming(until=date(2026, 6, 1)))
+    assert [(due, d.program) for due, d in upcoming] == [
+        (date(2025, 11, 30), "TD"), (date(2025, 12, 1), "OTF"), (date(2026, 2, 28), "TD"), (date(2026, 5, 31), "TD")]
+    assert len(list(index.upcoming(limit=2))) == 2
+
+
+def test_later_occurrences_name_their_own_month():
+    d = Deadline(date(2025, 8, 31), "TD", "", "for September review cycle", every=3)
+    assert d.label_for(d.due) == "for September review cycle"
+    assert d.label_for(d.occurrence(1)) == "for December review cycle"
+    assert d.label_for(d.occurrence(2)) == "for March review cycle"
+    assert d.series_label() == "review cycle"
+    window = Deadline(date(2025, 7, 31), "Shopify", "", "Application window", opens=date(2025, 5, 1), every=6)
+    assert window.opens_for(window.occurrence(1)) == date(2025, 11, 1)
+    assert window.label_for(window.occurrence(1)) == "Application window"
+
+
+def _events(ics):
+    events = []
+    for block in ics.split("BEGIN:VEVENT")[1:]:
+        fields = dict(line.split(":", 1) for line in block.split("\r\n") if ":" in line)
+        events.append(fields)
+    return events
+
+
+def _expand(start, rule, count):
+    """Occurrences of a FREQ=MONTHLY rule, per RFC 5545, for the parts to_ics() writes."""
+    parts = dict(p.split("=") for p in rule.split(";"))
+    interval = int(parts.get("INTERVAL", 1))
+    days = [int(x) for x in parts["BYMONTHDAY"].split(",")] if "BYMONTHDAY" in parts else [start.day]
+    found, n = [], 0
+    while len(found) < count:
+        year, month = divmod(start.month - 1 + n * interval, 12)
+        year, month = start.year + year, month + 1
+        last = calendar.monthrange(year, month)[1]
+        valid = sorted(last + 1 + x if x < 0 else x for x in days if -last <= x <= last and x)
+        if valid:
+            found.append(date(year, month, valid[-1] if parts.get("BYSETPOS") == "-1" else valid[0]))
+        n += 1
+    return found
+
+
+@pytest.mark.parametrize("due", [date(2025, 1, 30), date(2024, 1, 29), date(2025, 8, 31), date(2025, 4, 30),
+                                 date(2025, 3, 15)])
+@pytest.mark.parametrize("every", [1, 3])
+def test_rrule_agrees_with_add_months(due, every):
+    d = Deadline(due, "P", "", "Apply by", every=every)
+    [event] = _events(to_ics([d]))
+    start = datetime.strptime(event["DTSTART;VALUE=DATE"], "%Y%m%d").date()
+    assert _expand(start, event["RRULE"], 24) == [d.occurrence(n) for n in range(24)]
+
+
+def test_ics_splits_a_series_whose_label_names_a_month():
+    d = Deadline(date(2025, 8, 31), "TD", "", "for September review cycle", every=3)
+    first, series = _events(to_ics([d]))
+    assert first["SUMMARY"] == "TD (for September review cycle)" and "RRULE" not in first
+    assert series["SUMMARY"] == "TD (review cycle)"
+    assert series["DTSTART;VALUE=DATE"] == "20251130"
+    assert "RRULE" in series
@@ -0,0 +1,91 @@
+import os
+import zipfile
+
+import pytest
+from openpyxl import Workbook
+
+import finance_index
+from finance_index import FinanceIndex, extract, find_files, snippet, tokenize
+
+DOCUMENT_XML = """<?xml version="1.0" encoding="UTF-8"?>
+<w:document xmlns:w="http://schemas.openxmlformats.org/wordprocessingml/2006/main"><w:body>
+<w:p><w:r><w:t>Minutes of the </w:t></w:r><w:r><w:t>September meeting</w:t></w:r></w:p>
+<w:p></w:p>
+<w:p><w:r><w:t>Approved the BBQ budget</w:t></w:r></w:p>
+</w:body></w:document>"""
+
+
+@pytest.fixture
+def archive(tmp_path, monkeypatch):
+    folder = tmp_path / "archive"
+    folder.mkdir()
+    monkeypatch.setattr(finance_index, "ARCHIVE_DIR", str(folder))
+    return folder
+
+
+def write_docx(path):
+    with zipfile.ZipFile(path, "w") as z:
+        z.writestr("word/document.xml", DOCUMENT_XML)
+    return str(path)
+
+
+def write_xlsx(path):
+    wb = Workbook()
+    ws = wb.active
+    ws.title = "Expenses "
+    ws.append(["Canva Pro", 16.95])
+    ws.append([None, None])
+    ws.append(["BBQ supplies", 42.5])
+    wb.save(path)
+    return str(path)
+
+
+def test_tokenize_drops_stopwords():
+    assert tokenize("The BBQ for Fall-2024, at $42.50") == ["bbq", "fall", "2024", "42", "50"]
+
+
+def test_extract_units(archive):
+    (archive / "receipts").mkdir()
+    receipt = archive / "receipts" / "Canva 07.24.png"
+    receipt.write_bytes(b"\x89PNG")
+    assert extract(str(receipt)) == [("file name", os.path.join("receipts", "Canva 07.24.png") + " July 2024")]
+
+    units = extract(write_xlsx(archive / "ledger.xlsx"))
+    assert units[1:] == [("Expenses row 1", "Canva Pro  16.95"), ("Expenses row 3", "BBQ supplies  42.50")]
+
+    units = extract(write_docx(archive / "minutes.docx"))
+    assert units[1:] == [("paragraph 1", "Minutes of the September meeting"),
+                         ("paragraph 3", "Approved the BBQ budget")]
+
+    broken = archive / "broken.docx"
+    broken.write_bytes(b"not a zip")
+    assert extract(str(broken))[1][0] == "unreadable"
+
+
+def test_update_and_search(archive, tmp_path):
+    minutes = write_docx(archive / "minutes.docx")
+    ledger = write_xlsx(archive / "ledger.xlsx")
+    with FinanceIndex(str(tmp_path / "index.sqlite")) as index:
+        assert index.update(find_files(str(archive)), jobs=1) == (2, 0)
+        assert index.update(find_files(str(archive)), jobs=1) == (0, 0)
+
+        hits = index.search("bbq")
+        assert {(path, location) for path, location, _, _ in hits} == {
+            (ledger, "Expenses row 3"), (minutes, "paragraph 3")}
+        # Every word must appear; stopwords are ignored
+        assert [h[1] for h in index.search("the bbq budget")] == ["paragraph 3"]
+        assert [h[1] for h in index.search("sept*")] == ["paragraph 1"]
+        assert index.search("nothing here") == []
+        assert index.search("the") == []
+
+        os.remove(ledger)
+        assert index.update(find_files(str(archive)), jobs=1) == (0, 1)
+        assert [h[0] for h in index.search("bbq")] == [minutes]
+
+
+def test_snippet():
+    text = "word " * 40 + "Canva   receipt\nfor July " + "tail " * 40
+    piece = snippet(text, "canva", width=30)
+    assert piece.startswith("...") and piece.endswith("...")
+    assert "Canva receipt" in piece
+    assert snippet("Short text", "missing") == "Short text"
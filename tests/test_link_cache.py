@@ -0,0 +1,44 @@
+from datetime import datetime, timedelta, timezone
+
+from link_cache import LinkCache
+
+
+def record(url, age, **fields):
+    checked = datetime.now(timezone.utc) - timedelta(seconds=age)
+    return dict({"url": url, "status": "working", "http_status": 200, "final_url": url,
+                 "checked_at": checked.isoformat()}, **fields)
+
+
+def test_store_and_get_many(tmp_path):
+    with LinkCache(str(tmp_path / "links.sqlite")) as cache:
+        cache.store([record("https://a.example/", 10, etag='"v1"'), record("https://b.example/", 10)])
+        found = cache.get_many(["https://a.example/", "https://missing.example/"])
+    assert list(found) == ["https://a.example/"]
+    assert found["https://a.example/"]["etag"] == '"v1"'
+    assert found["https://a.example/"]["last_modified"] is None
+
+
+def test_fresh_honours_the_ttl(tmp_path):
+    with LinkCache(str(tmp_path / "links.sqlite")) as cache:
+        cache.store([record("https://new.example/", 60), record("https://old.example/", 7200)])
+        urls = ["https://new.example/", "https://old.example/"]
+        assert set(cache.fresh(urls, ttl=3600)) == {"https://new.example/"}
+        assert set(cache.fresh(urls, ttl=3 * 3600)) == set(urls)
+        assert set(cache.get_many(urls)) == set(urls)
+
+
+def test_store_replaces_an_earlier_check(tmp_path):
+    path = str(tmp_path / "links.sqlite")
+    with LinkCache(path) as cache:
+        cache.store([record("https://a.example/", 10)])
+        cache.store([record("https://a.example/", 5, status="broken", http_status=404)])
+    with LinkCache(path) as cache:
+        assert cache.get_many(["https://a.example/"])["https://a.example/"]["http_status"] == 404
+
+
+def test_lookups_beyond_the_parameter_limit(tmp_path):
+    urls = [f"https://site{i}.example/" for i in range(1200)]
+    with LinkCache(str(tmp_path / "links.sqlite")) as cache:
+        cache.store(record(url, 10) for url in urls)
+        assert len(cache.get_many(urls)) == 1200
+        assert len(cache.fresh(urls)) == 1200
@@ -0,0 +1,132 @@
+import asyncio
+import socket
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from link_cache import LinkCache
+from link_checker import BROKEN, TIMED_OUT, WORKING, check_links
+
+SLOW = 2.0
+TIMEOUT = 0.5
+
+
+class StandIn(BaseHTTPRequestHandler):
+    """A sponsor site: /ok, a redirect to it, a page that refuses HEAD, a missing page and a slow one."""
+
+    protocol_version = "HTTP/1.1"
+    requests = []
+
+    def log_message(self, *args):
+        pass
+
+    def respond(self, status, headers=(), body=b""):
+        self.send_response(status)
+        for name, value in headers:
+            self.send_header(name, value)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        if self.command != "HEAD":
+            self.wfile.write(body)
+
+    def handle_one(self):
+        self.requests.append((self.command, self.path))
+        if self.path == "/ok":
+            self.respond(200, [("ETag", '"v1"')], b"hello")
+        elif self.path == "/moved":
+            self.respond(301, [("Location", "/ok")])
+        elif self.path == "/no-head":
+            self.respond(405 if self.command == "HEAD" else 200, body=b"get only")
+        elif self.path == "/slow":
+            time.sleep(SLOW)
+            self.respond(200)
+        else:
+            self.respond(404, body=b"not here")
+
+    do_HEAD = do_GET = handle_one
+
+
+@pytest.fixture
+def server():
+    httpd = ThreadingHTTPServer(("127.0.0.1", 0), StandIn)
+    httpd.daemon_threads = True
+    # Don't wait out /slow's sleep on the way down
+    httpd.block_on_close = False
+    StandIn.requests = []
+    thread = threading.Thread(target=httpd.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{httpd.server_address[1]}"
+    httpd.shutdown()
+    httpd.server_close()
+
+
+@pytest.fixture
+def refused():
+    # A port that was free a moment ago and has nothing listening now
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        port = s.getsockname()[1]
+    return f"http://127.0.0.1:{port}/"
+
+
+def check(urls, **kwargs):
+    return asyncio.run(check_links(urls, timeout=TIMEOUT, **kwargs))
+
+
+def test_redirect_is_followed(server):
+    result = check([server + "/moved"])[server + "/moved"]
+    assert result["status"] == WORKING
+    assert result["http_status"] == 200
+    assert result["final_url"] == server + "/ok"
+    assert result["etag"] == '"v1"'
+
+
+def test_head_rejected_falls_back_to_get(server):
+    result = check([server + "/no-head"])[server + "/no-head"]
+    assert result["status"] == WORKING
+    assert ("HEAD", "/no-head") in StandIn.requests
+    assert ("GET", "/no-head") in StandIn.requests
+
+
+def test_missing_page_is_broken_after_both_methods(server):
+    result = check([server + "/gone"])[server + "/gone"]
+    assert result["status"] == BROKEN
+    assert result["http_status"] == 404
+    assert [m for m, p in StandIn.requests if p == "/gone"] == ["HEAD", "GET"]
+
+
+def test_slow_site_times_out(server):
+    start = time.perf_counter()
+    result = check([server + "/slow"])[server + "/slow"]
+    assert result["status"] == TIMED_OUT
+    assert result["http_status"] is None
+    assert time.perf_counter() - start < SLOW
+
+
+def test_refused_connection_is_broken(refused):
+    result = check([refused])[refused]
+    assert result["status"] == BROKEN
+    assert result["http_status"] is None
+    assert result["error"]
+
+
+def test_second_run_is_served_from_the_cache(server, tmp_path):
+    urls = [server + "/ok", server + "/moved", server + "/gone"]
+    with LinkCache(str(tmp_path / "links.sqlite")) as cache:
+        first = check(urls, cache=cache)
+        sent = len(StandIn.requests)
+        second = check(urls, cache=cache)
+    assert len(StandIn.requests) == sent
+    assert second == first
+
+
+def test_stale_working_entry_is_revalidated_conditionally(server, tmp_path):
+    url = server + "/ok"
+    with LinkCache(str(tmp_path / "links.sqlite")) as cache:
+        check([url], cache=cache)
+        StandIn.requests.clear()
+        result = check([url], cache=cache, ttl=0)[url]
+    assert result["status"] == WORKING
+    assert StandIn.requests == [("HEAD", "/ok")]
@@ -0,0 +1,37 @@
+from dataset_loader import load_dataset
+from mail_merge import partition
+
+
+def test_every_share_opens_with_a_tier():
+    sponsors = load_dataset("lola_sponsors")
+    for volunteers in (["Amara"], ["Amara", "Ben"], ["Amara", "Ben", "Chloe"], [f"v{i}" for i in range(7)]):
+        people = partition(sponsors, volunteers)
+        assert sum(map(len, people.values())) == len(sponsors)
+        for name, share in people.items():
+            assert share[0].get("tier"), f"{name}'s sheet starts without a tier heading"
+
+
+def test_shares_are_contiguous_and_in_order():
+    sponsors = [{"num": i, "name": f"S{i}"} for i in range(1, 8)]
+    people = partition(sponsors, ["A", "B", "C"])
+    assert [[s["num"] for s in share] for share in people.values()] == [[1, 2, 3], [4, 5], [6, 7]]
+
+
+def test_explicit_assignees_come_first_and_keep_their_tier():
+    sponsors = [
+        {"num": 1, "name": "S1", "tier": "TIER 1"},
+        {"num": 2, "name": "S2"},
+        {"num": 3, "name": "S3", "assignee": "Dev"},
+        {"num": 4, "name": "S4", "tier": "TIER 2"},
+    ]
+    people = partition(sponsors, ["A"])
+    assert list(people) == ["Dev", "A"]
+    assert people["Dev"][0]["tier"] == "TIER 1"
+    assert [s["num"] for s in people["A"]] == [1, 2, 4]
+    # The caller's records are left as they were
+    assert "tier" not in sponsors[1]
+
+
+def test_nobody_named_goes_to_the_default():
+    people = partition([{"num": 1, "name": "S1"}], default="Lola")
+    assert list(people) == ["Lola"]
@@ -0,0 +1,75 @@
+import copy
+import io
+
+import pytest
+from reportlab.lib.enums import TA_JUSTIFY
+from reportlab.lib.styles import getSampleStyleSheet
+from reportlab.pdfgen.canvas import Canvas
+from reportlab.platypus import Paragraph
+
+import paragraph_cache
+from paragraph_cache import paragraph, stats
+
+BODY = getSampleStyleSheet()["BodyText"]
+JUSTIFIED = copy.copy(BODY)
+JUSTIFIED.alignment = TA_JUSTIFY
+TEXTS = [
+    "<b>STATUS:</b> VERIFIED WORKING - " + "a sponsor note that wraps over several lines " * 6,
+    "Apply by March<br/>then follow up " * 8,
+    "https://example.org/" + "sponsorship-application-form-" * 8,
+]
+
+
+@pytest.fixture(autouse=True)
+def empty_cache():
+    paragraph_cache.clear()
+    yield
+    paragraph_cache.clear()
+
+
+def drawn(p, width):
+    """The page operators ``p`` draws at ``width``."""
+    canvas = Canvas(io.BytesIO(), pageCompression=0)
+    p.wrap(width, 1000)
+    p.drawOn(canvas, 10, 10)
+    return canvas._code
+
+
+@pytest.mark.parametrize("style", [BODY, JUSTIFIED])
+@pytest.mark.parametrize("text", TEXTS)
+def test_cached_paragraphs_draw_like_plain_ones(text, style):
+    expected = drawn(Paragraph(text, style), 150)
+    # A miss, then hits for the parse and the line breaks
+    assert drawn(paragraph(text, style), 150) == expected
+    assert drawn(paragraph(text, style), 150) == expected
+    assert stats()["parse"][:2] == (1, 1) and stats()["wrap"][:2] == (1, 1)
+
+
+@pytest.mark.parametrize("style", [BODY, JUSTIFIED])
+@pytest.mark.parametrize("text", TEXTS)
+def test_split_after_a_cache_hit_matches_a_plain_split(text, style):
+    plain = Paragraph(text, style)
+    plain.wrap(150, 1000)
+    expected = [drawn(half, 150) for half in plain.split(150, 40)]
+
+    paragraph(text, style).wrap(150, 1000)
+    shared = paragraph(text, style)
+    shared.wrap(150, 1000)
+    halves = shared.split(150, 40)
+    assert len(halves) == 2
+    assert [drawn(half, 150) for half in halves] == expected
+    # Splitting left the cached line breaks as they were
+    assert drawn(paragraph(text, style), 150) == drawn(Paragraph(text, style), 150)
+
+
+def test_each_width_is_its_own_entry():
+    for width in (150, 300, 150):
+        paragraph(TEXTS[0], BODY).wrap(width, 1000)
+    assert stats() == {"parse": (2, 1, 1), "wrap": (1, 2, 2)}
+
+
+def test_caches_are_bounded(monkeypatch):
+    monkeypatch.setattr(paragraph_cache._parses, "maxsize", 3)
+    for i in range(10):
+        paragraph(f"note {i}", BODY)
+    assert stats()["parse"] == (0, 10, 3)
@@ -0,0 +1,61 @@
+import io
+import os
+import pstats
+
+from reportlab.lib.styles import getSampleStyleSheet
+from reportlab.platypus import Paragraph, SimpleDocTemplate, Table
+
+import pdf_profiling
+from pdf_profiling import DUMP_ENV_VAR, ENV_VAR, PHASES, profile_build
+
+seen = []
+
+
+@profile_build("sample")
+def build_pdf(output):
+    style = getSampleStyleSheet()["BodyText"]
+    story = []
+    for _ in range(20):
+        story += [Paragraph("Hello " * 50, style), Table([[Paragraph("cell", style)]] * 3)]
+    SimpleDocTemplate(output).build(story)
+    seen.append(pdf_profiling._active)
+
+
+def test_off_by_default(monkeypatch, capsys):
+    monkeypatch.delenv(ENV_VAR, raising=False)
+    build_pdf(io.BytesIO())
+    assert seen[-1] is None
+    assert capsys.readouterr().err == ""
+
+
+def test_profiled_build_reports_and_unhooks(monkeypatch, capsys, tmp_path):
+    monkeypatch.setenv(ENV_VAR, "1")
+    monkeypatch.setenv(DUMP_ENV_VAR, str(tmp_path))
+    build_pdf(io.BytesIO())
+
+    profile = seen[-1]
+    assert profile.name == "sample"
+    assert set(profile.phases) <= set(PHASES)
+    assert abs(sum(profile.phases.values()) - profile.total) < 1e-6
+    assert profile.types[("layout", "Table")][1] > 0
+    assert profile.types[("draw", "Paragraph")][1] > 0
+
+    err = capsys.readouterr().err
+    assert err.startswith("\nsample: ") and "by flowable type" in err
+    pstats.Stats(os.path.join(tmp_path, "sample.prof"))
+    # Every hook is removed again once the build is over
+    assert not hasattr(Paragraph.__dict__["wrap"], "__profiled__")
+    assert not hasattr(SimpleDocTemplate.__mro__[1].__dict__["build"], "__profiled__")
+    assert pdf_profiling._active is None and pdf_profiling._stack == []
+
+
+def test_nested_builds_report_once(monkeypatch, capsys):
+    monkeypatch.setenv(ENV_VAR, "1")
+
+    @profile_build("outer")
+    def outer():
+        build_pdf(io.BytesIO())
+
+    outer()
+    err = capsys.readouterr().err
+    assert err.count("  styles ") == 1 and "\nouter: " in err
@@ -0,0 +1,64 @@
+import pytest
+
+pytest.importorskip("PIL")
+pypdf = pytest.importorskip("pypdf")
+
+from PIL import Image
+from reportlab.platypus import SimpleDocTemplate
+
+import pdf_resources
+from pdf_resources import cache_info, clear_cache, image_flowable
+
+
+@pytest.fixture(autouse=True)
+def fresh_cache():
+    clear_cache()
+    yield
+    clear_cache()
+
+
+def image_xobjects(path):
+    """Distinct image XObjects reachable from the document's pages, through any forms."""
+    found = set()
+
+    def walk(resources):
+        xobjects = resources.get("/XObject") if resources else None
+        for ref in (xobjects or {}).values():
+            obj = ref.get_object()
+            if obj["/Subtype"] == "/Image":
+                found.add(ref.idnum)
+            elif obj["/Subtype"] == "/Form":
+                walk(obj.get("/Resources"))
+
+    for page in pypdf.PdfReader(path).pages:
+        walk(page.get("/Resources"))
+    return found
+
+
+def build(path, elements):
+    SimpleDocTemplate(str(path)).build(elements)
+    return path
+
+
+@pytest.mark.parametrize("suffix, mode", [(".png", "RGBA"), (".jpg", "RGB")])
+def test_an_image_placed_twice_is_embedded_once(tmp_path, suffix, mode):
+    source = tmp_path / f"receipt{suffix}"
+    Image.new(mode, (400, 300), "red").save(source)
+    pdf = build(tmp_path / "out.pdf", [image_flowable(str(source), width=200), image_flowable(str(source), width=200)])
+    assert len(image_xobjects(pdf)) == 1
+    assert cache_info()["image_hits"] == 1
+    assert cache_info()["xobject_reuses"] == 1
+
+
+def test_a_later_document_reuses_the_decoded_image(tmp_path, monkeypatch):
+    source = tmp_path / "receipt.png"
+    Image.new("RGB", (2000, 1000), "blue").save(source)
+    build(tmp_path / "first.pdf", [image_flowable(str(source), width=144)])
+    decoded = []
+    monkeypatch.setattr(pdf_resources, "_decode", lambda *args: decoded.append(args))
+    second = build(tmp_path / "second.pdf", [image_flowable(str(source), width=144)])
+    assert decoded == []
+    [ref] = image_xobjects(second)
+    image = pypdf.PdfReader(second).get_object(ref)
+    # Downsampled to 2 inches at DEFAULT_DPI
+    assert (image["/Width"], image["/Height"]) == (300, 150)
@@ -0,0 +1,33 @@
+import pytest
+
+from pdf_theme import (HEADER_BG, PRIORITY_COLORS, ROW_ALT, VERDICT_COLORS, comparison_table_style, get_styles,
+                       priority_level, priority_style, verdict_style)
+
+
+def test_priority_level():
+    assert priority_level("URGENT - DEADLINE APRIL 9") == "urgent"
+    assert priority_level("HIGH") == "high"
+    assert priority_level("HIGH - ROLLING") == "normal"
+    assert priority_level("MEDIUM") == "normal"
+
+
+def test_styles_are_built_once_and_read_only():
+    styles = get_styles()
+    assert get_styles() is styles
+    with pytest.raises(TypeError):
+        styles["body"] = None
+    for level, (color, _) in PRIORITY_COLORS.items():
+        assert styles["priority_" + level].textColor == color
+    for name, color in VERDICT_COLORS.items():
+        assert verdict_style(name).textColor == color
+    assert priority_style("URGENT") is styles["priority_urgent"]
+
+
+def test_comparison_table_style_stripes_and_extra_commands():
+    commands = comparison_table_style(7, ("BACKGROUND", (0, 1), (-1, 1), HEADER_BG), stripe_from=3).getCommands()
+    stripes = [c[1][1] for c in commands if c[0] == "BACKGROUND" and c[3] == ROW_ALT]
+    assert stripes == [3, 5]
+    # Extra commands come last, so they override the defaults
+    assert commands[-1] == ("BACKGROUND", (0, 1), (-1, 1), HEADER_BG)
+    default = comparison_table_style(5).getCommands()
+    assert [c[1][1] for c in default if c[0] == "BACKGROUND" and c[3] == ROW_ALT] == [2, 4]
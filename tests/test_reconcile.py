@@ -0,0 +1,105 @@
+from datetime import date
+
+import pytest
+
+from reconcile import Entries, read_logbooks, reconcile
+
+
+def entries(*rows):
+    side = Entries()
+    for day, cents, credit, description in rows:
+        side.add(day, cents, credit, description, description)
+    return side
+
+
+def pairs(result):
+    return [(result.bank.description[i], result.ledger.description[j]) for i, j, _, _ in result.matches]
+
+
+def test_matches_need_the_same_amount_and_direction():
+    bank = entries((date(2024, 9, 3), 2000, True, "dues"), (date(2024, 9, 3), 2000, False, "refund"))
+    ledger = entries((date(2024, 9, 3), 2000, True, "member dues"))
+    result = reconcile(bank, ledger)
+    assert pairs(result) == [("dues", "member dues")]
+    assert result.unmatched_bank == [1]
+
+
+def test_nearest_date_wins_then_shared_words():
+    bank = entries(
+        (date(2024, 9, 1), 5000, False, "Costco supplies"),
+        (date(2024, 9, 5), 5000, False, "Venue deposit"),
+        (date(2024, 9, 5), 5000, False, "Costco snacks"),
+    )
+    ledger = entries((date(2024, 9, 4), 5000, False, "Costco snacks for event"))
+    [(i, j, apart, shared)] = reconcile(bank, ledger).matches
+    assert (i, apart, shared) == (2, 1, 2)
+
+
+def test_entries_outside_the_window_stay_unmatched():
+    bank = entries((date(2024, 9, 1), 1500, False, "pizza"))
+    ledger = entries((date(2024, 9, 20), 1500, False, "pizza"))
+    result = reconcile(bank, ledger, window=7)
+    assert result.matches == []
+    assert result.unmatched_ledger == [0]
+
+
+def test_each_bank_transaction_matches_once():
+    bank = entries((date(2024, 9, 3), 2000, True, "dues"))
+    ledger = entries((date(2024, 9, 3), 2000, True, "dues"), (date(2024, 9, 3), 2000, True, "dues"))
+    result = reconcile(bank, ledger)
+    assert len(result.matches) == 1
+    assert result.unmatched_ledger == [1]
+
+
+def test_undated_ledger_entries_need_a_shared_word():
+    bank = entries((date(2024, 9, 3), 1000, False, "Staples paper"))
+    ledger = entries((None, 1000, False, "Printing"), (None, 1000, False, "paper for flyers"))
+    assert pairs(reconcile(bank, ledger)) == [("Staples paper", "paper for flyers")]
+
+
+def test_ledger_entries_outside_the_statements_are_uncovered():
+    bank = entries((date(2024, 9, 3), 1000, False, "paper"))
+    ledger = entries((date(2024, 1, 3), 700, False, "old"), (date(2024, 9, 10), 700, False, "missing"))
+    result = reconcile(bank, ledger, window=7, coverage=(date(2024, 9, 1), date(2024, 9, 30)))
+    assert result.uncovered_ledger == [0]
+    assert result.unmatched_ledger == [1]
+    assert result.unmatched_total(ledger, result.unmatched_ledger) == -700
+
+
+def _logbook(path, rows):
+    openpyxl = pytest.importorskip("openpyxl")
+    book = openpyxl.Workbook()
+    sheet = book.active
+    sheet.title = "Logbook 09.24"
+    sheet.append(["Date", "Description", "Debit", "Credit"])
+    for row in rows:
+        sheet.append(row)
+    book.save(path)
+    return str(path)
+
+
+def test_identical_logbook_rows_are_both_kept(tmp_path):
+    dues = ["2024-09-03", "Member dues", None, 20]
+    path = _logbook(tmp_path / "2024.xlsx", [dues, dues, ["2024-09-04", "Printing", 12.5, None]])
+    ledger, skipped = read_logbooks([path])
+    assert len(ledger) == 3 and not skipped
+    assert list(ledger.amount) == [2000, 2000, 1250]
+
+
+def test_a_logbook_copied_into_a_later_workbook_is_added_once(tmp_path):
+    dues = ["2024-09-03", "Member dues", None, 20]
+    first = _logbook(tmp_path / "2024.xlsx", [dues, dues])
+    later = _logbook(tmp_path / "2025.xlsx", [dues, dues, ["2024-09-30", "Late dues", None, 20]])
+    ledger, _ = read_logbooks([first, later])
+    assert ledger.description == ["Member dues", "Member dues", "Late dues"]
+
+
+def test_a_later_workbook_with_the_same_sheet_title_keeps_its_own_rows(tmp_path):
+    first = _logbook(tmp_path / "2024_2025.xlsx", [["2024-09-03", "Member dues", None, 20],
+                                                   ["2024-09-04", "Printing", 12.5, None]])
+    later = _logbook(tmp_path / "2025_2026.xlsx", [["2025-09-02", "Member dues", None, 25],
+                                                   ["2024-09-04", "Printing", 12.5, None]])
+    ledger, _ = read_logbooks([first, later])
+    assert [(ledger.date(i).isoformat(), ledger.amount[i]) for i in range(len(ledger))] == [
+        ("2024-09-03", 2000), ("2024-09-04", 1250), ("2025-09-02", 2500)]
+    assert ledger.source[2] == "2025_2026 / Logbook 09.24 row 2"
@@ -0,0 +1,127 @@
+import http.client
+import json
+import socket
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from http.server import ThreadingHTTPServer
+
+import pytest
+
+import render_server
+from bank_statements import StatementError
+from render_server import Busy, Handler, RenderError, RenderFailed, RenderService
+
+
+def fake_render(document, kwargs):
+    return b"%PDF-fake " + document.encode(), 0.001
+
+
+@pytest.fixture
+def service(monkeypatch):
+    # Threads instead of forked workers: the render function is swapped out anyway
+    monkeypatch.setattr(render_server, "render", fake_render)
+    svc = RenderService(["banking", "lola"], jobs=1, backlog=0)
+    svc._pool = ThreadPoolExecutor(2)
+    yield svc
+    svc._pool.shutdown(wait=False, cancel_futures=True)
+
+
+@pytest.fixture
+def server(service):
+    httpd = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    httpd.service = service
+    threading.Thread(target=httpd.serve_forever, daemon=True).start()
+    yield httpd.server_address
+    httpd.shutdown()
+    httpd.server_close()
+
+
+def post(address, path, body=b"", headers=None):
+    conn = http.client.HTTPConnection(*address, timeout=5)
+    conn.request("POST", path, body, headers or {})
+    response = conn.getresponse()
+    return response.status, response.read()
+
+
+def test_render_returns_the_pdf(server):
+    status, body = post(server, "/render/banking", b"{}")
+    assert status == 200 and body.startswith(b"%PDF")
+
+
+def test_bad_requests_are_400(server):
+    assert post(server, "/render/banking", b"{not json")[0] == 400
+    assert post(server, "/render/banking", b"[]")[0] == 400
+    assert post(server, "/render/banking", b'{"colour": "red"}')[0] == 400
+    assert post(server, "/render/nothing", b"{}")[0] == 404
+
+
+def test_non_numeric_content_length_is_400(server):
+    with socket.create_connection(server, timeout=5) as sock:
+        sock.sendall(b"POST /render/banking HTTP/1.1\r\nHost: x\r\nContent-Length: lots\r\n\r\n{}")
+        reply = sock.recv(4096)
+    assert reply.startswith(b"HTTP/1.0 400") and b"Content-Length" in reply
+
+
+@pytest.mark.parametrize("error", [StatementError("statement.pdf: no statement period found"),
+                                   ValueError("paragraph markup: unclosed tag")])
+def test_a_failing_render_is_500_not_400(server, service, monkeypatch, error):
+    def broken(document, kwargs):
+        raise error
+
+    monkeypatch.setattr(render_server, "render", broken)
+    with pytest.raises(RenderFailed) as failure:
+        service.render("banking", {})
+    assert failure.value.__cause__ is error
+    status, body = post(server, "/render/banking", b"{}")
+    assert status == 500 and str(error) in json.loads(body)["error"]
+    # The slot is free again
+    monkeypatch.setattr(render_server, "render", fake_render)
+    assert post(server, "/render/banking", b"{}")[0] == 200
+
+
+def test_a_timed_out_render_keeps_its_slot_until_it_finishes(service, monkeypatch):
+    finish = threading.Event()
+
+    def stuck(document, kwargs):
+        finish.wait(5)
+        return b"%PDF-late", 0.0
+
+    monkeypatch.setattr(render_server, "render", stuck)
+    monkeypatch.setattr(render_server, "RENDER_TIMEOUT", 0.05)
+    with pytest.raises(TimeoutError):
+        service.render("banking", {})
+    # One slot (jobs=1, backlog=0), still held by the stuck render
+    with pytest.raises(Busy):
+        service.render("banking", {})
+    finish.set()
+    monkeypatch.setattr(render_server, "render", fake_render)
+    deadline = time.monotonic() + 5
+    while True:
+        try:
+            assert service.render("banking", {})[0].startswith(b"%PDF")
+            break
+        except Busy:
+            assert time.monotonic() < deadline
+            time.sleep(0.01)
+
+
+def test_researcher_gets_their_share_with_its_tier(service):
+    kwargs = service.prepare("lola", {"researcher": "Ben", "volunteers": ["Amara", "Ben", "Chloe"]})
+    assert kwargs["researcher"] == "Ben"
+    assert kwargs["lola_sponsors"] and kwargs["lola_sponsors"][0].get("tier")
+    with pytest.raises(RenderError):
+        service.prepare("lola", {"researcher": "Dana", "volunteers": ["Amara"]})
+
+
+def test_request_records_are_validated(service):
+    with pytest.raises(ValueError):
+        service.prepare("banking", {"banks": [{"name": 3}]})
+
+
+def test_health(server):
+    conn = http.client.HTTPConnection(*server, timeout=5)
+    conn.request("GET", "/health")
+    response = conn.getresponse()
+    assert response.status == 200
+    assert json.loads(response.read())["documents"] == ["banking", "lola"]
@@ -0,0 +1,39 @@
+from reportlab.platypus import Paragraph, Table
+
+from sponsor_blocks import LINK_CHECKLIST, TASK_CHECKLIST, checklist_row, findings_row, sponsor_block, sponsor_section
+
+SPONSOR = {"num": 3, "name": "Corner Store", "priority": "HIGH", "url": "https://corner.example/",
+           "amount": "$500", "likelihood": "40%", "notes": "Ask in person", "tier": "TIER 2"}
+
+
+def texts(flowables):
+    return [f.text for f in flowables if isinstance(f, Paragraph)]
+
+
+def test_cells_are_shared_but_tables_are_not():
+    first, second = sponsor_block(SPONSOR), sponsor_block(SPONSOR)
+    assert any(isinstance(f, Table) for f in first)
+    assert all(a is not b for a, b in zip(first, second))
+    assert checklist_row(TASK_CHECKLIST) is checklist_row(TASK_CHECKLIST)
+    assert checklist_row(LINK_CHECKLIST) is not checklist_row(TASK_CHECKLIST)
+    assert findings_row("Lola") is findings_row("Lola")
+
+
+def test_block_lines():
+    block = sponsor_block(dict(SPONSOR, deadline="March 2025"), status="VERIFIED WORKING")
+    assert texts(block) == [
+        "<b>STATUS: VERIFIED WORKING</b>",
+        '<link href="https://corner.example/">https://corner.example/</link>',
+        "<b>Apply by:</b> March 2025",
+        "<b>Notes:</b> Ask in person",
+    ]
+    assert "<b>Apply by:</b>" not in " ".join(texts(sponsor_block(SPONSOR)))
+
+
+def test_section_heads_each_tier_once():
+    untiered = {k: v for k, v in SPONSOR.items() if k != "tier"}
+    sponsors = [SPONSOR, dict(SPONSOR, num=4), dict(SPONSOR, num=5, tier="TIER 3"), untiered]
+    section = sponsor_section(iter(sponsors))
+    assert not isinstance(section, list)
+    headings = [t for t in texts(section) if t.startswith("TIER")]
+    assert headings == ["TIER 2", "TIER 3"]
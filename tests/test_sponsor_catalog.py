@@ -0,0 +1,50 @@
+from sponsor_catalog import apply_catalog, build_catalog, canonical_url
+
+STRATEGY_RECORDS = [
+    {"num": 1, "name": "RBC - Community Sponsorship", "tier": "TIER 1", "details": {},
+     "amount": "$1,000-$10,000", "likelihood": "HIGH", "deadline": "March 2025"},
+]
+LOLA_RECORDS = [
+    {"num": 1, "name": "RBC - Community Sponsorship (Sponsorium)", "url": "https://www.rbc.com/en/sponsorship/",
+     "amount": "$5,000-$25,000"},
+]
+
+
+def catalog():
+    return build_catalog([("strategy", STRATEGY_RECORDS), ("lola_sponsors", LOLA_RECORDS)])
+
+
+def test_canonical_url_drops_scheme_www_locale_and_index():
+    assert canonical_url("https://www.rbc.com/ca/en/x/index.html") == "rbc.com/x"
+    assert canonical_url("http://rbc.com/en-ca/x/") == "rbc.com/x"
+
+
+def test_records_merge_by_brand_block():
+    merged = catalog()
+    assert len(merged) == 1
+    assert merged.find(LOLA_RECORDS[0]) is merged.find(STRATEGY_RECORDS[0])
+
+
+def test_apply_catalog_keeps_the_records_own_figures():
+    [record] = apply_catalog(LOLA_RECORDS, catalog())
+    assert record["amount"] == "$5,000-$25,000"
+    # Only what the record leaves empty comes from the catalog
+    assert record["likelihood"] == "HIGH"
+    assert record["deadline"] == "March 2025"
+    assert "likelihood" not in LOLA_RECORDS[0]
+
+
+def test_apply_catalog_leaves_unknown_and_complete_records_alone():
+    unknown = {"name": "Nobody", "url": "https://example.org/"}
+    complete = dict(LOLA_RECORDS[0], likelihood="LOW", priority="P2", deadline="June")
+    out = apply_catalog([unknown, complete], catalog())
+    assert out[0] is unknown
+    assert out[1] is complete
+
+
+def test_same_name_on_a_different_page_is_a_different_program():
+    merged = build_catalog([
+        ("lola_sponsors", [{"name": "Rogers", "url": "https://rogers.com/a"}]),
+        ("working_links", [{"name": "Rogers", "url": "https://rogers.com/b"}]),
+    ])
+    assert len(merged) == 2
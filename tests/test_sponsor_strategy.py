@@ -0,0 +1,72 @@
+import json
+
+import sponsor_strategy
+from sponsor_strategy import STRATEGY_PATH, load_strategy, parse_strategy
+
+DOC = """\
+# Strategy
+
+### 0. Not in a tier
+- **Ask Amount**: $1
+
+## TIER 1: BANKS
+### 1. SCOTIABANK - ScotiaRISE Program
+- **Ask Amount**: $5,000 - $10,000/year
+- **Likelihood**: 85%
+- **URL**: https://www.scotiabank.com/rise
+- **APPLY BY**: March 2025
+- **Contact**: Community team
+  - Email first
+- **More likely in-kind than cash**
+
+## Appendix
+### 9. Ignored
+- **Ask Amount**: $2
+
+## TIER 2 - Local
+### 2. Corner Store
+- **Likelihood**: 40%
+"""
+
+
+def test_parse_strategy():
+    first, second = parse_strategy(DOC.splitlines(True))
+    assert first == {
+        "num": 1, "name": "SCOTIABANK - ScotiaRISE Program", "tier": "TIER 1: BANKS",
+        "amount": "$5,000 - $10,000/year", "likelihood": "85%",
+        "url": "https://www.scotiabank.com/rise", "deadline": "March 2025",
+        "details": {"contact": "Community team\nEmail first", "notes": "More likely in-kind than cash"},
+    }
+    assert second == {"num": 2, "name": "Corner Store", "tier": "TIER 2 - Local", "likelihood": "40%", "details": {}}
+
+
+def _no_parse(lines):
+    raise AssertionError("parsed the doc despite an up-to-date cache")
+
+
+def test_load_strategy_caches_by_stamp(tmp_path, monkeypatch):
+    doc = tmp_path / "strategy.md"
+    doc.write_text(DOC)
+    cache_path = str(tmp_path / "cache.json")
+    monkeypatch.setattr(sponsor_strategy, "_memo", {})
+    records = load_strategy(str(doc), cache_path)
+    assert [r["num"] for r in records] == [1, 2]
+    with open(cache_path, encoding="utf-8") as fh:
+        assert json.load(fh)[str(doc)]["records"] == records
+
+    # A fresh process reads the cache file instead of the doc
+    monkeypatch.setattr(sponsor_strategy, "_memo", {})
+    monkeypatch.setattr(sponsor_strategy, "parse_strategy", _no_parse)
+    assert load_strategy(str(doc), cache_path) == records
+
+    monkeypatch.undo()
+    monkeypatch.setattr(sponsor_strategy, "_memo", {})
+    doc.write_text(DOC.replace("40%", "45%") + "\n")
+    assert load_strategy(str(doc), cache_path)[1]["likelihood"] == "45%"
+
+
+def test_shipped_strategy_parses():
+    records = load_strategy(STRATEGY_PATH, cache_path=None)
+    assert records
+    assert all(r["name"] and r["tier"].startswith("TIER ") for r in records)
+    assert any(r.get("url", "").startswith("http") for r in records)
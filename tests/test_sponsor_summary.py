@@ -0,0 +1,50 @@
+import pytest
+
+from sponsor_summary import format_money, parse_amount, parse_likelihood, summarize
+
+
+@pytest.mark.parametrize("text, expected", [
+    ("$3,000 - $10,000", (3000, 10000, False)),
+    ("$5,000 - $10,000/year (multi-year: $15,000-$30,000 over 3 years)", (5000, 10000, False)),
+    ("$1,000 - $3,000 + in-kind", (1000, 3000, True)),
+    ("$1K to $2.5K", (1000, 2500, False)),
+    ("$10,000+", (10000, 10000, True)),
+    ("Up to $150,000/year", (0, 150000, False)),
+    ("Partnership + $10K scholarships", (10000, 10000, False)),
+    ("$1M", (1_000_000, 1_000_000, False)),
+    ("Various", None),
+    ("Connections to 500+ corporate sponsors", None),
+])
+def test_parse_amount(text, expected):
+    assert parse_amount(text) == expected
+
+
+def test_parse_likelihood():
+    assert parse_likelihood("80%") == 0.8
+    assert parse_likelihood("0% - REFERENCE ONLY") == 0.0
+    assert parse_likelihood("N/A - Research Tool") is None
+
+
+def sponsor(amount, likelihood, **extra):
+    return dict(name="S", amount=amount, likelihood=likelihood, **extra)
+
+
+def test_summarize_carries_tiers_forward():
+    summary = summarize([
+        sponsor("$1,000 - $3,000", "50%", tier="TIER 1"),
+        sponsor("$2,000", "100%"),
+        sponsor("Various", "20%", tier="TIER 2"),
+        sponsor("$9,000", "0%"),
+    ])
+    assert summary.total.count == 4
+    one, two = summary.tiers["TIER 1"], summary.tiers["TIER 2"]
+    assert (one.count, one.low, one.high, one.expected) == (2, 3000, 5000, 3000)
+    assert one.revenue_range() == "$3,000 - $5,000"
+    # An unpriced ask leaves the range open; a 0% one adds nothing
+    assert (two.count, two.priced, two.open_ended) == (2, 0, True)
+    assert two.revenue_range() == "Not quantified"
+    assert summary.total.revenue_range() == "$3,000 - $5,000+"
+
+
+def test_format_money():
+    assert format_money(1234567.4) == "$1,234,567"
@@ -0,0 +1,44 @@
+import io
+
+from reportlab.lib.pagesizes import letter
+from reportlab.platypus import SimpleDocTemplate
+
+from sponsor_blocks import sponsor_section
+from streaming_doc import StreamingDocTemplate
+
+SPONSORS = [{"num": i, "name": f"Sponsor {i}", "priority": "URGENT" if i % 7 == 0 else "HIGH",
+             "url": f"https://sponsor{i}.example/", "amount": f"${i * 100:,}", "likelihood": "50%",
+             "notes": "Follow up by email " * (i % 4 + 1), "tier": f"TIER {i // 25 + 1}"} for i in range(1, 80)]
+
+
+def build(template, flowables, **kwargs):
+    out = io.BytesIO()
+    template(out, pagesize=letter, invariant=True).build(flowables, **kwargs)
+    return out.getvalue()
+
+
+def test_streamed_output_matches_a_list_build():
+    expected = build(SimpleDocTemplate, list(sponsor_section(SPONSORS)))
+    assert build(StreamingDocTemplate, sponsor_section(SPONSORS)) == expected
+    # Even with refills smaller than a sponsor block
+    assert build(StreamingDocTemplate, sponsor_section(SPONSORS), chunk=5) == expected
+
+
+def test_the_stream_is_pulled_a_chunk_at_a_time():
+    pulled = []
+    ahead = []
+
+    def flowables():
+        for s in SPONSORS:
+            pulled.append(s["num"])
+            yield from sponsor_section([s])
+
+    class Watched(StreamingDocTemplate):
+        def handle_flowable(self, flowables):
+            if flowables is self._pending:
+                ahead.append(len(flowables))
+            super().handle_flowable(flowables)
+
+    build(Watched, flowables(), chunk=20)
+    assert pulled == [s["num"] for s in SPONSORS]
+    assert max(ahead) < 2 * 20
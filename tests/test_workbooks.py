@@ -0,0 +1,68 @@
+import os
+
+import pytest
+from openpyxl import Workbook
+
+import workbooks
+from workbooks import cache_info, clear_cache, read_sheet, sheet_names
+
+
+@pytest.fixture(autouse=True)
+def empty_cache():
+    clear_cache()
+    yield
+    clear_cache()
+
+
+def save(path, rows, title="Ledger", extra=None):
+    wb = Workbook()
+    ws = wb.active
+    ws.title = title
+    for row in rows:
+        ws.append(row)
+    if extra:
+        wb.create_sheet(extra).append(["other"])
+    wb.save(path)
+    return str(path)
+
+
+def test_read_sheet_trims_and_caches(tmp_path):
+    path = save(tmp_path / "book.xlsx", [["Date", "Amount", None], [None, 5, None], [None, None, None]], extra="Notes")
+    # The counters run for the whole process
+    before = cache_info()
+    assert sheet_names(path) == ["Ledger", "Notes"]
+    rows = read_sheet(path)
+    assert rows == (("Date", "Amount"), (None, 5))
+    assert read_sheet(path, "Ledger") == rows
+    assert read_sheet(path) is rows
+    assert read_sheet(path, "Notes") == (("other",),)
+    after = cache_info()
+    assert [after[k] - before[k] for k in ("hits", "misses", "loads")] == [1, 3, 1]
+
+
+def test_ranges_are_cached_separately(tmp_path):
+    path = save(tmp_path / "book.xlsx", [[1, 2, 3], [4, 5, 6]])
+    assert read_sheet(path, min_row=2, max_col=2) == ((4, 5),)
+    assert read_sheet(path) == ((1, 2, 3), (4, 5, 6))
+
+
+def test_a_changed_file_is_read_again(tmp_path):
+    path = save(tmp_path / "book.xlsx", [["before"]])
+    assert read_sheet(path) == (("before",),)
+    save(path, [["after"]])
+    st = os.stat(path)
+    os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+    assert read_sheet(path) == (("after",),)
+    assert cache_info()["open"] == 1
+
+
+def test_cache_stays_under_its_byte_limit(tmp_path, monkeypatch):
+    path = save(tmp_path / "book.xlsx", [["x" * 50]] * 50)
+    first = read_sheet(path, max_row=25)
+    monkeypatch.setattr(workbooks, "MAX_CACHE_BYTES", workbooks._size(first) + 1)
+    second = read_sheet(path, min_row=26)
+    info = cache_info()
+    assert info["sheets"] == 1 and info["bytes"] <= workbooks.MAX_CACHE_BYTES
+    # The older range was evicted to make room
+    assert read_sheet(path, min_row=26) is second
+    assert read_sheet(path, max_row=25) is not first
@@ -0,0 +1,27 @@
+from datetime import datetime, timezone
+
+from pypdf import PdfReader
+
+from generate_working_links_pdf import build_pdf, describe_checks
+from link_checker import check_dates
+
+
+def test_check_dates_fall_back_to_the_run_time():
+    assert check_dates({"checked_at": "2026-02-20T10:00:00+00:00"}) == (
+        datetime(2026, 2, 20, 10, tzinfo=timezone.utc),) * 2
+
+
+def test_describe_checks():
+    feb3 = datetime(2026, 2, 3, 9, tzinfo=timezone.utc)
+    assert describe_checks(feb3, feb3.replace(hour=17)) == ("on February 3, 2026", "February 3, 2026", "February 2026")
+    assert describe_checks(datetime(2026, 1, 30, tzinfo=timezone.utc), feb3) == (
+        "between January 30, 2026 and February 3, 2026", "January 30, 2026 to February 3, 2026",
+        "January 2026 - February 2026")
+
+
+def test_the_pdf_gives_the_oldest_check_too(tmp_path):
+    output = str(tmp_path / "links.pdf")
+    status = {"checked_at": "2026-02-03T09:00:00+00:00", "oldest_check": "2026-02-02T15:00:00+00:00", "links": {}}
+    build_pdf(output, link_status=status)
+    text = " ".join(PdfReader(output).pages[0].extract_text().split())
+    assert "verified between February 2, 2026 and February 3, 2026" in text
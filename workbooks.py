@@ -0,0 +1,127 @@
+"""
+Shared read-only access to the finance workbooks under 3. Financial Docs/
+
+openpyxl parses a workbook's shared strings and styles on every
+load_workbook() call, which for the AETSA workbooks is most of a second
+before a single cell is read. Everything here opens workbooks in read-only,
+values-only streaming mode, reads only the sheets (and row/column ranges)
+asked for, and keeps the result:
+
+- open workbooks are kept in a small LRU (MAX_OPEN) so reading several
+  sheets of one file loads it once;
+- parsed sheets are memoized by (path, mtime, size, sheet, range) in an LRU
+  capped at MAX_CACHE_BYTES, so every report built in one process shares them.
+
+A file that changes on disk gets a new key and is read again.
+
+    from workbooks import read_sheet, sheet_names
+    for name in sheet_names(path):
+        rows = read_sheet(path, name, max_col=6)
+"""
+
+import os
+import sys
+from collections import OrderedDict
+
+# Parsed sheets kept in memory, estimated from the row tuples and cell values
+MAX_CACHE_BYTES = 64 * 1024 * 1024
+# Workbooks held open between calls; each keeps a file handle
+MAX_OPEN = 4
+
+_sheets = OrderedDict()  # (path, stamp, sheet, range) -> (rows, size)
+_sheets_bytes = 0
+_open = OrderedDict()  # (path, stamp) -> openpyxl Workbook
+_stats = {"hits": 0, "misses": 0, "loads": 0}
+
+
+def _stamp(path):
+    st = os.stat(path)
+    return st.st_mtime_ns, st.st_size
+
+
+def _workbook(path, stamp):
+    key = (path, stamp)
+    wb = _open.get(key)
+    if wb is not None:
+        _open.move_to_end(key)
+        return wb
+    from openpyxl import load_workbook
+    for old in [k for k in _open if k[0] == path]:
+        # An earlier version of the same file
+        _open.pop(old).close()
+    wb = load_workbook(path, read_only=True, data_only=True)
+    _stats["loads"] += 1
+    _open[key] = wb
+    while len(_open) > MAX_OPEN:
+        _open.popitem(last=False)[1].close()
+    return wb
+
+
+def _trim(rows):
+    """Drop trailing empty cells from each row and trailing empty rows (row numbers are unchanged)."""
+    trimmed = []
+    for row in rows:
+        end = len(row)
+        while end and row[end - 1] is None:
+            end -= 1
+        trimmed.append(row[:end])
+    while trimmed and not trimmed[-1]:
+        trimmed.pop()
+    return tuple(trimmed)
+
+
+def _size(rows):
+    return sys.getsizeof(rows) + sum(sys.getsizeof(row) + sum(map(sys.getsizeof, row)) for row in rows)
+
+
+def sheet_names(path):
+    """Names of the worksheets in the workbook at ``path``."""
+    path = os.path.abspath(path)
+    return list(_workbook(path, _stamp(path)).sheetnames)
+
+
+def read_sheet(path, sheet=None, min_row=None, max_row=None, min_col=None, max_col=None):
+    """Cell values of one sheet (default: the first) as a tuple of row tuples.
+
+    Rows keep their position - index 0 is ``min_row`` (or row 1) - but
+    trailing empty cells and rows are dropped, so index defensively.
+    Repeat calls for an unchanged file come from the cache; treat the
+    result as read-only.
+    """
+    global _sheets_bytes
+    path = os.path.abspath(path)
+    stamp = _stamp(path)
+    bounds = (min_row, max_row, min_col, max_col)
+    key = (path, stamp, sheet, bounds)
+    cached = _sheets.get(key)
+    if cached is not None:
+        _sheets.move_to_end(key)
+        _stats["hits"] += 1
+        return cached[0]
+
+    _stats["misses"] += 1
+    wb = _workbook(path, stamp)
+    ws = wb[sheet] if sheet is not None else wb.worksheets[0]
+    rows = _trim(ws.iter_rows(min_row=min_row, max_row=max_row, min_col=min_col, max_col=max_col, values_only=True))
+    size = _size(rows)
+    if size <= MAX_CACHE_BYTES:
+        _sheets[key] = (rows, size)
+        _sheets_bytes += size
+        while _sheets_bytes > MAX_CACHE_BYTES:
+            _, (_, evicted) = _sheets.popitem(last=False)
+            _sheets_bytes -= evicted
+    return rows
+
+
+def cache_info():
+    """Counters for the sheet cache: hits, misses, workbook loads, sheets and bytes held."""
+    return dict(_stats, sheets=len(_sheets), bytes=_sheets_bytes, open=len(_open))
+
+
+def clear_cache():
+    """Forget every parsed sheet and close every open workbook."""
+    global _sheets_bytes
+    _sheets.clear()
+    _sheets_bytes = 0
+    while _open:
+        _open.popitem()[1].close()